@@ -1,93 +1,91 @@
-[-]>[-]++><<[-]>[-<+>][-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>>[-]<<
-<<<<<<<<<<<<<[->>>>>>>>>>>>>>+>+<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<
-+>>>>>>>>>>>>>>>][-]><[-<->][-]<[[-]>+<]>[-<+>]<[[-][-]++><<<[-]>>[-<<+>>][-]><<
-[-]>[-<+>]>[-]<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>+>+<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>[
--<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>]>[-]<<[->+>+<<]>>[-<<+>>][-]+++++++++++++++++++
+>++><<[-]>[-<+>]>>>>>>>>>>>>>>[-]<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>+>+<<<<<<<<<<<<<
+<<]>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>]><[-<->][-]<[[-]>+<]>[-<+>]<
+[[-]++><<<[-]>>[-<<+>>]><<[-]>[-<+>]>[-]<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>+>+<<<<<<
+<<<<<<<<<]>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>]>[-]<<[->+>+<<]>>[-<<
++>>]++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+++++++++++++++++++++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[
+-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]+++
 ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<
-]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]+++++++++++++++++++++++
-+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++><<
-[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[
-<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<+<[-<->>>
-+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]
->>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<<[-]<[-]>>[-<<+>>
-]<[-]++++++++++++++++++++++++++++++++++++++++++++++++><[-<+>]<.[-]<<]>[-><]<>[-]
-<<[->+>+<<]>>[-<<+>>][-]++++++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]
-<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<<]>>>>[-<<<
-<+>>>>][-]++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-++++++++++++++++++++++++++++++><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>
++++++++++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>
+][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]
+>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>[-
+]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]
+<]<<[-]<[-]>>[-<<+>>]<++++++++++++++++++++++++++++++++++++++++++++++++><[-<+>]<.
+[-]<<]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>]++++++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[-
+>]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+
+<<<<]>>>>[-<<<<+>>>>]+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
++++++++++++++++++++++++++++++++++++++++++><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<
+]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]
+[-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-
+]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]
+<]<[-]++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]
+[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>
+[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>[-]
++>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<
+]<<[-]<[-]>>[-<<+>>]<++++++++++++++++++++++++++++++++++++++++++++++++><[-<+>]<.[
+-]<<]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>]++++++++++><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>
++>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[
+-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>]
+[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>
+[-<+>]<]<[-]++++++++++++++++++++++++++++++++++++++++++++++++><[-<+>]<.[-]<[-]+++
++++++++++++++++++++++++++++++><.[-]+++++++++++++++++++++++++++++++++++++++++++++
+++++++++++++++++><.[-]++++++++++++++++++++++++++++++++><.[-]>>[-]<<<<<<<<<<<<<<<
+<[->>>>>>>>>>>>>>>+>+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<+>>>>>>>
+>>>>>>>>>]<<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>]+><[-<->][-]<[[-]>+<]>[-<+>]<[[-]
+>[-]<<[->+>+<<]>>[-<<+>>]>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<+>>>>>]<<[->>+>+<<<
+]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<-
+>>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<
+<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[
+-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-]+<[[-]>->>[-]<<<<<<[->>>>>+>+<<<<<<]>>>>>>[-<<<<
+<<+>>>>>>]+><[-<+>]<<<<<<[-]>>>>>[-<<<<<+>>>>>]<<]>[->>[-]<<<<[->>>+>+<<<<]>>>>[
+-<<<<+>>>>]>[-]<<<<<<<[->>>>>>+>+<<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<[->>>+>+<<<<
+]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[-
+>]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<
+<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-
+<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<<<<<[-]>>>
+[-<<<+>>>]>[-]<<<<<<[->>>>>+>+<<<<<<]>>>>>>[-<<<<<<+>>>>>>]>[-]<<<<<<[->>>>>+>+<
+<<<<<]>>>>>>[-<<<<<<+>>>>>>]<[-<<<<<<<<+>>>>>>>>]<[-<<<<<<<<+>>>>>>>>]<<<<<<<[<<
+<[->>>>+<<<<]>[-<+>]<+>>[-<+>]>-[-<+>]<]<<<[-]>>[-<<+>>]<[->+<]>[->>>[-<<<<+>>>>
+]<<<[->+<]>]>>>>>>>>>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<+>>>>>]+><[-<+>]<<<<<[-]
+>>>>[-<<<<+>>>>]<]<>[-]<<[->+>+<<]>>[-<<+>>]+><[-<->][-]<[[-]>+<]>[-<+>]<]<[-]>>
+<<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>[-
+]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<[[-]>[-]<<[->+>+<<]
+>>[-<<+>>]<[-<<<<<+>>>>>]<<<<<[-<<<[->>>>+<<<<]>>[-<+>]<+>>[-<+>]<]<<<[->+>>+<<<
+]>[-<+>]>[->>>[-<<<<+>>>>]<<[->+<]<[->+<]>]>>><<[->>>>>+<<<<<]>>>>>>>[-]<<[->+>+
+<<]>>[-<<+>>]+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
++++++++++++++++++++++++++++++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<
+[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<
++>>>>]++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+++++++++++++++++++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>>[-
+<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+
+<[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+>>>
 >>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-
-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]
-<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-][-]++
-++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+
->[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[
--<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>[-]+>[-]+>[
--]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<<[-]<[
--]>>[-<<+>>]<[-]++++++++++++++++++++++++++++++++++++++++++++++++><[-<+>]<.[-]<<]
->[-><]<>[-]<<[->+>+<<]>>[-<<+>>][-]++++++++++><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>
-+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]
-<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-
-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-
-<+>]<]<[-][-]++++++++++++++++++++++++++++++++++++++++++++++++><[-<+>]<.[-]<[-][-
-]++++++++++++++++++++++++++++++++><.[-][-]++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++><.[-][-]++++++++++++++++++++++++++++++++><.[-][-]>>[-]<<
-<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>+>+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>[-<<<<<<<<<<<
-<<<<<+>>>>>>>>>>>>>>>>]<<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>][-]+><[-<->][-]<[[-]
->+<]>[-<+>]<[[-]>[-]<<[->+>+<<]>>[-<<+>>]>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<+>>
->>>]<<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[
->]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[
--<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>
-]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-]+<[[-]>->>[-]<<<<<<[->>>>>+>+<<<
-<<<]>>>>>>[-<<<<<<+>>>>>>][-]+><[-<+>]<<<<<<[-]>>>>>[-<<<<<+>>>>>]<<]>[->>[-]<<<
-<[->>>+>+<<<<]>>>>[-<<<<+>>>>]>[-]<<<<<<<[->>>>>>+>+<<<<<<<]>>>>>>>[-<<<<<<<+>>>
->>>>]<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]
-+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<+<
-[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>[-]+>[-]+>[-]<[
-<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<<[-]<[-]>>
-[-<<+>>]<<<<<[-]>>>[-<<<+>>>]>[-]<<<<<<[->>>>>+>+<<<<<<]>>>>>>[-<<<<<<+>>>>>>]>[
--]<<<<<<[->>>>>+>+<<<<<<]>>>>>>[-<<<<<<+>>>>>>]<[-<<<<<<<<+>>>>>>>>]<[-<<<<<<<<+
->>>>>>>>]<<<<<<<[<<<[->>>>+<<<<]>[-<+>]<+>>[-<+>]>-[-<+>]<]<<<[-]>>[-<<+>>]<[->+
-<]>[->>>[-<<<<+>>>>]<<<[->+<]>]>>>>>>>>>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<+>>>>
->][-]+><[-<+>]<<<<<[-]>>>>[-<<<<+>>>>]<]<>[-]<<[->+>+<<]>>[-<<+>>][-]+><[-<->][-
-]<[[-]>+<]>[-<+>]<]<[-][-]>[-]><<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>]>[-]<<<<[->>
->+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[
--]>[[-]<+>]<[[-]>[-]<<[->+>+<<]>>[-<<+>>]<[-<<<<<+>>>>>]<<<<<[-<<<[->>>>+<<<<]>>
-[-<+>]<+>>[-<+>]<]<<<[->+>>+<<<]>[-<+>]>[->>>[-<<<<+>>>>]<<[->+<]<[->+<]>]>>><<[
-->>>>>+<<<<<]>>>>>>>[-]<<[->+>+<<]>>[-<<+>>][-]+++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++>[-]>[-]+>[-]
-+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]
->->>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]+++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++><<[->>>+>+<<<<]>
->>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]
-<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+
->>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<-
->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<[-]+++++++++
-+++++++++++++++++++++++++++++++++++++++><[-<+>]<.[-]<<]>[-><]<>[-]<<[->+>+<<]>>[
--<<+>>][-]++++++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[
-[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]++++
-++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-++++++++++++++++><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-
-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[
--<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[-
->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-][-]++++++++++><<[->
->>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<
-<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+
-<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>
-[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<[
--]++++++++++++++++++++++++++++++++++++++++++++++++><[-<+>]<.[-]<<]>[-><]<>[-]<<[
-->+>+<<]>>[-<<+>>][-]++++++++++><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+
->>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>
--<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-
-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-][-]+
-+++++++++++++++++++++++++++++++++++++++++++++++><[-<+>]<.[-]<[-]>[-]<<[->+>+<<]>
->[-<<+>>][-]+><[-<+>]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<[-<->][-]<[[-]>+<]>[-
-<+>]+<[[-]>->[-]++++++++++++++++++++++++++++++++><.[-][-]+++++++++++++++++++++++
-+++++++++++++++++++><.[-][-]++++++++++++++++++++++++++++++++><.[-]<<]>[->[-]++++
-++++++><.[-]<]<>[-]<<[->+>+<<]>>[-<<+>>][-]+><[-<+>]<<[-]>[-<+>]>[-]<<[->+>+<<]>
->[-<<+>>]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<
-<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<]<[-]>[-]<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>+>+<<<<
-<<<<<<<<<<<]>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>][-]+><[-<+>]<<<<<<<
-<<<<<<<<[-]>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<+>>>>>>>>>>>>>>]>[-]<<<<<<<<<<<<<<<[->>
->>>>>>>>>>>>+>+<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>]
-[-]><[-<->][-]<[[-]>+<]>[-<+>]<]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]
-<[-]<[-]
+<]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<++++++++++++++++++++++++++++++++++++++++++++++++>
+<[-<+>]<.[-]<<]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>]++++++++++>[-]>[-]+>[-]+>[-]<[<<<
+<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<
+<[->>>+>+<<<<]>>>>[-<<<<+>>>>]++++++++++++++++++++++++++++++++++++++++++++++++++
+++++++++++++++++++++++++++++++++++++++++++++++++++><<[->>+>+<<<]>>>[-<<<+>>>]<<[
+->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]
+>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>
+>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-
+<]>[-<+>]<]<[-]++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>>[-<
+<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<
+[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+>>>>
+>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<
+]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<++++++++++++++++++++++++++++++++++++++++++++++++><
+[-<+>]<.[-]<<]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>]++++++++++><<[->>+>+<<<]>>>[-<<<+>
+>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<
++<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<
+<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<
+[[-]>-<]>[-<+>]<]<[-]++++++++++++++++++++++++++++++++++++++++++++++++><[-<+>]<.[
+-]<[-]>[-]<<[->+>+<<]>>[-<<+>>]+><[-<+>]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<[-
+<->][-]<[[-]>+<]>[-<+>]+<[[-]>->++++++++++++++++++++++++++++++++><.[-]++++++++++
+++++++++++++++++++++++++++++++++><.[-]++++++++++++++++++++++++++++++++><.[-]<<]>
+[->++++++++++><.[-]<]<>[-]<<[->+>+<<]>>[-<<+>>]+><[-<+>]<<[-]>[-<+>]>[-]<<[->+>+
+<<]>>[-<<+>>]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[
+->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<]<[-]>[-]<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>+>+
+<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>]+><[-<+>]<<<<<<
+<<<<<<<<<[-]>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<+>>>>>>>>>>>>>>]>[-]<<<<<<<<<<<<<<<[->
+>>>>>>>>>>>>>+>+<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>
+]><[-<->][-]<[[-]>+<]>[-<+>]<]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[
+-]<[-]
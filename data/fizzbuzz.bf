@@ -1,57 +1,56 @@
-[-]>[-]+><<[-]>[-<+>][-]>[-]>[-]>>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>
-<[-<->][-]<[[-]>+<]>[-<+>]<[[-]>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<+>>>>>][-]+++
-><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>
->>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+
->]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[
--]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-][-]><[-<->][-]+<[[-]>-<]>[-<+>]<<<<
-[-]>>>[-<<<+>>>]>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<+>>>>>][-]+++++><<[->>+>+<<<
-]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<-
->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<
-<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[
--]<+>][-]+<[[-]>-<]>[-<+>]<]<[-][-]><[-<->][-]+<[[-]>-<]>[-<+>]<<<[-]>>[-<<+>>]>
-[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]
-<<<[[-]>>+<<]>[[-]>>+<<]>>[-<+>]<[[-]<<+>>]<[-]+<[[-]>-<]>[-<+>]<<[-]>[-<+>]>[-]
-<<[->+>+<<]>>[-<<+>>]+<[[-]>->>[-]<<<<<<<[->>>>>>+>+<<<<<<<]>>>>>>>[-<<<<<<<+>>>
->>>>]>[-]<<[->+>+<<]>>[-<<+>>][-]+++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++++++++++++++++++++++++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]
->>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->
->>+>+<<<<]>>>>[-<<<<+>>>>][-]+++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++++++++++++++++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>>>>
-]<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[
--]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>
-+<<<<<]>>>>>[-<<<<<+>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+
-[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<[-]+++++++++++++++++++++++
-+++++++++++++++++++++++++><[-<+>]<.[-]<<]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>][-]++++
-++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[
--]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]++++++++++++++++++
+>+><<[-]>[-<+>]>>>>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<+>>>>>]><[-<->][-]<[[-]>+<
+]>[-<+>]<[[-]>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<+>>>>>]+++><<[->>+>+<<<]>>>[-<<
+<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-
+]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>
+[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-
+]+<[[-]>-<]>[-<+>]<]<[-]><[-<->][-]+<[[-]>-<]>[-<+>]<<<<[-]>>>[-<<<+>>>]>[-]<<<<
+<[->>>>+>+<<<<<]>>>>>[-<<<<<+>>>>>]+++++><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]
+>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][
+-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]
++>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<
+]<[-]><[-<->][-]+<[[-]>-<]>[-<+>]<<<[-]>>[-<<+>>]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<
++>>>>]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]<<<[[-]>>+<<]>[[-]>>+<<]>>[-<+
+>]<[[-]<<+>>]<[-]+<[[-]>-<]>[-<+>]<<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>]+<[[-]>->
+>[-]<<<<<<<[->>>>>>+>+<<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]>[-]<<[->+>+<<]>>[-<<+>>]
 ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-++><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>
-]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-
-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]
-<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-][-]++++++++++><<[->>>+>+<<<<]>>>>
-[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<
-<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]
-<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>
->]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<[-]++++++++++++
-++++++++++++++++++++++++++++++++++++><[-<+>]<.[-]<<]>[-><]<>[-]<<[->+>+<<]>>[-<<
-+>>][-]++++++++++><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[
--]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<
-[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[
-->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-][-]+++++++++++++++
-+++++++++++++++++++++++++++++++++><[-<+>]<.[-]<[-]<<]>[-><]<>[-]<<<<[->>>+>+<<<<
-]>>>>[-<<<<+>>>>]+<[[-]>->[-]+++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++++++++++++++++++++++++++><.[-][-]++++++++++++++++++++
+++++++++++++++++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[
+[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]+++++++
 ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++><.[-][-]++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-++++++++++++++++++++++++++++++++++++++++++++++++++++++++><.[-][-]+++++++++++++++
++++++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]
+>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<
++>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>[-]+>[
+-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<<
+[-]<[-]>>[-<<+>>]<++++++++++++++++++++++++++++++++++++++++++++++++><[-<+>]<.[-]<
+<]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>]++++++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<
+<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<<
+]>>>>[-<<<<+>>>>]+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
++++++++++++++++++++++++++++++++++++++><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>
+[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+
+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[
+-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[
+-]++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>
+[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+
+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>[-]+>[-
+]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<<[
+-]<[-]>>[-<<+>>]<++++++++++++++++++++++++++++++++++++++++++++++++><[-<+>]<.[-]<<
+]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>]++++++++++><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<
+<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+
+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>
+[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+
+>]<]<[-]++++++++++++++++++++++++++++++++++++++++++++++++><[-<+>]<.[-]<[-]<<]>[->
+<]<>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]+<[[-]>->+++++++++++++++++++++++++++++++
++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++><.[-]+++
 ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++><.[-]<<]>[-><]<>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]+<[[-]
->->[-]++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-++++++++++++++++++++++++><.[-][-]+++++++++++++++++++++++++++++++++++++++++++++++
-++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++><.[-][-]+
+++++++++++++++++++++++><.[-]++++++++++++++++++++++++++++++++++++++++++++++++++++
+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++><.[-]++++
 ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++++++++++++++++><.[-][-]++++++++++++++++++++++++++++++
+++++++++++++++++++++++++++++++++++++++><.[-]<<]>[-><]<>[-]<<<[->>+>+<<<]>>>[-<<<
++>>>]+<[[-]>->++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+++++++++++++++++++++++++++++++++><.[-]++++++++++++++++++++++++++++++++++++++++++
++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++><.[-
+]+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
++++++++++++++++++++++++++++++++++++++++++++><.[-]+++++++++++++++++++++++++++++++
 ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-++++++++++++><.[-]<<]>[-><]<[-]++++++++++><.[-]>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<
-<<<+>>>>>][-]+><[-<+>]<<<<<[-]>>>>[-<<<<+>>>>]>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<
-<<+>>>>>][-]><[-<->][-]<[[-]>+<]>[-<+>]<]<[-]<[-]<[-]<[-][-]++++++++++><.[-]
++++++++++++><.[-]<<]>[-><]<++++++++++><.[-]>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<+
+>>>>>]+><[-<+>]<<<<<[-]>>>>[-<<<<+>>>>]>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<+>>>>
+>]><[-<->][-]<[[-]>+<]>[-<+>]<]<[-]<[-]<[-]<[-]++++++++++><.[-]
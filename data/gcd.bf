@@ -1,111 +1,96 @@
-[-]>[-]>[-]>[-]+><[[-]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>][-]++++++++++>[-]>[-]<<[-<[
-->>+>+<<<]>>>[-<<<+>>>]<<]<[-]>>[-<<+>>]<>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]<[-<+>]<
-<<[-]>>[-<<+>>],>[-]++++++++++++++++++++++++++++++++++++++++++++++++><[-<->]<<[-
-]>[-<+>][-]>>[-]<<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<
--<->>>>]<[-]<<+[-]<+[[-]>+<]>[-<+>][-]+<[[-]>-<]>[-<+>]>[-]<<<[->>+>+<<<]>>>[-<<
-<+>>>][-]++++++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[
--]<+>][-]+>[-]+<<<[[-]>>-<<]>[[-]>>-<<]>>[-<+>]<<<+>>[[-]<<->>]<<]<[-]<<[-]>[-<+
->][-]>[-]>[-]>[-]+><[[-]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>][-]++++++++++>[-]>[-]<<[-
-<[->>+>+<<<]>>>[-<<<+>>>]<<]<[-]>>[-<<+>>]<>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]<[-<+>
-]<<<[-]>>[-<<+>>],>[-]++++++++++++++++++++++++++++++++++++++++++++++++><[-<->]<<
-[-]>[-<+>][-]>>[-]<<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<
-<<-<->>>>]<[-]<<+[-]<+[[-]>+<]>[-<+>][-]+<[[-]>-<]>[-<+>]>[-]<<<[->>+>+<<<]>>>[-
-<<<+>>>][-]++++++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>
-[[-]<+>][-]+>[-]+<<<[[-]>>-<<]>[[-]>>-<<]>>[-<+>]<<<+>>[[-]<<->>]<<]<[-]<<[-]>[-
-<+>][-]+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++><
-.[-][-]+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++><.[-]
-[-]++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++><.[-][-]
-++++++++++++++++++++++++++++++++++++++++><.[-]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]>[-
-]<<[->+>+<<]>>[-<<+>>][-]+++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++++++++++++++++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<
-<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<
-<]>>>>[-<<<<+>>>>][-]+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++++++++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>
->+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[
--]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>
->>>>[-<<<<<+>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]
-<+>][-]+<[[-]>-<]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<[-]+++++++++++++++++++++++++++++++
-+++++++++++++++++><[-<+>]<.[-]<<]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>][-]++++++++++>[
--]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[
--<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]++++++++++++++++++++++++++
-++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++><<[->
->+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]
-<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[-
->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<
-+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-][-]++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>
->>>]<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>
-]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>
-+>>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<
-+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<[-]++++++++++++++++++++
-++++++++++++++++++++++++++++><[-<+>]<.[-]<<]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>][-]+
-+++++++++><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<
-[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>
-+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-
-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-][-]+++++++++++++++++++++++
-+++++++++++++++++++++++++><[-<+>]<.[-]<[-][-]+++++++++++++++++++++++++++++++++++
-+++++++++><.[-][-]++++++++++++++++++++++++++++++++><.[-]>[-]<<[->+>+<<]>>[-<<+>>
-]>[-]<<[->+>+<<]>>[-<<+>>][-]+++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++++++++++++++++++++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[
-->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>
-+<<<<]>>>>[-<<<<+>>>>][-]+++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++++++++++++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<
-[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<
-+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<
-<<]>>>>>[-<<<<<+>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>
-[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<[-]+++++++++++++++++++++++++++
-+++++++++++++++++++++><[-<+>]<.[-]<<]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>][-]++++++++
-++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-
-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]++++++++++++++++++++++
-++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++><
-<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>
-[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]
-<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]
-<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-][-]++++++++++><<[->>>+>+<<<<]>>>>[-<<
-<<+>>>>]<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<-
->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[
-->>>+>>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[
--]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<[-]++++++++++++++++
-++++++++++++++++++++++++++++++++><[-<+>]<.[-]<<]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>]
-[-]++++++++++><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>
-[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<-
->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<
-<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-][-]+++++++++++++++++++
-+++++++++++++++++++++++++++++><[-<+>]<.[-]<[-][-]+++++++++++++++++++++++++++++++
-++++++++++><.[-][-]++++++++++++++++++++++++++++++++><.[-][-]++++++++++++++++++++
-+++++++++++++++++++++++++++++++++++++++++><.[-][-]++++++++++++++++++++++++++++++
-++><.[-][-]>>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]><[-<->][-]<[[-]>+<]>[-<+>]<
-[[-]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<+>>>>>]<<
-[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[
-->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<
-<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<
-<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-]<<<[-]>>[-<<+>>]>[-]<<<[->>+>+<<<]>>>[
--<<<+>>>]<<[-]>[-<+>]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[-]>>[-<<+>>]>[-]<<
-[->+>+<<]>>[-<<+>>]<<<<[-]>>>[-<<<+>>>]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>
-<[-<->][-]<[[-]>+<]>[-<+>]<]<[-]>[-]<<[->+>+<<]>>[-<<+>>]>[-]<<[->+>+<<]>>[-<<+>
->][-]+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+
-[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-
-]+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>>[-<<<<+
->>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]
->-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+>>>>>][-
+>>>+><[[-]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]++++++++++>[-]>[-]<<[-<[->>+>+<<<]>>>[-
+<<<+>>>]<<]<[-]>>[-<<+>>]<>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]<[-<+>]<<<[-]>>[-<<+>>]
+,>++++++++++++++++++++++++++++++++++++++++++++++++><[-<->]<<[-]>[-<+>]>>[-]<<<[-
+>>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+[-]<+[
+[-]>+<]>[-<+>][-]+<[[-]>-<]>[-<+>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]++++++++++>[-]>
+[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+>[-]+<<<[[-]>>
+-<<]>[[-]>>-<<]>>[-<+>]<<<+>>[[-]<<->>]<<]<[-]<<[-]>[-<+>]>>>+><[[-]>[-]<<<[->>+
+>+<<<]>>>[-<<<+>>>]++++++++++>[-]>[-]<<[-<[->>+>+<<<]>>>[-<<<+>>>]<<]<[-]>>[-<<+
+>>]<>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]<[-<+>]<<<[-]>>[-<<+>>],>++++++++++++++++++++
+++++++++++++++++++++++++++++><[-<->]<<[-]>[-<+>]>>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]
+[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+[-]<+[[-]>+<]>[-<+>][-]+<[[-
+]>-<]>[-<+>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]++++++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]
+>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+>[-]+<<<[[-]>>-<<]>[[-]>>-<<]>>[-<+>
+]<<<+>>[[-]<<->>]<<]<[-]<<[-]>[-<+>]++>+++[<+++++++++++++++++++++++>-]<.[-]+>+++
+[<++++++++++++++++++++++>-]<.[-]>++++[<+++++++++++++++++>-]<.[-]+>+++[<+++++++++
+++++>-]<.[-]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]>[-]<<[->+>+<<]>>[-<<+>>]>++++[<+++++
+++++++++++++++++++++>-][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]
+>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]>++++
+[<+++++++++++++++++++++++++>-]<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>
+>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][
+-]+<[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+
+>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-
+]>-<]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<>+++[<++++++++++++++++>-]<[-<+>]<.[-]<<]>[-><]
+<>[-]<<[->+>+<<]>>[-<<+>>]++++++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>
+>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<<]>>>>[-<
+<<<+>>>>]>++++[<+++++++++++++++++++++++++>-]<<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<
+<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+
+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>
+[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+
+>]<]<[-]++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>>[-<<<<+>>>
+>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<
+]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>[
+-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>
+]<]<<[-]<[-]>>[-<<+>>]<>+++[<++++++++++++++++>-]<[-<+>]<.[-]<<]>[-><]<>[-]<<[->+
+>+<<]>>[-<<+>>]++++++++++><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-
 ]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-
-<+>]<]<<[-]<[-]>>[-<<+>>]<[-]++++++++++++++++++++++++++++++++++++++++++++++++><[
--<+>]<.[-]<<]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>][-]++++++++++>[-]>[-]+>[-]+>[-]<[<<
-<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<
-<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]++++++++++++++++++++++++++++++++++++++++++++++
-++++++++++++++++++++++++++++++++++++++++++++++++++++++><<[->>+>+<<<]>>>[-<<<+>>>
-]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<
-+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<
-<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[
--]>-<]>[-<+>]<]<[-][-]++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]
->>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+
->][-]+<[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<
-<<+>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<
-[[-]>-<]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<[-]++++++++++++++++++++++++++++++++++++++++
-++++++++><[-<+>]<.[-]<<]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>][-]++++++++++><<[->>+>+<
-<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-
-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>
+<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<
+<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-]>+++[<++++
+++++++++++++>-]<[-<+>]<.[-]<[-]++>+++[<++++++++++++++>-]<.[-]+++++++++++++++++++
++++++++++++++><.[-]>[-]<<[->+>+<<]>>[-<<+>>]>[-]<<[->+>+<<]>>[-<<+>>]>++++[<++++
++++++++++++++++++++++>-][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-
+]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]>+++
++[<+++++++++++++++++++++++++>-]<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>
+>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]
+[-]+<[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<
++>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[
+-]>-<]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<>+++[<++++++++++++++++>-]<[-<+>]<.[-]<<]>[-><
+]<>[-]<<[->+>+<<]>>[-<<+>>]++++++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>
+>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<<]>>>>[-
+<<<<+>>>>]>++++[<+++++++++++++++++++++++++>-]<<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+
+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<
++>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]
+>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<
++>]<]<[-]++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>>[-<<<<+>>
+>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-
+<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>
+[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+
+>]<]<<[-]<[-]>>[-<<+>>]<>+++[<++++++++++++++++>-]<[-<+>]<.[-]<<]>[-><]<>[-]<<[->
++>+<<]>>[-<<+>>]++++++++++><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][
+-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[
+-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<
+<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-]>+++[<+++
++++++++++++++>-]<[-<+>]<.[-]<[-]++>+++[<+++++++++++++>-]<.[-]+++++++++++++++++++
++++++++++++++><.[-]+>+++[<++++++++++++++++++++>-]<.[-]++++++++++++++++++++++++++
+++++++><.[-]>>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]><[-<->][-]<[[-]>+<]>[-<+>]<[[
+-]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<+>>>>>]<<[-
+>>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->
+]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[
+->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+
+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-]<<<[-]>>[-<<+>>]>[-]<<<[->>+>+<<<]>>>[-<
+<<+>>>]<<[-]>[-<+>]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[-]>>[-<<+>>]>[-]<<[-
+>+>+<<]>>[-<<+>>]<<<<[-]>>>[-<<<+>>>]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]><[-<-
+>][-]<[[-]>+<]>[-<+>]<]<[-]>[-]<<[->+>+<<]>>[-<<+>>]>[-]<<[->+>+<<]>>[-<<+>>]>++
+++[<+++++++++++++++++++++++++>-][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-
+]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>
+>>>]>++++[<+++++++++++++++++++++++++>-]<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>
 +<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>
-[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-][-]+++++++++++++++++++++++++++++++++++++++++++
-+++++><[-<+>]<.[-]<[-][-]++++++++++><.[-]
+[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>
+>[-<<<<<+>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>
+][-]+<[[-]>-<]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<>+++[<++++++++++++++++>-]<[-<+>]<.[-]
+<<]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>]++++++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<
+<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<
+<]>>>>[-<<<<+>>>>]>++++[<+++++++++++++++++++++++++>-]<<[->>+>+<<<]>>>[-<<<+>>>]<
+<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[
+-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+
+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]
+>-<]>[-<+>]<]<[-]++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>>[
+-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]
++<[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+>>
+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>
+-<]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<>+++[<++++++++++++++++>-]<[-<+>]<.[-]<<]>[-><]<>
+[-]<<[->+>+<<]>>[-<<+>>]++++++++++><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<
+<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[
+-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+
+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-]>
++++[<++++++++++++++++>-]<[-<+>]<.[-]<[-]++++++++++><.[-]
@@ -1,11 +1,11 @@
-[-]>[-]><<[-]>[-<+>][-]>>[-]<<<[->>+>+<<<]>>>[-<<<+>>>][-]+++++>[-]>[-]+>[-]+>[-
-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<[[-][-]><<[-]>[-<+>]>[-]<<[->
-+>+<<]>>[-<<+>>][-]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[
--]>[[-]<+>]<[[-][-]+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-++++>>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]+++++>[-]>[-]<<[-<[->>+>+<<<]>>>[-<
-<<+>>>]<<]<[-]>>[-<<+>>]<<[-<+>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]<[-<+>]<.[-][-]++
-++++++++++++++++++++++++++++++><.[-]>[-]<<[->+>+<<]>>[-<<+>>][-]+><[-<+>]<<[-]>[
--<+>]>[-]<<[->+>+<<]>>[-<<+>>][-]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->
->>>]<[-]<<+<+[-]>[[-]<+>]<][-]++++++++++><.[-]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>][-]
-+><[-<+>]<<<[-]>>[-<<+>>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>][-]+++++>[-]>[-]+>[-]+>[
--]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<]<[-]
+>><<[-]>[-<+>]>>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>
+>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<[[-]><<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>
+]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<[[-]++
++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++>>[-]<<<<[->>>+>+
+<<<<]>>>>[-<<<<+>>>>]+++++>[-]>[-]<<[-<[->>+>+<<<]>>>[-<<<+>>>]<<]<[-]>>[-<<+>>]
+<<[-<+>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]<[-<+>]<.[-]+++++++++++++++++++++++++++++
++++><.[-]>[-]<<[->+>+<<]>>[-<<+>>]+><[-<+>]<<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>]
++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<]++++++
+++++><.[-]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]+><[-<+>]<<<[-]>>[-<<+>>]>[-]<<<[->>+>+
+<<<]>>>[-<<<+>>>]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]
+>[[-]<+>]<]<[-]
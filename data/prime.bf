@@ -1,98 +1,95 @@
-[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]++>[-]><[-<<<+>>>]<[-<<<+>>>]
-<<[<<<[->>>>+<<<<]>[-<+>]<+>>[-<+>]>-[-<+>]<]<<<[-]>>[-<<+>>]<[->+<]>[->>>[-<<<<
-+>>>>]<<<[->+<]>]>>>[-]+++>[-]+><[-<<<+>>>]<[-<<<+>>>]<<[<<<[->>>>+<<<<]>[-<+>]<
-+>>[-<+>]>-[-<+>]<]<<<[-]>>[-<<+>>]<[->+<]>[->>>[-<<<<+>>>>]<<<[->+<]>]>>>[-]+++
-++>[-]++><[-<<<+>>>]<[-<<<+>>>]<<[<<<[->>>>+<<<<]>[-<+>]<+>>[-<+>]>-[-<+>]<]<<<[
--]>>[-<<+>>]<[->+<]>[->>>[-<<<<+>>>>]<<<[->+<]>]>>>[-]+++++++>[-]+++><[-<<<+>>>]
-<[-<<<+>>>]<<[<<<[->>>>+<<<<]>[-<+>]<+>>[-<+>]>-[-<+>]<]<<<[-]>>[-<<+>>]<[->+<]>
-[->>>[-<<<<+>>>>]<<<[->+<]>]>>>[-]+++++++++++>[-]++++><[-<<<+>>>]<[-<<<+>>>]<<[<
-<<[->>>>+<<<<]>[-<+>]<+>>[-<+>]>-[-<+>]<]<<<[-]>>[-<<+>>]<[->+<]>[->>>[-<<<<+>>>
->]<<<[->+<]>]>>>[-]+++++++++++++>[-]+++++><[-<<<+>>>]<[-<<<+>>>]<<[<<<[->>>>+<<<
-<]>[-<+>]<+>>[-<+>]>-[-<+>]<]<<<[-]>>[-<<+>>]<[->+<]>[->>>[-<<<<+>>>>]<<<[->+<]>
-]>>>[-]+++++++++++++++++>[-]++++++><[-<<<+>>>]<[-<<<+>>>]<<[<<<[->>>>+<<<<]>[-<+
->]<+>>[-<+>]>-[-<+>]<]<<<[-]>>[-<<+>>]<[->+<]>[->>>[-<<<<+>>>>]<<<[->+<]>]>>>[-]
-+++++++++++++++++++>[-]+++++++><[-<<<+>>>]<[-<<<+>>>]<<[<<<[->>>>+<<<<]>[-<+>]<+
->>[-<+>]>-[-<+>]<]<<<[-]>>[-<<+>>]<[->+<]>[->>>[-<<<<+>>>>]<<<[->+<]>]>>>[-]>[-]
-++><<[-]>[-<+>][-]>>[-]<<<[->>+>+<<<]>>>[-<<<+>>>][-]><[-<->][-]<[[-]>+<]>[-<+>]
-<[[-][-]+><<[-]>[-<+>][-]>[-]><<[-]>[-<+>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]>[-]<<<
-[->>+>+<<<]>>>[-<<<+>>>][-]++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<
-[-]<<+<+[-]>[[-]<+>][-]+>[-]+<<<[[-]>>-<<]>[[-]>>-<<]>>[-<+>]<<<+>>[[-]<<->>]<>[
--]<<<[->>+>+<<<]>>>[-<<<+>>>]<[-<<<<<<+>>>>>>]<<<<<<[-<<<[->>>>+<<<<]>>[-<+>]<+>
->[-<+>]<]<<<[->+>>+<<<]>[-<+>]>[->>>[-<<<<+>>>>]<<[->+<]<[->+<]>]>>><<[->>>>>>+<
-<<<<<]>>>>>>>>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<[-<<<<<<<+>>>>>>>]<<<<<<<[-<<
-<[->>>>+<<<<]>>[-<+>]<+>>[-<+>]<]<<<[->+>>+<<<]>[-<+>]>[->>>[-<<<<+>>>>]<<[->+<]
-<[->+<]>]>>><<[->>>>>>>+<<<<<<<]>>>>>>>>[-]>[-]<<[-<[->>+>+<<<]>>>[-<<<+>>>]<<]<
-[-]>>[-<<+>>]<>[-]<<<<<<[->>>>>+>+<<<<<<]>>>>>>[-<<<<<<+>>>>>>][-]>[-]+>[-]+>[-]
-<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+[-]<+[[-]>+<]>[-<+>][-]+<[[-]>-<]>[-<+>][-]+>
-[-]+<<<[[-]>>-<<]>[[-]>>-<<]>>[-<+>]<<<+>>[[-]<<->>]<<[[-]>[-]<<<<[->>>+>+<<<<]>
->>>[-<<<<+>>>>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]<[-<<<<<<+>>>>>>]<<<<<<[-<<<[->>>>
-+<<<<]>>[-<+>]<+>>[-<+>]<]<<<[->+>>+<<<]>[-<+>]>[->>>[-<<<<+>>>>]<<[->+<]<[->+<]
->]>>><<[->>>>>>+<<<<<<]>>>>>>><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>
->][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<
-]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<
-[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-][-]><[
--<->][-]+<[[-]>-<]>[-<+>]+<[[-]>->[-]><<<<<[-]>>>>[-<<<<+>>>>]<<]>[-><]<>[-]<<[-
->+>+<<]>>[-<<+>>][-]+><[-<+>]<<[-]>[-<+>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]>[-]<<<[
-->>+>+<<<]>>>[-<<<+>>>][-]++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[
--]<<+<+[-]>[[-]<+>][-]+>[-]+<<<[[-]>>-<<]>[[-]>>-<<]>>[-<+>]<<<+>>[[-]<<->>]<>[-
-]<<<[->>+>+<<<]>>>[-<<<+>>>]<[-<<<<<<+>>>>>>]<<<<<<[-<<<[->>>>+<<<<]>>[-<+>]<+>>
-[-<+>]<]<<<[->+>>+<<<]>[-<+>]>[->>>[-<<<<+>>>>]<<[->+<]<[->+<]>]>>><<[->>>>>>+<<
-<<<<]>>>>>>>>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<[-<<<<<<<+>>>>>>>]<<<<<<<[-<<<
-[->>>>+<<<<]>>[-<+>]<+>>[-<+>]<]<<<[->+>>+<<<]>[-<+>]>[->>>[-<<<<+>>>>]<<[->+<]<
-[->+<]>]>>><<[->>>>>>>+<<<<<<<]>>>>>>>>[-]>[-]<<[-<[->>+>+<<<]>>>[-<<<+>>>]<<]<[
--]>>[-<<+>>]<>[-]<<<<<<[->>>>>+>+<<<<<<]>>>>>>[-<<<<<<+>>>>>>][-]>[-]+>[-]+>[-]<
-[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+[-]<+[[-]>+<]>[-<+>][-]+<[[-]>-<]>[-<+>][-]+>[
--]+<<<[[-]>>-<<]>[[-]>>-<<]>>[-<+>]<<<+>>[[-]<<->>]<<]<[-]>[-]<<[->+>+<<]>>[-<<+
->>]+<[[-]>->>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<+>>>>>]>[-]<<[->+>+<<]>>[-<<+>>]
-[-]+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-
-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]+
+>>>>>>>>>>>>++>><[-<<<+>>>]<[-<<<+>>>]<<[<<<[->>>>+<<<<]>[-<+>]<+>>[-<+>]>-[-<+>
+]<]<<<[-]>>[-<<+>>]<[->+<]>[->>>[-<<<<+>>>>]<<<[->+<]>]>>>+++>+><[-<<<+>>>]<[-<<
+<+>>>]<<[<<<[->>>>+<<<<]>[-<+>]<+>>[-<+>]>-[-<+>]<]<<<[-]>>[-<<+>>]<[->+<]>[->>>
+[-<<<<+>>>>]<<<[->+<]>]>>>+++++>++><[-<<<+>>>]<[-<<<+>>>]<<[<<<[->>>>+<<<<]>[-<+
+>]<+>>[-<+>]>-[-<+>]<]<<<[-]>>[-<<+>>]<[->+<]>[->>>[-<<<<+>>>>]<<<[->+<]>]>>>+++
+++++>+++><[-<<<+>>>]<[-<<<+>>>]<<[<<<[->>>>+<<<<]>[-<+>]<+>>[-<+>]>-[-<+>]<]<<<[
+-]>>[-<<+>>]<[->+<]>[->>>[-<<<<+>>>>]<<<[->+<]>]>>>+++++++++++>++++><[-<<<+>>>]<
+[-<<<+>>>]<<[<<<[->>>>+<<<<]>[-<+>]<+>>[-<+>]>-[-<+>]<]<<<[-]>>[-<<+>>]<[->+<]>[
+->>>[-<<<<+>>>>]<<<[->+<]>]>>>+++++++++++++>+++++><[-<<<+>>>]<[-<<<+>>>]<<[<<<[-
+>>>>+<<<<]>[-<+>]<+>>[-<+>]>-[-<+>]<]<<<[-]>>[-<<+>>]<[->+<]>[->>>[-<<<<+>>>>]<<
+<[->+<]>]>>>+++++++++++++++++>++++++><[-<<<+>>>]<[-<<<+>>>]<<[<<<[->>>>+<<<<]>[-
+<+>]<+>>[-<+>]>-[-<+>]<]<<<[-]>>[-<<+>>]<[->+<]>[->>>[-<<<<+>>>>]<<<[->+<]>]>>>+
+++++++++++++++++++>+++++++><[-<<<+>>>]<[-<<<+>>>]<<[<<<[->>>>+<<<<]>[-<+>]<+>>[-
+<+>]>-[-<+>]<]<<<[-]>>[-<<+>>]<[->+<]>[->>>[-<<<<+>>>>]<<<[->+<]>]>>>>++><<[-]>[
+-<+>]>>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]><[-<->][-]<[[-]>+<]>[-<+>]<[[-]+><<[-]>[-<
++>]>><<[-]>[-<+>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]+
++++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+>[-]
++<<<[[-]>>-<<]>[[-]>>-<<]>>[-<+>]<<<+>>[[-]<<->>]<>[-]<<<[->>+>+<<<]>>>[-<<<+>>>
+]<[-<<<<<<+>>>>>>]<<<<<<[-<<<[->>>>+<<<<]>>[-<+>]<+>>[-<+>]<]<<<[->+>>+<<<]>[-<+
+>]>[->>>[-<<<<+>>>>]<<[->+<]<[->+<]>]>>><<[->>>>>>+<<<<<<]>>>>>>>>[-]<<<<[->>>+>
++<<<<]>>>>[-<<<<+>>>>]<[-<<<<<<<+>>>>>>>]<<<<<<<[-<<<[->>>>+<<<<]>>[-<+>]<+>>[-<
++>]<]<<<[->+>>+<<<]>[-<+>]>[->>>[-<<<<+>>>>]<<[->+<]<[->+<]>]>>><<[->>>>>>>+<<<<
+<<<]>>>>>>>>[-]>[-]<<[-<[->>+>+<<<]>>>[-<<<+>>>]<<]<[-]>>[-<<+>>]<>[-]<<<<<<[->>
+>>>+>+<<<<<<]>>>>>>[-<<<<<<+>>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]
+<[-]<<+[-]<+[[-]>+<]>[-<+>][-]+<[[-]>-<]>[-<+>][-]+>[-]+<<<[[-]>>-<<]>[[-]>>-<<]
+>>[-<+>]<<<+>>[[-]<<->>]<<[[-]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]>[-]<<<[->>+>
++<<<]>>>[-<<<+>>>]<[-<<<<<<+>>>>>>]<<<<<<[-<<<[->>>>+<<<<]>>[-<+>]<+>>[-<+>]<]<<
+<[->+>>+<<<]>[-<+>]>[->>>[-<<<<+>>>>]<<[->+<]<[->+<]>]>>><<[->>>>>>+<<<<<<]>>>>>
+>><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]
+>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<
++>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<
+[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-]><[-<->][-]+<[[-]>-<]>[-<+>]+<[[-]
+>->><<<<<[-]>>>>[-<<<<+>>>>]<<]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>]+><[-<+>]<<[-]>[-
+<+>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]++++++>[-]>[-]
++>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+>[-]+<<<[[-]>>-<<
+]>[[-]>>-<<]>>[-<+>]<<<+>>[[-]<<->>]<>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]<[-<<<<<<+>>
+>>>>]<<<<<<[-<<<[->>>>+<<<<]>>[-<+>]<+>>[-<+>]<]<<<[->+>>+<<<]>[-<+>]>[->>>[-<<<
+<+>>>>]<<[->+<]<[->+<]>]>>><<[->>>>>>+<<<<<<]>>>>>>>>[-]<<<<[->>>+>+<<<<]>>>>[-<
+<<<+>>>>]<[-<<<<<<<+>>>>>>>]<<<<<<<[-<<<[->>>>+<<<<]>>[-<+>]<+>>[-<+>]<]<<<[->+>
+>+<<<]>[-<+>]>[->>>[-<<<<+>>>>]<<[->+<]<[->+<]>]>>><<[->>>>>>>+<<<<<<<]>>>>>>>>[
+-]>[-]<<[-<[->>+>+<<<]>>>[-<<<+>>>]<<]<[-]>>[-<<+>>]<>[-]<<<<<<[->>>>>+>+<<<<<<]
+>>>>>>[-<<<<<<+>>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+[-]<+[
+[-]>+<]>[-<+>][-]+<[[-]>-<]>[-<+>][-]+>[-]+<<<[[-]>>-<<]>[[-]>>-<<]>>[-<+>]<<<+>
+>[[-]<<->>]<<]<[-]>[-]<<[->+>+<<]>>[-<<+>>]+<[[-]>->>[-]<<<<<[->>>>+>+<<<<<]>>>>
+>[-<<<<<+>>>>>]>[-]<<[->+>+<<]>>[-<<+>>]++++++++++++++++++++++++++++++++++++++++
+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++>[-]>[-]+>[-]+>[-]<[
+<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]
+<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]+++++++++++++++++++++++++++++++++++++++++++++++
++++++++++++++++++++++++++++++++++++++++++++++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+
+>>>>]<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>
+>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>
+>+>>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<
+<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<++++++++++++++++++++++
+++++++++++++++++++++++++++><[-<+>]<.[-]<<]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>]++++++
+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]
+>-<]>[-<+>]+<[[-]>->>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]+++++++++++++++++++++++
++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++><<
+[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[
+->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<
+<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<
+<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-]++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>
+>>>]<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>
+]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>
++>>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<
++<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<+++++++++++++++++++++++
++++++++++++++++++++++++++><[-<+>]<.[-]<<]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>]+++++++
++++><<[->>+>+<<<]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[
+>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[
+-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>
+]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<]<[-]++++++++++++++++++++++++++++++++
+++++++++++++++++><[-<+>]<.[-]<[-]++++++++++++++++++++++++++++++++><.[-]+++++++++
 ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>>>[-<<<<+>>
->>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-
-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<+>>>>>][-]>
-[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+
->]<]<<[-]<[-]>>[-<<+>>]<[-]++++++++++++++++++++++++++++++++++++++++++++++++><[-<
-+>]<.[-]<<]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>][-]++++++++++>[-]>[-]+>[-]+>[-]<[<<<<
-[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]+<[[-]>->>[-]<<<<
-[->>>+>+<<<<]>>>>[-<<<<+>>>>][-]++++++++++++++++++++++++++++++++++++++++++++++++
-++++++++++++++++++++++++++++++++++++++++++++++++++++><<[->>+>+<<<]>>>[-<<<+>>>]<
-<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[
--]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<<<<]>>>>[-<<<<+
->>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]
->-<]>[-<+>]<]<[-][-]++++++++++><<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<<<[->>>+>+<<<<]>>
->>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]
-[-]+<[[-]>-<]>[-<+>]<[-<+<[-<->>>+>+<<<]>>[-<<+>>]<<<[->>>+>>+<<<<<]>>>>>[-<<<<<
-+>>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[
--]>-<]>[-<+>]<]<<[-]<[-]>>[-<<+>>]<[-]++++++++++++++++++++++++++++++++++++++++++
-++++++><[-<+>]<.[-]<<]>[-><]<>[-]<<[->+>+<<]>>[-<<+>>][-]++++++++++><<[->>+>+<<<
-]>>>[-<<<+>>>]<<[->>+>+<<<]>>>[-<<<+>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<-
->>>>]<[-]<<+<+[-]>[[-]<+>][-]+<[[-]>-<]>[-<+>]<[-<[-<->>+>+<<]>[-<+>]<<[->>+>>+<
-<<<]>>>>[-<<<<+>>>>][-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[
--]<+>][-]+<[[-]>-<]>[-<+>]<]<[-][-]+++++++++++++++++++++++++++++++++++++++++++++
-+++><[-<+>]<.[-]<[-][-]++++++++++++++++++++++++++++++++><.[-][-]++++++++++++++++
+++++++++++++++++><.[-]++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
++++++++++++++++++++++++++++++++++++++++++++++++++++++++++><.[-]+++++++++++++++++
++++++++++++++++><.[-]+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+++++++++++++++++++++++++++++++++++++++><.[-]++++++++++++++++++++++++++++++++><.[
+-]++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+++++++++++++++++++++++++++++++++++><.[-]++++++++++++++++++++++++++++++++++++++++
+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++><.[-]
 ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++><.[-][-]++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++++++++++++++++++++++++++++><.[-][-]++++++++++++++++++
-++++++++++++++><.[-][-]+++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-++++++++++++++++++++++++++++++++++++++++><.[-][-]+++++++++++++++++++++++++++++++
-+><.[-][-]++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-++++++++++++++++++++++++++++++++++++++++++><.[-][-]+++++++++++++++++++++++++++++
++++++++++++++++++++++++++><.[-]+++++++++++++++++++++++++++++++++++++++++++++++++
+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++><.[-]++++++++++++++
 ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++><.[-][-]++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++++++++++++++><.[-][-]++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++><.
-[-][-]++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++><.[-][-]++++++++++++++++++++++++++++++++><.[-][-]+++
++++++++><.[-]++++++++++++++++++++++++++++++++><.[-]+++++++++++++++++++++++++++++
 ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++><.[-][-]++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++><.[-][
--]++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++++++><.[-][-]++++++++++++++++++++++++++++++++++++++++
-++++++++++++++++++++++++++++++++++++++++++++++++++++++++++><.[-][-]+++++++++++++
++><.[-]+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+++++++++++++++++++++++++++++++++++++++++++++><.[-]++++++++++++++++++++++++++++++
++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++>
+<.[-]+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
++++++++++++++++++++++++><.[-]+++++++++++++++++++++++++++++++++++++++++++++++++++
+++++++++++++++++++++++++++++++++++++++++++++++++++><.[-]++++++++++++++++++++++++
 ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-++++++++><.[-][-]+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-+++++++++++++++++++++++++++++++++++++++++++++++++++><.[-][-]++++++++++++++++++++
-+++++++++++++><.[-][-]++++++++++><.[-]<<]>[-><]<>[-]<<<[->>+>+<<<]>>>[-<<<+>>>][
--]+><[-<+>]<<<[-]>>[-<<+>>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>][-]><[-<->][-]<[[-]>+<
-]>[-<+>]<]<[-]<[-]
+++++++++++><.[-]+++++++++++++++++++++++++++++++++><.[-]++++++++++><.[-]<<]>[-><]
+<>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]+><[-<+>]<<<[-]>>[-<<+>>]>[-]<<<[->>+>+<<<]>>>[-
+<<<+>>>]><[-<->][-]<[[-]>+<]>[-<+>]<]<[-]<[-]
@@ -1,70 +1,66 @@
-[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>
-[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>
-[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]><<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<
-<+>>][-]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]
-<[[-][-]>[-]><<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>][-]+++++>[-]>[-]+>[-]+>[-]<[<<
-<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<[[-]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>
-][-]+++++>[-]>[-]<<[-<[->>+>+<<<]>>>[-<<<+>>>]<<]<[-]>>[-<<+>>]<>[-]<<<[->>+>+<<
-<]>>>[-<<<+>>>]<[-<+>][-]+++++++++++++++++++++++++++++++++++++++++++++++++++++++
-++++++++++++++++++++++++++++++++++++++++++><[-<+>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>
-]>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<+>>>>>]<[-<<<<<<+>>>>>>]<[-<<<<<<+>>>>>>]<[
--<<<<<<+>>>>>>]<<<<[>[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<<
-<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<+<-]<[<<<[->>>>+<<<<]>[-<+>]<+>>[
--<+>]>-[-<+>]<]<<<[-]>>[-<<+>>]<[->+<]>[->>>[-<<<<+>>>>]<<<[->+<]>]>>>[-[->>>>>>
->>>>+<<<<<<<<<<]>>>>>>>>>>]>>>>[-]<<[->+>+<<]>>[-<<+>>][-]+><[-<+>]<<[-]>[-<+>]>
-[-]<<[->+>+<<]>>[-<<+>>][-]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[
--]<<+<+[-]>[[-]<+>]<]<[-]>[-]<<[->+>+<<]>>[-<<+>>][-]+><[-<+>]<<[-]>[-<+>]>[-]<<
-[->+>+<<]>>[-<<+>>][-]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+
-<+[-]>[[-]<+>]<]<[-][-]>[-]><<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>][-]+++++>[-]>[-
-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<[[-][-]>[-]><<[-]>[
--<+>]>[-]<<[->+>+<<]>>[-<<+>>][-]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->
->>>]<[-]<<+<+[-]>[[-]<+>]<[[-]>[-]<<[->+>+<<]>>[-<<+>>]>[-]<<<<[->>>+>+<<<<]>>>>
-[-<<<<+>>>>]<[-<<<<<+>>>>>]<[-<<<<<+>>>>>]<<<<[>[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<
-<<<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<+<-]<[-<<<[->>>>+<<<<]>>[-<+>]
-<+>>[-<+>]<]<<<[->+>>+<<<]>[-<+>]>[->>>[-<<<<+>>>>]<<[->+<]<[->+<]>]>>>[-[->>>>>
->>>>>+<<<<<<<<<<]<<[->>>>>>>>>>+<<<<<<<<<<]>>>>>>>>>>>>]><<<[->>>>>+<<<<<]>>>>>>
-<.[-]>[-]<<[->+>+<<]>>[-<<+>>][-]+><[-<+>]<<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>][
--]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<]<[-]
-[-]++++++++++><.[-]>[-]<<[->+>+<<]>>[-<<+>>][-]+><[-<+>]<<[-]>[-<+>]>[-]<<[->+>+
-<<]>>[-<<+>>][-]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>
-[[-]<+>]<]<[-][-]++++++++++><.[-][-]>[-]><<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>][-
-]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<[[-][-
-]>>[-]<<<[->>+>+<<<]>>>[-<<<+>>>][-]+><[-<+>]<<[-]>[-<+>][-]>>[-]<<<[->>+>+<<<]>
->>[-<<<+>>>][-]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[
-[-]<+>]<[[-]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<
-+>>>>]<[-<<<<<<+>>>>>>]<[-<<<<<<+>>>>>>]<<<<<[>[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<
-<<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<+<-]<[-<<<[->>>>+<<<<]>>[-<+>]<
-+>>[-<+>]<]<<<[->+>>+<<<]>[-<+>]>[->>>[-<<<<+>>>>]<<[->+<]<[->+<]>]>>>[-[->>>>>>
->>>>+<<<<<<<<<<]<<[->>>>>>>>>>+<<<<<<<<<<]>>>>>>>>>>>>]><<<[->>>>>>+<<<<<<]>>>>>
->><<[-]>[-<+>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<
-<+>>>>>]<[-<<<<<<+>>>>>>]<[-<<<<<<+>>>>>>]<<<<<[>[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<
-<<<<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<+<-]<[-<<<[->>>>+<<<<]>>[-<+>
-]<+>>[-<+>]<]<<<[->+>>+<<<]>[-<+>]>[->>>[-<<<<+>>>>]<<[->+<]<[->+<]>]>>>[-[->>>>
->>>>>>+<<<<<<<<<<]<<[->>>>>>>>>>+<<<<<<<<<<]>>>>>>>>>>>>]><<<[->>>>>>+<<<<<<]>>>
->>>>>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<+>>>>>]>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<
-<<<+>>>>>]<[-<<<<<<<+>>>>>>>]<[-<<<<<<<+>>>>>>>]<[-<<<<<<<+>>>>>>>]<<<<<[>[-<<<<
-<<<<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<<<<
-<+>>>>>>>>>>]<<<<<<<+<-]<[<<<[->>>>+<<<<]>[-<+>]<+>>[-<+>]>-[-<+>]<]<<<[-]>>[-<<
-+>>]<[->+<]>[->>>[-<<<<+>>>>]<<<[->+<]>]>>>[-[->>>>>>>>>>+<<<<<<<<<<]>>>>>>>>>>]
->>>>>[-]<<[->+>+<<]>>[-<<+>>]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]>[-]<<<<<<[->>
->>>+>+<<<<<<]>>>>>>[-<<<<<<+>>>>>>]<[-<<<<<<<+>>>>>>>]<[-<<<<<<<+>>>>>>>]<[-<<<<
-<<<+>>>>>>>]<<<<<[>[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<<<<
-<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<+<-]<[<<<[->>>>+<<<<]>[-<+>]<+>>[-<
-+>]>-[-<+>]<]<<<[-]>>[-<<+>>]<[->+<]>[->>>[-<<<<+>>>>]<<<[->+<]>]>>>[-[->>>>>>>>
->>+<<<<<<<<<<]>>>>>>>>>>]>>>>>[-]<<<[->>+>+<<<]>>>[-<<<+>>>][-]+><[-<+>]<<<[-]>>
-[-<<+>>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>][-]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->
-]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<]<[-]<[-]>[-]<<[->+>+<<]>>[-<<+>>][-]+><[-<+>
-]<<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>][-]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]
-<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<]<[-][-]>[-]><<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<
-+>>][-]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<
-[[-][-]>[-]><<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>][-]+++++>[-]>[-]+>[-]+>[-]<[<<<
-<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<[[-]>[-]<<[->+>+<<]>>[-<<+>>]>[-]<<
-<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<[-<<<<<+>>>>>]<[-<<<<<+>>>>>]<<<<[>[-<<<<<<<<<<+
->>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<+<-]<[-<<<[
-->>>>+<<<<]>>[-<+>]<+>>[-<+>]<]<<<[->+>>+<<<]>[-<+>]>[->>>[-<<<<+>>>>]<<[->+<]<[
-->+<]>]>>>[-[->>>>>>>>>>+<<<<<<<<<<]<<[->>>>>>>>>>+<<<<<<<<<<]>>>>>>>>>>>>]><<<[
-->>>>>+<<<<<]>>>>>><.[-]>[-]<<[->+>+<<]>>[-<<+>>][-]+><[-<+>]<<[-]>[-<+>]>[-]<<[
-->+>+<<]>>[-<<+>>][-]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<
-+[-]>[[-]<+>]<]<[-][-]++++++++++><.[-]>[-]<<[->+>+<<]>>[-<<+>>][-]+><[-<+>]<<[-]
->[-<+>]>[-]<<[->+>+<<]>>[-<<+>>][-]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<
-->>>>]<[-]<<+<+[-]>[[-]<+>]<]<[-]
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>><<[-]>[-<+>]>[-]<<[->+>+<<]>
+>[-<<+>>]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>
+]<[[-]>><<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>
+[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<[[-]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]+++++>[
+-]>[-]<<[-<[->>+>+<<<]>>>[-<<<+>>>]<<]<[-]>>[-<<+>>]<>[-]<<<[->>+>+<<<]>>>[-<<<+
+>>>]<[-<+>]+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+++++++++++++++++++++++++++++><[-<+>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]>[-]<<<<<[->>
+>>+>+<<<<<]>>>>>[-<<<<<+>>>>>]<[-<<<<<<+>>>>>>]<[-<<<<<<+>>>>>>]<[-<<<<<<+>>>>>>
+]<<<<[>[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>
+]<[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<+<-]<[<<<[->>>>+<<<<]>[-<+>]<+>>[-<+>]>-[-<+>]<
+]<<<[-]>>[-<<+>>]<[->+<]>[->>>[-<<<<+>>>>]<<<[->+<]>]>>>[-[->>>>>>>>>>+<<<<<<<<<
+<]>>>>>>>>>>]>>>>[-]<<[->+>+<<]>>[-<<+>>]+><[-<+>]<<[-]>[-<+>]>[-]<<[->+>+<<]>>[
+-<<+>>]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<
+]<[-]>[-]<<[->+>+<<]>>[-<<+>>]+><[-<+>]<<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>]++++
++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<]<[-]>><<[-
+]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->
+>>>]<[-]<<+<+[-]>[[-]<+>]<[[-]>><<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>]+++++>[-]>[
+-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<[[-]>[-]<<[->+>+<<
+]>>[-<<+>>]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<[-<<<<<+>>>>>]<[-<<<<<+>>>>>]<<
+<<[>[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<<
+<<<<<<+<-]<[-<<<[->>>>+<<<<]>>[-<+>]<+>>[-<+>]<]<<<[->+>>+<<<]>[-<+>]>[->>>[-<<<
+<+>>>>]<<[->+<]<[->+<]>]>>>[-[->>>>>>>>>>+<<<<<<<<<<]<<[->>>>>>>>>>+<<<<<<<<<<]>
+>>>>>>>>>>>]><<<[->>>>>+<<<<<]>>>>>><.[-]>[-]<<[->+>+<<]>>[-<<+>>]+><[-<+>]<<[-]
+>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>
+>>]<[-]<<+<+[-]>[[-]<+>]<]<[-]++++++++++><.[-]>[-]<<[->+>+<<]>>[-<<+>>]+><[-<+>]
+<<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<
+-<->>>>]<[-]<<+<+[-]>[[-]<+>]<]<[-]++++++++++><.[-]>><<[-]>[-<+>]>[-]<<[->+>+<<]
+>>[-<<+>>]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+
+>]<[[-]>>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]+><[-<+>]<<[-]>[-<+>]>>[-]<<<[->>+>+<<<]>
+>>[-<<<+>>>]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]
+<+>]<[[-]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>
+>>]<[-<<<<<<+>>>>>>]<[-<<<<<<+>>>>>>]<<<<<[>[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<<<<
+<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<+<-]<[-<<<[->>>>+<<<<]>>[-<+>]<+>>
+[-<+>]<]<<<[->+>>+<<<]>[-<+>]>[->>>[-<<<<+>>>>]<<[->+<]<[->+<]>]>>>[-[->>>>>>>>>
+>+<<<<<<<<<<]<<[->>>>>>>>>>+<<<<<<<<<<]>>>>>>>>>>>>]><<<[->>>>>>+<<<<<<]>>>>>>><
+<[-]>[-<+>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<+>
+>>>>]<[-<<<<<<+>>>>>>]<[-<<<<<<+>>>>>>]<<<<<[>[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<<
+<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<+<-]<[-<<<[->>>>+<<<<]>>[-<+>]<+
+>>[-<+>]<]<<<[->+>>+<<<]>[-<+>]>[->>>[-<<<<+>>>>]<<[->+<]<[->+<]>]>>>[-[->>>>>>>
+>>>+<<<<<<<<<<]<<[->>>>>>>>>>+<<<<<<<<<<]>>>>>>>>>>>>]><<<[->>>>>>+<<<<<<]>>>>>>
+>>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<+>>>>>]>[-]<<<<<[->>>>+>+<<<<<]>>>>>[-<<<<<
++>>>>>]<[-<<<<<<<+>>>>>>>]<[-<<<<<<<+>>>>>>>]<[-<<<<<<<+>>>>>>>]<<<<<[>[-<<<<<<<
+<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>
+>>>>>>>>>]<<<<<<<+<-]<[<<<[->>>>+<<<<]>[-<+>]<+>>[-<+>]>-[-<+>]<]<<<[-]>>[-<<+>>
+]<[->+<]>[->>>[-<<<<+>>>>]<<<[->+<]>]>>>[-[->>>>>>>>>>+<<<<<<<<<<]>>>>>>>>>>]>>>
+>>[-]<<[->+>+<<]>>[-<<+>>]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]>[-]<<<<<<[->>>>>
++>+<<<<<<]>>>>>>[-<<<<<<+>>>>>>]<[-<<<<<<<+>>>>>>>]<[-<<<<<<<+>>>>>>>]<[-<<<<<<<
++>>>>>>>]<<<<<[>[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>
+>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<+<-]<[<<<[->>>>+<<<<]>[-<+>]<+>>[-<+>]
+>-[-<+>]<]<<<[-]>>[-<<+>>]<[->+<]>[->>>[-<<<<+>>>>]<<<[->+<]>]>>>[-[->>>>>>>>>>+
+<<<<<<<<<<]>>>>>>>>>>]>>>>>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]+><[-<+>]<<<[-]>>[-<<+>
+>]>[-]<<<[->>+>+<<<]>>>[-<<<+>>>]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->
+>>>]<[-]<<+<+[-]>[[-]<+>]<]<[-]<[-]>[-]<<[->+>+<<]>>[-<<+>>]+><[-<+>]<<[-]>[-<+>
+]>[-]<<[->+>+<<]>>[-<<+>>]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-
+]<<+<+[-]>[[-]<+>]<]<[-]>><<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>]+++++>[-]>[-]+>[-
+]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<[[-]>><<[-]>[-<+>]>[-]<<
+[->+>+<<]>>[-<<+>>]+++++>[-]>[-]+>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[
+-]>[[-]<+>]<[[-]>[-]<<[->+>+<<]>>[-<<+>>]>[-]<<<<[->>>+>+<<<<]>>>>[-<<<<+>>>>]<[
+-<<<<<+>>>>>]<[-<<<<<+>>>>>]<<<<[>[-<<<<<<<<<<+>>>>>>>>>>]<[-<<<<<<<<<<+>>>>>>>>
+>>]<[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<+<-]<[-<<<[->>>>+<<<<]>>[-<+>]<+>>[-<+>]<]<<
+<[->+>>+<<<]>[-<+>]>[->>>[-<<<<+>>>>]<<[->+<]<[->+<]>]>>>[-[->>>>>>>>>>+<<<<<<<<
+<<]<<[->>>>>>>>>>+<<<<<<<<<<]>>>>>>>>>>>>]><<<[->>>>>+<<<<<]>>>>>><.[-]>[-]<<[->
++>+<<]>>[-<<+>>]+><[-<+>]<<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>]+++++>[-]>[-]+>[-]
++>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<]<[-]++++++++++><.[-]>[-]
+<<[->+>+<<]>>[-<<+>>]+><[-<+>]<<[-]>[-<+>]>[-]<<[->+>+<<]>>[-<<+>>]+++++>[-]>[-]
++>[-]+>[-]<[<<<<[>]>>>[->]<<<<-<->>>>]<[-]<<+<+[-]>[[-]<+>]<]<[-]
@@ -1,3 +1,37 @@
-from .compiler import Compiler, compile_source
+__version__ = '0.1.0'
 
-__all__ = ['Compiler', 'compile_source']
+import functools
+import hashlib
+import os
+
+__all__ = ['CompilationCache', 'Compiler', 'compile_source']
+
+
+@functools.lru_cache(maxsize=None)
+def source_digest():
+    '''SHA-256 of the version and every module of this package.
+
+    Whatever one copy of the compiler produces is only valid for a copy with
+    the same digest, even when the version was not bumped.
+    '''
+    digest = hashlib.sha256(f'bfcc {__version__}\0'.encode())
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for name in sorted(os.listdir(directory)):
+        if name.endswith('.py'):
+            with open(os.path.join(directory, name), 'rb') as file:
+                digest.update(f'{name}\0'.encode() + file.read() + b'\0')
+    return digest.hexdigest()
+
+
+def __getattr__(name):
+    # Imported on first use, so the command line client can talk to a daemon
+    # without loading the compiler.
+    if name == 'CompilationCache':
+        from .cache import CompilationCache
+
+        return CompilationCache
+    if name in ('Compiler', 'compile_source'):
+        from . import compiler
+
+        return getattr(compiler, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
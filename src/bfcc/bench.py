@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+
+import argparse
+import io
+import json
+import math
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from .cache import CompilationCache
+from .compiler import compile_source
+from .engine import ENGINES
+from .incremental import StatementCache
+from .lexer import Lexer, tokenize
+from .parser import Parser, walk
+
+# Fixed inputs of the programs in data/, as (input name, input) pairs. Inputs
+# read from files are resolved by corpus().
+INPUTS = {
+    'gcd': [('48-18', '48 18\n'), ('255-17', '255 17\n')],
+    'nqueens': [('n4', '4\n'), ('n6', '6\n')],
+    'life': 'life_inputs',
+    'sudoku': 'sudoku_problems',
+}
+SKIP = ['lextest']
+SIZES = [1000, 10000, 100000]
+PHASES = ['lexer', 'parser', 'codegen']
+SHAPES = ['statements', 'expression', 'blocks', 'else-chain']
+# Growth of a fitted exponent counted as a regression. Exponents are compared
+# by difference, not ratio: 1.0 -> 1.1 is noise, 1.0 -> 2.0 is quadratic.
+EXPONENT_SLACK = 0.25
+
+
+def corpus(data):
+    '''Yield (program name, source, input name, input) for the data/ corpus.'''
+    data = Path(data)
+    for path in sorted(data.glob('*.txt')):
+        name = path.stem
+        if name in SKIP:
+            continue
+        source = path.read_text(encoding='utf-8')
+        inputs = INPUTS.get(name, [('none', '')])
+        if isinstance(inputs, str):
+            files = sorted(p for p in (data / inputs).glob('*.txt') if p.name != 'README.txt')
+            # life reads a board and then one key per generation; '\0' quits.
+            suffix = '\0' if name == 'life' else ''
+            inputs = [(p.stem, p.read_text(encoding='utf-8') + suffix) for p in files]
+        for input_name, input_string in inputs:
+            yield name, source, input_name, input_string
+
+
+def measure_compile(source):
+    tracemalloc.start()
+    begin = time.perf_counter()
+    code = compile_source(source)
+    elapsed = time.perf_counter() - begin
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return code, elapsed, peak
+
+
+def measure_run(engine, code, input_string, memory=False):
+    ost = io.StringIO()
+    if memory:
+        tracemalloc.start()
+    begin = time.perf_counter()
+    _, _, step = ENGINES[engine](code, io.StringIO(input_string), ost)
+    elapsed = time.perf_counter() - begin
+    peak = 0
+    if memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return ost.getvalue(), step, elapsed, peak
+
+
+def bench(data='data', programs=None, engines=None, memory=False, log=None):
+    '''Compile and run the corpus. Returns {"program/input/engine": {metric: value}}.'''
+    results = {}
+    compiled = {}
+    for name, source, input_name, input_string in corpus(data):
+        if programs and name not in programs:
+            continue
+        if name not in compiled:
+            compiled[name] = measure_compile(source)
+        code, compile_time, compile_peak = compiled[name]
+        for engine in engines or ENGINES:
+            _, step, wall_time, run_peak = measure_run(engine, code, input_string, memory)
+            key = f'{name}/{input_name}/{engine}'
+            results[key] = {
+                'compile_time': compile_time,
+                'code_size': len(code),
+                'steps': step,
+                'wall_time': wall_time,
+                'peak_memory': max(compile_peak, run_peak),
+            }
+            if log:
+                print(format_row(key, results[key]), file=log, flush=True)
+    return results
+
+
+def format_row(key, row):
+    return (
+        f'{key:40} compile {row["compile_time"]:8.3f}s  size {row["code_size"]:8}  '
+        f'steps {row["steps"]:11}  run {row["wall_time"]:9.3f}s  peak {row["peak_memory"] >> 10:8}KiB'
+    )
+
+
+def regressions(results, baseline, threshold=0.1, slack=EXPONENT_SLACK):
+    '''List (key, metric, old, new) where new exceeds old by more than threshold.
+
+    The "exponents" row of a scaling run maps "shape/phase" to its fitted
+    exponent, which regresses when it grows by more than slack.
+    '''
+    found = []
+    for key, row in results.items():
+        old = baseline.get(key)
+        if not old:
+            continue
+        if key == 'exponents':
+            for metric, new in row.items():
+                if new is not None and old.get(metric) is not None and new > old[metric] + slack:
+                    found += [(key, metric, old[metric], new)]
+            continue
+        if 'error' in row and 'error' not in old:
+            found += [(key, 'error', 0, 0)]
+            continue
+        for metric in row:
+            if isinstance(old.get(metric), (int, float)) and old[metric] and row[metric] > old[metric] * (1 + threshold):
+                found += [(key, metric, old[metric], row[metric])]
+    return found
+
+
+def synthesize(kind, n):
+    '''Return a source of size n for a scaling shape.
+
+    statements: n assignments and calls with comments in between.
+    expression: one expression nested n parentheses deep.
+    blocks:     n nested if blocks.
+    else-chain: an if/else chain n levels long.
+    '''
+    if kind == 'statements':
+        lines = ['var x = 1;', 'var y = 2;', 'arr a[4][4];']
+        for i in range(n):
+            if i % 4 == 0:
+                lines += [f'// statement {i}', f'x += (y * {i % 256}) % 7;']
+            elif i % 4 == 1:
+                lines += [f'/* block\n comment {i} */ y = x - {i % 256};']
+            elif i % 4 == 2:
+                lines += [f'a[{i % 4}][{(i >> 2) % 4}] = x + y;']
+            else:
+                lines += ["putchar('a' + a[1][2] % 26);"]
+        return '\n'.join(lines) + '\n'
+    if kind == 'expression':
+        return 'var x = 1;\nputchar(' + '(x + ' * n + '1' + ')' * n + ');\n'
+    if kind == 'blocks':
+        return 'var x = 1;\n' + 'if (x) { ' * n + 'x += 1;' + ' }' * n + '\n'
+    if kind == 'else-chain':
+        return 'var x = 1;\n' + 'if (x) { x += 1; } else { ' * n + 'x -= 1;' + ' }' * n + '\n'
+    raise ValueError(f'Unknown scaling shape {kind!r}.')
+
+
+def measure_phases(source):
+    '''Time the lexer, the parser and codegen separately, then trace their peak memory in a second pass.'''
+    steps = [
+        ('lexer', lambda text: list(tokenize(text))),
+        ('parser', lambda tokens: Parser(Lexer(tokens)).parse_program()),
+        ('codegen', lambda prog: prog.codegen(False)),
+    ]
+    row = {}
+    result = source
+    for phase, step in steps:
+        begin = time.perf_counter()
+        result = step(result)
+        row[f'{phase}_time'] = time.perf_counter() - begin
+    row['code_size'] = len(result)
+    result = source
+    for phase, step in steps:
+        tracemalloc.start()
+        result = step(result)
+        row[f'{phase}_peak'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return row
+
+
+def fit_exponent(sizes, times):
+    '''Least-squares slope of log(time) over log(size): about 1 for linear, 2 for quadratic.'''
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, times) if t > 0]
+    if len(points) < 2:
+        return None
+    mx = sum(x for x, _ in points) / len(points)
+    my = sum(y for _, y in points) / len(points)
+    den = sum((x - mx) ** 2 for x, _ in points)
+    return sum((x - mx) * (y - my) for x, y in points) / den if den else None
+
+
+def scaling(shapes=None, sizes=None, log=None):
+    '''Measure every phase on synthesized sources. Returns (results, exponents).
+
+    results maps "scaling/shape/size" to a row of metrics; a phase that fails
+    (for example with RecursionError) records its error instead. exponents maps
+    "shape/phase" to the fitted complexity exponent of its time.
+    '''
+    results = {}
+    exponents = {}
+    for shape in shapes or SHAPES:
+        measured = []
+        for n in sizes or SIZES:
+            key = f'scaling/{shape}/{n}'
+            try:
+                results[key] = measure_phases(synthesize(shape, n))
+            except (RecursionError, MemoryError) as exc:
+                results[key] = {'error': type(exc).__name__}
+                if log:
+                    print(f'{key:40} {type(exc).__name__}', file=log, flush=True)
+                continue
+            measured += [(n, results[key])]
+            if log:
+                print(
+                    f'{key:40} '
+                    + '  '.join(f'{p} {results[key][p + "_time"]:8.3f}s/{results[key][p + "_peak"] >> 10}KiB' for p in PHASES),
+                    file=log,
+                    flush=True,
+                )
+        for phase in PHASES:
+            exponents[f'{shape}/{phase}'] = fit_exponent(
+                [n for n, _ in measured], [row[f'{phase}_time'] for _, row in measured]
+            )
+            if log and exponents[f'{shape}/{phase}'] is not None:
+                print(f'{shape}/{phase}: time ~ n^{exponents[f"{shape}/{phase}"]:.2f}', file=log)
+    return results, exponents
+
+
+def count_nodes(prog):
+    '''Number of Program, statement and expression nodes reachable from prog.'''
+    return sum(1 for _ in walk(prog))
+
+
+def measure_ast(source):
+    '''Memory retained by the parsed AST of source, with its node count.'''
+    tokens = list(tokenize(source))
+    tracemalloc.start()
+    prog = Parser(Lexer(tokens)).parse_program()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    nodes = count_nodes(prog)
+    return {'nodes': nodes, 'ast_bytes': retained, 'bytes_per_node': retained / nodes if nodes else 0}
+
+
+def ast_memory(data, programs=None, sizes=None, log=None):
+    '''measure_ast() over the data/ corpus and the synthesized statements shape.'''
+    sources = []
+    for path in sorted(Path(data).glob('*.txt')):
+        if path.stem not in SKIP and (not programs or path.stem in programs):
+            sources += [(f'ast/{path.stem}', path.read_text(encoding='utf-8'))]
+    for n in sizes or SIZES:
+        sources += [(f'ast/statements/{n}', synthesize('statements', n))]
+    results = {}
+    for key, source in sources:
+        results[key] = measure_ast(source)
+        if log:
+            row = results[key]
+            print(
+                f'{key:40} {row["nodes"]:8} nodes {row["ast_bytes"] >> 10:8} KiB {row["bytes_per_node"]:7.1f} B/node',
+                file=log,
+                flush=True,
+            )
+    return results
+
+
+def measure_rebuild(source, edited):
+    '''Time a compile without a cache, then with a fresh cache, then of edited with that cache.
+
+    The last compile finds only the statement cache warm, as a one-line edit
+    under bfcc --cache-dir does. generated counts the statements it compiled.
+    '''
+    row = {}
+    begin = time.perf_counter()
+    compile_source(source)
+    row['cold_time'] = time.perf_counter() - begin
+    with tempfile.TemporaryDirectory() as directory:
+        cache = CompilationCache(directory)
+        begin = time.perf_counter()
+        compile_source(source, cache=cache)
+        row['cached_time'] = time.perf_counter() - begin
+        statements = StatementCache(store=cache)
+        begin = time.perf_counter()
+        compile_source(edited, cache=cache, statements=statements)
+        row['edit_time'] = time.perf_counter() - begin
+    row['generated'] = statements.misses
+    return row
+
+
+def rebuild(sizes=None, log=None):
+    '''measure_rebuild() on the statements shape, editing one statement in the middle.'''
+    results = {}
+    for n in sizes or SIZES:
+        source = synthesize('statements', n)
+        middle = f'// statement {n // 2 - n // 2 % 4}\n'
+        edited = source.replace(middle, middle + 'x += 1; ', 1)
+        key = f'rebuild/{n}'
+        results[key] = measure_rebuild(source, edited)
+        if log:
+            row = results[key]
+            print(
+                f'{key:40} cold {row["cold_time"]:8.3f}s  cached {row["cached_time"]:8.3f}s  '
+                f'edit {row["edit_time"]:8.3f}s ({row["generated"]} generated)',
+                file=log,
+                flush=True,
+            )
+    return results
+
+
+def write_corpus(directory, shapes=None, sizes=None):
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for shape in shapes or SHAPES:
+        for n in sizes or SIZES:
+            (directory / f'{shape}-{n}.txt').write_text(synthesize(shape, n), encoding='utf-8')
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='bfcc bench', description='Benchmark the compiler and engines on data/.')
+    parser.add_argument('--data', default='data', help='Corpus directory.')
+    parser.add_argument('--program', action='append', help='Only benchmark this program. Repeatable.')
+    parser.add_argument('--engine', action='append', choices=list(ENGINES), help='Only use this engine. Repeatable.')
+    parser.add_argument('--memory', action='store_true', help='Trace peak memory while running, too (slower).')
+    parser.add_argument('--save', help='Write the results as a JSON baseline.')
+    parser.add_argument('--baseline', help='Compare against this JSON baseline.')
+    parser.add_argument('--threshold', type=float, default=0.1, help='Relative increase counted as a regression.')
+    parser.add_argument(
+        '--exponent-slack',
+        type=float,
+        default=EXPONENT_SLACK,
+        help='Growth of a fitted scaling exponent counted as a regression.',
+    )
+    parser.add_argument(
+        '--scaling', action='store_true', help='Measure compile-time scaling on synthesized sources instead.'
+    )
+    parser.add_argument(
+        '--ast', action='store_true', help='Measure the memory retained by parsed ASTs instead.'
+    )
+    parser.add_argument(
+        '--rebuild', action='store_true', help='Time a rebuild after a one-statement edit with a cache instead.'
+    )
+    parser.add_argument('--shape', action='append', choices=SHAPES, help='Only use this scaling shape. Repeatable.')
+    parser.add_argument('--sizes', type=int, nargs='+', help=f'Scaling sizes. Defaults to {SIZES}.')
+    parser.add_argument('--write-corpus', help='Write the synthesized stress sources to this directory and exit.')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.write_corpus:
+        write_corpus(args.write_corpus, args.shape, args.sizes)
+        return 0
+    if args.ast:
+        results = ast_memory(args.data, args.program, args.sizes, log=sys.stdout)
+    elif args.rebuild:
+        results = rebuild(args.sizes, log=sys.stdout)
+    elif args.scaling:
+        results, exponents = scaling(args.shape, args.sizes, log=sys.stdout)
+        results['exponents'] = exponents
+    else:
+        results = bench(args.data, args.program, args.engine, args.memory, log=sys.stdout)
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            found = regressions(results, json.load(file), args.threshold, args.exponent_slack)
+        for key, metric, old, new in found:
+            print(f'regression: {key} {metric} {old:.6g} -> {new:.6g}')
+        if found:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
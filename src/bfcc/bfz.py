@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+'''Compressed container for compiled programs (.bfz).
+
+Layout:
+    magic    b'BFZ'
+    version  1 byte
+    flags    1 byte (bit 0: a source map follows the jump table)
+    digest   32 bytes, SHA-256 of the Brainfuck commands
+    payload  zlib stream of varints:
+             nops, (opcode, count) * nops, jump target of every bracket op,
+             and optionally nentries, (op index, line) * nentries
+'''
+
+import zlib
+
+from .engine import COMMANDS, FoldedProgram, fold
+
+MAGIC = b'BFZ'
+VERSION = 1
+FLAG_SOURCE_MAP = 1
+HEADERSIZE = len(MAGIC) + 2 + 32
+
+
+def write_varint(out, num):
+    while num >= 0x80:
+        out.append(num & 0x7F | 0x80)
+        num >>= 7
+    out.append(num)
+
+
+def read_varint(buf, pos):
+    num = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        num |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return num, pos
+        shift += 7
+
+
+def wrap(commands, width=80):
+    return ''.join(commands[i : i + width] + '\n' for i in range(0, len(commands), width))
+
+
+def dumps(code, source_map=None):
+    '''Fold Brainfuck code and pack it into .bfz bytes.'''
+    prog = code if isinstance(code, FoldedProgram) else fold(code)
+    source_map = source_map if source_map is not None else prog.source_map
+    payload = bytearray()
+    write_varint(payload, len(prog.ops))
+    for cmd, count in prog.ops:
+        payload.append(COMMANDS.index(cmd))
+        write_varint(payload, count)
+    for (cmd, _), target in zip(prog.ops, prog.jumps):
+        if cmd in '[]':
+            write_varint(payload, target)
+    flags = 0
+    if source_map:
+        flags |= FLAG_SOURCE_MAP
+        write_varint(payload, len(source_map))
+        for index, line in source_map:
+            write_varint(payload, index)
+            write_varint(payload, line)
+    digest = bytes.fromhex(prog.digest())
+    return MAGIC + bytes([VERSION, flags]) + digest + zlib.compress(bytes(payload), 9)
+
+
+def loads(data, verify=False):
+    '''Load .bfz bytes into a FoldedProgram without touching Brainfuck text.'''
+    if data[: len(MAGIC)] != MAGIC:
+        raise SyntaxError('Not a bfz file.')
+    version, flags = data[len(MAGIC)], data[len(MAGIC) + 1]
+    if version != VERSION:
+        raise SyntaxError(f'Unsupported bfz version {version}.')
+    digest = bytes(data[len(MAGIC) + 2 : HEADERSIZE])
+    try:
+        payload = zlib.decompress(data[HEADERSIZE:])
+    except zlib.error as exc:
+        raise SyntaxError(f'Broken bfz payload: {exc}.')
+    nops, pos = read_varint(payload, 0)
+    ops = []
+    for _ in range(nops):
+        cmd = COMMANDS[payload[pos]]
+        count, pos = read_varint(payload, pos + 1)
+        ops += [(cmd, count)]
+    jumps = [0] * nops
+    for i, (cmd, _) in enumerate(ops):
+        if cmd in '[]':
+            jumps[i], pos = read_varint(payload, pos)
+    source_map = []
+    if flags & FLAG_SOURCE_MAP:
+        nentries, pos = read_varint(payload, pos)
+        for _ in range(nentries):
+            index, pos = read_varint(payload, pos)
+            line, pos = read_varint(payload, pos)
+            source_map += [(index, line)]
+    prog = FoldedProgram(ops, jumps, source_map)
+    if verify and bytes.fromhex(prog.digest()) != digest:
+        raise SyntaxError('bfz digest mismatch.')
+    return prog
+
+
+def unpack(data):
+    '''Turn .bfz bytes back into plain Brainfuck wrapped at 80 columns.'''
+    return wrap(loads(data, verify=True).commands())
+
+
+def load(path, verify=False):
+    with open(path, 'rb') as file:
+        return loads(file.read(), verify)
+
+
+def is_bfz(path):
+    return str(path).endswith('.bfz')
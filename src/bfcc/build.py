@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from . import bfz
+from .cache import DEFAULT_MAX_BYTES, CompilationCache, ENV_DIR
+from .cli import ERRORS, add_cache_arguments, add_optimize_argument
+from .compiler import compile_folded, compile_source, source_key
+from .emit import atomic_open
+
+
+class BuildResult:
+    def __init__(self, source, output, status, elapsed, error=None):
+        self.source = source
+        self.output = output
+        self.status = status
+        self.elapsed = elapsed
+        self.error = error
+
+
+def output_path(source, out_dir, suffix='.bf'):
+    stem = os.path.splitext(os.path.basename(source))[0]
+    return os.path.join(out_dir, stem + suffix)
+
+
+def _unchanged(path, data):
+    try:
+        with open(path, 'rb') as file:
+            return file.read() == data
+    except OSError:
+        return False
+
+
+def build_one(source, output, debug=False, cache_dir=None, cache_size=DEFAULT_MAX_BYTES, optimize=0):
+    '''Compile source into output. Runs in a worker process, so it only takes plain values.
+
+    status is "built", "cached" when the code came from the cache, "unchanged"
+    when output already holds it (the file is then left alone), or "error".
+    '''
+    begin = time.perf_counter()
+    try:
+        with open(source, encoding='utf-8') as file:
+            text = file.read()
+        cache = CompilationCache(cache_dir, cache_size) if cache_dir else None
+        hit = cache is not None and cache.get(source_key(cache, text, debug, optimize), 'code.bf') is not None
+        if bfz.is_bfz(output):
+            data = bfz.dumps(compile_folded(text, debug=debug, cache=cache, optimize=optimize))
+        else:
+            data = compile_source(text, debug=debug, cache=cache, optimize=optimize).encode('utf-8')
+        if hit and _unchanged(output, data):
+            status = 'unchanged'
+        else:
+            with atomic_open(output, 'wb') as file:
+                file.write(data)
+            status = 'cached' if hit else 'built'
+    except ERRORS as exc:
+        return BuildResult(source, output, 'error', time.perf_counter() - begin, str(exc))
+    return BuildResult(source, output, status, time.perf_counter() - begin)
+
+
+def build(
+    sources,
+    out_dir,
+    jobs=None,
+    debug=False,
+    cache_dir=None,
+    cache_size=DEFAULT_MAX_BYTES,
+    suffix='.bf',
+    log=None,
+    optimize=0,
+):
+    '''Compile every source into out_dir on jobs worker processes. Returns BuildResults in source order.'''
+    outputs = [output_path(source, out_dir, suffix) for source in sources]
+    seen = {}
+    for source, output in zip(sources, outputs):
+        if output in seen:
+            raise RuntimeError(f'{seen[output]} and {source} would both be written to {output}.')
+        seen[output] = source
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = jobs or os.cpu_count() or 1
+    args = [(source, output, debug, cache_dir, cache_size, optimize) for source, output in zip(sources, outputs)]
+    if jobs == 1 or len(args) < 2:
+        return [_report(build_one(*arg), log) for arg in args]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        # Hand out several files per task so small files do not pay one round trip each.
+        chunksize = max(1, len(args) // (jobs * 8))
+        return [_report(result, log) for result in pool.map(build_one, *zip(*args), chunksize=chunksize)]
+
+
+def _report(result, log):
+    if log:
+        line = f'{result.status:9} {result.elapsed * 1000:9.1f} ms  {result.source} -> {result.output}'
+        if result.error:
+            line += f': {result.error}'
+        print(line, file=log, flush=True)
+    return result
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='bfcc build', description='Compile many source files in parallel.')
+    parser.add_argument('sources', nargs='+', help='Source file paths.')
+    parser.add_argument('--out-dir', required=True, help='Directory for the outputs, named after each source.')
+    parser.add_argument('-j', '--jobs', type=int, help='Number of worker processes. Defaults to the CPU count.')
+    parser.add_argument('--debug', action='store_true', help='Emit debug-friendly output.')
+    add_optimize_argument(parser)
+    parser.add_argument('--bfz', action='store_true', help='Write compressed .bfz outputs instead of .bf.')
+    add_cache_arguments(parser)
+    parser.add_argument('-q', '--quiet', action='store_true', help='Only print failures and the summary.')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    cache_dir = args.cache_dir or os.environ.get(ENV_DIR)
+    begin = time.perf_counter()
+    results = build(
+        args.sources,
+        args.out_dir,
+        args.jobs,
+        args.debug,
+        cache_dir,
+        args.cache_size or DEFAULT_MAX_BYTES,
+        '.bfz' if args.bfz else '.bf',
+        log=None if args.quiet else sys.stdout,
+        optimize=args.optimize,
+    )
+    counts = {}
+    for result in results:
+        counts[result.status] = counts.get(result.status, 0) + 1
+        if args.quiet and result.status == 'error':
+            _report(result, sys.stdout)
+    summary = ', '.join(f'{counts[status]} {status}' for status in ['built', 'cached', 'unchanged', 'error'] if status in counts)
+    print(f'{len(results)} files in {time.perf_counter() - begin:.2f}s: {summary}')
+    return 1 if 'error' in counts else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
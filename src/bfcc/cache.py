@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+
+import contextlib
+import hashlib
+import os
+import shutil
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+from . import source_digest
+
+DEFAULT_MAX_BYTES = 256 << 20
+ENV_DIR = 'BFCC_CACHE_DIR'
+# Eviction goes down to this fraction of max_bytes, so it scans the entries
+# once per tenth of max_bytes written rather than on every write.
+LOW_WATER = 0.9
+
+
+class CompilationCache:
+    '''Content-addressed artifact store on disk.
+
+    Each entry is a directory named after the key, holding one file per
+    artifact (emitted code, folded IR, native objects, ...). Entries are
+    published with an atomic rename, so concurrent processes either see a
+    complete entry or none. The entry mtime records its last use, and the least
+    recently used entries are evicted once the total size exceeds max_bytes.
+    Keys cover source_digest(), so a changed compiler never reads the entries
+    of another one. The total is kept in the "size" file; only eviction scans
+    the entries, and it recounts the total while it does.
+    '''
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, source, **options):
+        digest = hashlib.sha256()
+        digest.update(f'bfcc {source_digest()}\0'.encode())
+        for name in sorted(options):
+            digest.update(f'{name}={options[name]!r}\0'.encode())
+        digest.update(source.encode() if isinstance(source, str) else source)
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key, name):
+        entry = self.path(key)
+        try:
+            with open(os.path.join(entry, name), 'rb') as file:
+                data = file.read()
+            os.utime(entry)
+        except OSError:
+            return None
+        return data
+
+    def put(self, key, artifacts):
+        entry = self.path(key)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        tmp = tempfile.mkdtemp(prefix='.tmp-', dir=os.path.dirname(entry))
+        added = sum(len(data) for data in artifacts.values())
+        try:
+            for name, data in artifacts.items():
+                with open(os.path.join(tmp, name), 'wb') as file:
+                    file.write(data)
+            try:
+                os.rename(tmp, entry)
+            except OSError:
+                # Another process has published the same entry, or an old one
+                # is still there. Merge the new artifacts into it one by one.
+                # Count only by how much the merge grows the entry.
+                os.makedirs(entry, exist_ok=True)
+                for name in artifacts:
+                    target = os.path.join(entry, name)
+                    try:
+                        added -= os.stat(target).st_size
+                    except OSError:
+                        pass
+                    os.replace(os.path.join(tmp, name), target)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.account(added)
+
+    def entries(self):
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.startswith('.') or not entry.is_dir():
+                    continue
+                try:
+                    size = sum(f.stat().st_size for f in os.scandir(entry.path))
+                    yield entry.stat().st_mtime, size, entry.path
+                except OSError:
+                    continue
+
+    @contextlib.contextmanager
+    def _locked(self):
+        with open(os.path.join(self.directory, 'lock'), 'a') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def _total(self):
+        try:
+            with open(os.path.join(self.directory, 'size')) as file:
+                return int(file.read())
+        except (OSError, ValueError):
+            return None
+
+    def _set_total(self, total):
+        with open(os.path.join(self.directory, 'size'), 'w') as file:
+            file.write(str(total))
+
+    def account(self, size):
+        '''Add size bytes written (less than 0 if an entry shrank) to the total, and evict once it exceeds max_bytes.'''
+        with self._locked():
+            total = self._total()
+            if total is None or total + size > self.max_bytes:
+                total = self._evict()
+            else:
+                total += size
+            self._set_total(total)
+
+    def evict(self):
+        '''Remove least recently used entries until the total is at most LOW_WATER * max_bytes.'''
+        with self._locked():
+            self._set_total(self._evict())
+
+    def _evict(self):
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return total
+        for _, size, path in entries:
+            if total <= self.max_bytes * LOW_WATER:
+                break
+            trash = tempfile.mkdtemp(prefix='.trash-', dir=self.directory)
+            try:
+                os.rename(path, os.path.join(trash, 'entry'))
+            except OSError:
+                pass
+            shutil.rmtree(trash, ignore_errors=True)
+            total -= size
+        return total
+
+
+def default_cache(directory=None, max_bytes=DEFAULT_MAX_BYTES):
+    '''Open the cache at directory or $BFCC_CACHE_DIR, or return None if neither is set.'''
+    directory = directory or os.environ.get(ENV_DIR)
+    if not directory:
+        return None
+    return CompilationCache(directory, max_bytes)
@@ -1,9 +1,43 @@
 #!/usr/bin/env python3
 
 import argparse
+import asyncio
+import contextlib
 import sys
 
-from .compiler import compile_source
+from . import daemon
+from .emit import atomic_open
+
+# Everything else is imported where it is used, so compiling through a daemon
+# does not load the compiler.
+
+# Errors reported as a message instead of a traceback, by main and by the
+# build and watch loops that keep going past a failed file.
+ERRORS = (OSError, RuntimeError, SyntaxError, AssertionError, IndexError, EOFError)
+
+
+def add_optimize_argument(parser):
+    parser.add_argument(
+        '-O',
+        dest='optimize',
+        type=int,
+        choices=[0, 1],
+        default=0,
+        help='Optimization level. -O1 runs the IR passes and the peephole pass.',
+    )
+
+
+def add_cache_arguments(parser):
+    parser.add_argument('--cache-dir', help='Compilation cache directory. Defaults to $BFCC_CACHE_DIR, or no cache.')
+    parser.add_argument(
+        '--cache-size', type=int, help='Maximum cache size in bytes before LRU eviction. Defaults to 256 MiB.'
+    )
+
+
+def _default_cache(args):
+    from .cache import DEFAULT_MAX_BYTES, default_cache
+
+    return default_cache(args.cache_dir, args.cache_size or DEFAULT_MAX_BYTES)
 
 
 def build_parser():
@@ -18,9 +52,56 @@ def build_parser():
         '-o',
         '--output',
         default='-',
-        help='Output file path. Use - to write to stdout.',
+        help='Output file path. Use - to write to stdout. A .bfz suffix writes the compressed format.',
+    )
+    parser.add_argument('--debug', action='store_true', help='Emit debug-friendly output. It is never optimized.')
+    add_optimize_argument(parser)
+    parser.add_argument(
+        '--dump-ir', action='store_true', help='Write the stack machine ops, after the passes of -O, instead of code.'
+    )
+    parser.add_argument('--daemon', action='store_true', help='Serve compile requests on --socket and stay running.')
+    parser.add_argument('--socket', help='Daemon socket path. Defaults to $BFCC_DAEMON_SOCKET or a per-user path.')
+    parser.add_argument('--no-daemon', action='store_true', help='Compile in this process even if a daemon is running.')
+    parser.add_argument('--watch', action='store_true', help='Rebuild the output whenever the input changes.')
+    parser.add_argument(
+        '--run-input', help='With --watch, run each build on this input file and report time and steps.'
     )
-    parser.add_argument('--debug', action='store_true', help='Emit debug-friendly output.')
+    add_cache_arguments(parser)
+    return parser
+
+
+def build_run_parser():
+    from .interpreter import TAPESIZE
+
+    parser = argparse.ArgumentParser(prog='bfcc run', description='Run a Brainfuck (.bf or .bfz) program.')
+    parser.add_argument('program', help='Program file path.')
+    parser.add_argument('--tape', help='Back the tape with this file through mmap.')
+    parser.add_argument('--tape-size', type=int, default=TAPESIZE, help='Number of tape cells.')
+    parser.add_argument('--stats', action='store_true', help='Print the final dp and step count to stderr.')
+    parser.add_argument(
+        '--memo',
+        action='store_true',
+        help='Reuse the result of an earlier run on the same input from the cache. Ignored for terminals and --tape.',
+    )
+    add_cache_arguments(parser)
+    return parser
+
+
+def build_unpack_parser():
+    parser = argparse.ArgumentParser(prog='bfcc unpack', description='Convert a .bfz program back into plain Brainfuck.')
+    parser.add_argument('input', help='Input .bfz file path.')
+    parser.add_argument('-o', '--output', default='-', help='Output file path. Use - to write to stdout.')
+    return parser
+
+
+def build_serve_parser():
+    parser = argparse.ArgumentParser(prog='bfcc serve', description='Serve interactive program runs over a socket.')
+    parser.add_argument('--unix', help='Listen on this Unix socket path instead of TCP.')
+    parser.add_argument('--host', default='127.0.0.1', help='TCP host to listen on.')
+    parser.add_argument('--port', type=int, default=7878, help='TCP port to listen on.')
+    parser.add_argument('--max-sessions', type=int, default=64, help='Number of runs executing at the same time.')
+    parser.add_argument('--max-programs', type=int, default=256, help='Number of programs kept in memory.')
+    parser.add_argument('--max-steps', type=int, help='Upper bound of the step limit of every run.')
     return parser
 
 
@@ -31,24 +112,176 @@ def _read_source(path):
         return file.read()
 
 
-def _write_output(path, code):
+@contextlib.contextmanager
+def _open_output(path):
     if path == '-':
-        sys.stdout.write(code)
+        yield sys.stdout
+    else:
+        with atomic_open(path) as file:
+            yield file
+
+
+def _write_output(path, code):
+    from . import bfz
+
+    if path != '-' and bfz.is_bfz(path):
+        with atomic_open(path, 'wb') as file:
+            file.write(bfz.dumps(code))
         return
-    with open(path, 'w', encoding='utf-8') as file:
+    with _open_output(path) as file:
         file.write(code)
 
 
-def main(argv=None):
-    args = build_parser().parse_args(argv)
+def _load_program(path, cache=None):
+    from . import bfz
+    from .engine import fold
+    from .interpreter import load_program
+
+    if bfz.is_bfz(path):
+        return bfz.load(path)
+    code = load_program(path)
+    if cache is None:
+        return fold(code)
+    key = cache.key(code, fold=True)
+    data = cache.get(key, 'code.bfz')
+    if data is not None:
+        return bfz.loads(data)
+    prog = fold(code)
+    cache.put(key, {'code.bfz': bfz.dumps(prog)})
+    return prog
+
+
+def run_main(argv):
+    from .engine import execute
+    from .interpreter import open_tape
+    from .memo import ResultCache, run
+
+    args = build_run_parser().parse_args(argv)
+    cache = _default_cache(args)
+    prog = _load_program(args.program, cache)
+    memo = 'off'
+    if args.memo and not args.tape and not sys.stdin.isatty():
+        result = run(prog, sys.stdin.read(), ResultCache(store=cache))
+        sys.stdout.write(result.output)
+        dp, step = result.dp, result.step
+        memo = 'hit' if result.hit else 'miss'
+    elif args.tape:
+        with open_tape(args.tape, args.tape_size) as tape:
+            dp, data, step = execute(prog, sys.stdin, sys.stdout, tape)
+            tape.flush()
+    else:
+        dp, data, step = execute(prog, sys.stdin, sys.stdout)
+    if args.stats:
+        print(f'dp: {dp}, steps: {step}, memo: {memo}', file=sys.stderr)
+    return 0
+
+
+def unpack_main(argv):
+    from . import bfz
+
+    args = build_unpack_parser().parse_args(argv)
+    with open(args.input, 'rb') as file:
+        code = bfz.unpack(file.read())
+    _write_output(args.output, code)
+    return 0
+
+
+def serve_main(argv):
+    from .server import Server, serve_forever
+
+    args = build_serve_parser().parse_args(argv)
+    server = Server(args.max_sessions, args.max_programs, args.max_steps)
     try:
-        source = _read_source(args.input)
-        code = compile_source(source, debug=args.debug)
+        asyncio.run(serve_forever(server, args.unix, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def build_main(argv):
+    from .build import main
+
+    return main(argv)
+
+
+def bench_main(argv):
+    from .bench import main
+
+    return main(argv)
+
+
+COMMANDS = {
+    'bench': bench_main,
+    'build': build_main,
+    'run': run_main,
+    'serve': serve_main,
+    'unpack': unpack_main,
+}
+
+
+def compile_main(argv):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    path = args.socket or daemon.default_socket()
+    if args.watch:
+        from .watch import watch
+
+        if args.input == '-' or args.output == '-':
+            parser.error('--watch needs an input file and an output file.')
+        return watch(args.input, args.output, args.debug, args.run_input, _default_cache(args), optimize=args.optimize)
+    if args.run_input:
+        parser.error('--run-input needs --watch.')
+    if args.daemon:
+        try:
+            asyncio.run(daemon.serve_forever(daemon.Daemon(_default_cache(args)), path))
+        except KeyboardInterrupt:
+            pass
+        return 0
+    source = _read_source(args.input)
+    if args.dump_ir:
+        from .compiler import Compiler
+        from .ir import dump
+
+        compiler = Compiler(source)
+        with _open_output(args.output) as file:
+            dump(compiler.prog, file, args.optimize)
+        return 0
+    # The daemon answers with code only, which has no source map for a .bfz.
+    packed = args.output.endswith('.bfz')
+    code = None if args.no_daemon or packed else daemon.request(path, source, args.debug, optimize=args.optimize)
+    if code is not None:
         _write_output(args.output, code)
-    except (OSError, RuntimeError, SyntaxError, AssertionError, IndexError) as exc:
+        return 0
+    from . import bfz
+    from .compiler import Compiler, compile_folded, compile_source
+
+    cache = _default_cache(args)
+    if packed:
+        with atomic_open(args.output, 'wb') as file:
+            file.write(bfz.dumps(compile_folded(source, debug=args.debug, cache=cache, optimize=args.optimize)))
+        return 0
+    if cache is None:
+        # Nothing needs the whole program at once: stream it to the output.
+        compiler = Compiler(source)
+        with _open_output(args.output) as file:
+            compiler.emit(file, args.debug, optimize=args.optimize)
+        return 0
+    code = compile_source(source, debug=args.debug, cache=cache, optimize=args.optimize)
+    _write_output(args.output, code)
+    return 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in COMMANDS:
+        command, argv = COMMANDS[argv[0]], argv[1:]
+    else:
+        command = compile_main
+    try:
+        return command(argv)
+    except ERRORS as exc:
         print(f'bfcc: error: {exc}', file=sys.stderr)
         return 1
-    return 0
 
 
 if __name__ == '__main__':
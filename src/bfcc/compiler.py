@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+from . import bfz
+from .incremental import StatementCache
 from .lexer import Lexer
 from .parser import Parser
 from .stack_machine import StackMachine
@@ -12,12 +14,60 @@ class Compiler:
         self.tables = []
         self.stackmachine = StackMachine()
 
-    def codegen(self, debug=False):
-        return self.prog.codegen(debug)
+    def codegen(self, debug=False, statements=None, optimize=0):
+        return self.prog.codegen(debug, statements, optimize)
 
+    def emit(self, stream, debug=False, statements=None, optimize=0):
+        self.prog.emit(stream, debug, statements, optimize)
 
-def compile_source(text, debug=False):
-    return Compiler(text).codegen(debug)
+    def folded(self, debug=False, statements=None, optimize=0):
+        return self.prog.folded(debug, statements, optimize)
+
+
+def source_key(cache, text, debug=False, optimize=0):
+    '''Cache key of the code of text. Unoptimized code keeps the keys it had before -O existed.'''
+    if optimize:
+        return cache.key(text, debug=debug, optimize=optimize)
+    return cache.key(text, debug=debug)
+
+
+def compile_source(text, debug=False, cache=None, statements=None, optimize=0):
+    '''Compile text. A CompilationCache keeps whole programs and, unless another
+    StatementCache is given as statements, the code of each top-level statement.
+    optimize is the optimization level, 0 for none.
+
+    Only the code is stored; compile_folded() adds the .bfz of the program
+    to the entry when something asks for it.
+    '''
+    if cache is None:
+        return Compiler(text).codegen(debug, statements, optimize)
+    key = source_key(cache, text, debug, optimize)
+    code = cache.get(key, 'code.bf')
+    if code is not None:
+        return code.decode('utf-8')
+    if statements is None:
+        statements = StatementCache(store=cache)
+    code = Compiler(text).codegen(debug, statements, optimize)
+    cache.put(key, {'code.bf': code.encode('utf-8')})
+    return code
+
+
+def compile_folded(text, debug=False, cache=None, statements=None, optimize=0):
+    '''Compile text into a FoldedProgram, as compile_source() does into code.
+
+    Unless optimized, its source map gives the line of each top-level statement.
+    '''
+    if cache is None:
+        return Compiler(text).folded(debug, statements, optimize)[1]
+    key = source_key(cache, text, debug, optimize)
+    data = cache.get(key, 'code.bfz')
+    if data is not None:
+        return bfz.loads(data)
+    if statements is None:
+        statements = StatementCache(store=cache)
+    code, prog = Compiler(text).folded(debug, statements, optimize)
+    cache.put(key, {'code.bf': code.encode('utf-8'), 'code.bfz': bfz.dumps(prog)})
+    return prog
 
 
 if __name__ == '__main__':
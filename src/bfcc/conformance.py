@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+
+import argparse
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+from .bench import corpus
+from .compiler import compile_source
+from .engine import ENGINES, coroutine, drive, fold
+from .randprog import generate, generate_input
+from .stack_machine import StackMachine
+from .vm import run_source
+
+REFERENCE = 'interpreter'
+MAXSTEPS = 1 << 16
+
+
+def outcome(engine, code, input_string):
+    '''Run code on an engine and return (output, dp, data, step), or the error type.'''
+    ost = io.StringIO()
+    try:
+        dp, data, step = engine(code, io.StringIO(input_string), ost)
+    except Exception as exc:
+        return type(exc).__name__
+    return ost.getvalue(), dp, data, step
+
+
+def source_outcome(source, input_string):
+    '''Run source on the VM and return (output,), or the error type.
+
+    The VM has no tape, so only the output of an engine's outcome() is
+    compared with it; see output_of().
+    '''
+    try:
+        return (run_source(source, input_string),)
+    except Exception as exc:
+        return type(exc).__name__
+
+
+def output_of(result):
+    '''Reduce an outcome() to what source_outcome() reports: (output,), or the error type.'''
+    return result if isinstance(result, str) else result[:1]
+
+
+def compare(code, input_string='', engines=None):
+    '''Return the names of the engines that disagree with the reference interpreter.'''
+    engines = engines or ENGINES
+    expected = outcome(ENGINES[REFERENCE], code, input_string)
+    return [name for name, engine in engines.items() if outcome(engine, code, input_string) != expected]
+
+
+def snippets():
+    '''Yield (name, code, input) exercising every StackMachine operation.'''
+    binary = [
+        'add', 'subtract', 'multiply', 'divide', 'modulo', 'equal', 'notequal',
+        'greater_than', 'less_than', 'greater_or_equal', 'less_or_equal', 'booland', 'boolor',
+    ]
+    for op in binary:
+        for x, y in [(5, 6), (200, 100), (7, 3), (0, 9), (255, 255)]:
+            if op in ['divide', 'modulo'] and y == 0:
+                continue
+            sm = StackMachine()
+            code = sm.load_constant(x) + sm.load_constant(y) + getattr(sm, op)()
+            yield f'{op} {x} {y}', code, ''
+    for op in ['boolean', 'boolnot']:
+        for x in [0, 1, 200]:
+            sm = StackMachine()
+            yield f'{op} {x}', sm.load_constant(x) + getattr(sm, op)(), ''
+
+    sm = StackMachine()
+    code = sm.get_character() + sm.load_variable(0) + sm.put_character() + sm.put_character()
+    yield 'getc putc', code, 'x'
+
+    sm = StackMachine()
+    code = sm.load_constant(5)
+    code += sm.load_variable(0) + sm.begin_while()
+    code += sm.load_variable(0) + sm.load_constant(1) + sm.subtract() + sm.store_variable(0)
+    code += sm.load_constant(ord('*')) + sm.put_character()
+    code += sm.load_variable(0) + sm.end_while()
+    yield 'while', code, ''
+
+    for cond in [0, 3]:
+        sm = StackMachine()
+        code = sm.load_constant(cond) + sm.begin_if()
+        code += sm.load_constant(ord('T')) + sm.put_character()
+        code += sm.begin_else()
+        code += sm.load_constant(ord('F')) + sm.put_character()
+        code += sm.end_if()
+        yield f'if {cond}', code, ''
+
+    shape = [2, 3]
+    sm = StackMachine()
+    code = sm.push_multi_dim_array(shape)
+    pos = sm.dp
+    code += sm.load_constant(ord('m'))
+    code += sm.load_constant(2) + sm.load_constant(1)
+    code += sm.multi_dim_store(pos, shape)
+    code += sm.load_constant(2) + sm.load_constant(1)
+    code += sm.multi_dim_load(pos, shape)
+    code += sm.put_character()
+    yield 'multi dim array', code, ''
+
+    sm = StackMachine()
+    code = sm.load_hex(4, 0x1234) + sm.load_hex(4, 0x0FFF) + sm.subtract_hex(4)
+    yield 'hex', code, ''
+
+
+def random_program(rng, size=40, depth=3):
+    '''Random Brainfuck that starts away from the left edge of the tape.'''
+
+    def block(size, depth):
+        code = ''
+        for _ in range(size):
+            r = rng.random()
+            if r < 0.1 and depth:
+                code += '[' + block(rng.randint(1, max(1, size // 2)), depth - 1) + ']'
+            elif r < 0.15:
+                code += ','
+            elif r < 0.2:
+                code += '.'
+            else:
+                code += rng.choice('+-<>') * rng.randint(1, 4)
+        return code
+
+    return '>' * 8 + block(size, depth)
+
+
+def terminates(code, input_string, max_steps=MAXSTEPS):
+    try:
+        drive(coroutine(fold(code), quantum=256, max_steps=max_steps), io.StringIO(input_string), io.StringIO())
+    except Exception:
+        return False
+    return True
+
+
+def random_cases(count, seed=0, size=40):
+    '''Yield (name, code, input) for terminating random programs that read within their input.'''
+    rng = random.Random(seed)
+    produced = 0
+    while produced < count:
+        code = random_program(rng, size)
+        input_string = ''.join(chr(rng.randint(1, 255)) for _ in range(code.count(',') * 4 + 4))
+        if terminates(code, input_string):
+            produced += 1
+            yield f'random {seed}:{produced}', code, input_string
+
+
+def minimize(code, input_string, fails):
+    '''Shrink code while fails(code, input_string) holds, keeping brackets balanced.'''
+
+    def balanced(code):
+        depth = 0
+        for ch in code:
+            depth += {'[': 1, ']': -1}.get(ch, 0)
+            if depth < 0:
+                return False
+        return depth == 0
+
+    code = ''.join(ch for ch in code if ch in '+-<>.,[]')
+    chunk = len(code) // 2
+    while chunk:
+        i = 0
+        shrunk = False
+        while i < len(code):
+            candidate = code[:i] + code[i + chunk :]
+            if balanced(candidate) and terminates(candidate, input_string) and fails(candidate, input_string):
+                code = candidate
+                shrunk = True
+            else:
+                i += chunk
+        if not shrunk:
+            chunk //= 2
+    return code
+
+
+def check(cases, engines=None, log=None):
+    '''Compare engines on cases. Returns [(name, minimized code, input, engines)] for the mismatches.'''
+    engines = engines or ENGINES
+    failures = []
+    for name, code, input_string in cases:
+        bad = compare(code, input_string, engines)
+        if bad:
+            subset = {engine: engines[engine] for engine in bad}
+            reduced = minimize(code, input_string, lambda c, i: bool(compare(c, i, subset)))
+            failures += [(name, reduced, input_string, bad)]
+            if log:
+                print(f'mismatch: {name} on {", ".join(bad)}; reproducer: {reduced!r} input {input_string!r}', file=log)
+    return failures
+
+
+def check_sources(count, seed=0, statements=20, engines=None, log=None):
+    '''Compare the VM with every engine on generated sources. Returns [(seed, source, engines)].'''
+    engines = engines or ENGINES
+    failures = []
+    for i in range(seed, seed + count):
+        source = generate(i, statements)
+        input_string = generate_input(i)
+        expected = source_outcome(source, input_string)
+        try:
+            code = compile_source(source)
+        except Exception as exc:
+            bad = [] if type(exc).__name__ == expected else list(engines)
+        else:
+            bad = [
+                name for name, engine in engines.items() if output_of(outcome(engine, code, input_string)) != expected
+            ]
+        if bad:
+            failures += [(i, source, bad)]
+            if log:
+                print(f'mismatch: generated source seed {i} on {", ".join(bad)}', file=log)
+    return failures
+
+
+def speed_matrix(cases, engines=None):
+    '''Time every engine on cases. Returns {case: {engine: seconds}}.'''
+    engines = engines or ENGINES
+    matrix = {}
+    for name, code, input_string in cases:
+        matrix[name] = {}
+        for engine_name, engine in engines.items():
+            begin = time.perf_counter()
+            outcome(engine, code, input_string)
+            matrix[name][engine_name] = time.perf_counter() - begin
+    return matrix
+
+
+def format_matrix(matrix):
+    '''Speed of every engine relative to the reference interpreter (higher is faster).'''
+    engines = list(next(iter(matrix.values())))
+    lines = [f'{"case":24}' + ''.join(f'{engine:>14}' for engine in engines)]
+    for name, row in matrix.items():
+        base = row[REFERENCE] if REFERENCE in row else 1.0
+        lines += [f'{name[:24]:24}' + ''.join(f'{base / max(row[e], 1e-9):13.2f}x' for e in engines)]
+    return '\n'.join(lines)
+
+
+def data_cases(data, programs):
+    for name, source, input_name, input_string in corpus(data):
+        if name in programs:
+            yield f'{name}/{input_name}', compile_source(source), input_string
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Check that every engine agrees with the reference interpreter.')
+    parser.add_argument('--data', default='data', help='Corpus directory.')
+    parser.add_argument(
+        '--program', action='append', help='data/ program to include. Repeatable. Defaults to the quick ones.'
+    )
+    parser.add_argument('--random', type=int, default=200, help='Number of random programs.')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed.')
+    parser.add_argument(
+        '--sources', type=int, default=0, help='Number of generated bfcc sources to check against the VM.'
+    )
+    parser.add_argument('--matrix', action='store_true', help='Print the relative speed matrix.')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    programs = args.program or ['for', 'gcd', 'localvariable']
+    cases = list(snippets())
+    if Path(args.data).is_dir():
+        cases += list(data_cases(args.data, programs))
+    cases += list(random_cases(args.random, args.seed))
+    failures = check(cases, log=sys.stdout)
+    print(f'{len(cases) - len(failures)}/{len(cases)} cases agree on {", ".join(ENGINES)}.')
+    if args.sources:
+        engines = {name: engine for name, engine in ENGINES.items() if name != REFERENCE}
+        failures += check_sources(args.sources, args.seed, engines=engines, log=sys.stdout)
+        print(f'{args.sources} generated sources checked against the VM.')
+    if args.matrix:
+        print(format_matrix(speed_matrix([c for c in cases if not c[0].startswith('random')])))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
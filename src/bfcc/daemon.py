@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+import asyncio
+import json
+import os
+import socket
+import tempfile
+from collections import OrderedDict
+
+from . import source_digest
+
+ENV_SOCKET = 'BFCC_DAEMON_SOCKET'
+# Longest request line the daemon and the server read; generated sources and
+# programs such as data/life.bf are well past asyncio's default of 64 KiB.
+LIMIT = 1 << 26
+
+
+def default_socket():
+    '''$BFCC_DAEMON_SOCKET, or bfcc.sock in $XDG_RUNTIME_DIR or in a per-user directory under the temp directory.'''
+    path = os.environ.get(ENV_SOCKET)
+    if path:
+        return path
+    directory = os.environ.get('XDG_RUNTIME_DIR') or os.path.join(tempfile.gettempdir(), f'bfcc-{os.getuid()}')
+    return os.path.join(directory, 'bfcc.sock')
+
+
+def private_directory(directory):
+    '''Create directory with mode 0700, or check that an existing one is only accessible to this user.'''
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    st = os.stat(directory)
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise RuntimeError(f'{directory} must be owned by and only accessible to the current user.')
+
+
+def answers(path, timeout=1):
+    '''Whether something accepts connections on the Unix socket at path.'''
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+    except OSError:
+        return False
+    return True
+
+
+class Daemon:
+    '''Compile server that keeps the compiler modules and results warm.
+
+    Requests and responses are single JSON lines: {"version": ..., "source": ...,
+    "debug": ..., "optimize": ...} is answered with {"code": ...} or {"error": ...}.
+    version is the source_digest() of the client; a daemon running other
+    compiler sources answers {"version": ...} with its own instead.
+    '''
+
+    def __init__(self, cache=None, capacity=1024):
+        self.cache = cache
+        self.capacity = capacity
+        self.memory = OrderedDict()
+        self.version = source_digest()
+
+    def compile(self, source, debug, optimize=0):
+        from .compiler import compile_source
+
+        key = (source, debug, optimize)
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            return self.memory[key]
+        code = compile_source(source, debug=debug, cache=self.cache, optimize=optimize)
+        self.memory[key] = code
+        while len(self.memory) > self.capacity:
+            self.memory.popitem(last=False)
+        return code
+
+    async def handle(self, reader, writer):
+        try:
+            try:
+                request = json.loads(await reader.readline())
+                if request.get('version') != self.version:
+                    response = {'version': self.version}
+                else:
+                    source, debug, optimize = request['source'], bool(request.get('debug')), int(request.get('optimize', 0))
+                    response = {'code': self.compile(source, debug, optimize)}
+            except (ValueError, KeyError, RuntimeError, SyntaxError, AssertionError, IndexError) as exc:
+                response = {'error': str(exc)}
+            writer.write(json.dumps(response).encode('utf-8') + b'\n')
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def start(daemon, path):
+    '''Listen on path, in a directory only this user can access.
+
+    A socket left behind by a daemon that died is replaced, but not one that
+    another daemon still answers on.
+    '''
+    private_directory(os.path.dirname(os.path.abspath(path)))
+    if os.path.exists(path):
+        if answers(path):
+            raise RuntimeError(f'A daemon is already serving {path}.')
+        os.unlink(path)
+    return await asyncio.start_unix_server(daemon.handle, path=path, limit=LIMIT)
+
+
+async def serve_forever(daemon, path):
+    async with await start(daemon, path) as listener:
+        try:
+            await listener.serve_forever()
+        finally:
+            if os.path.exists(path):
+                os.unlink(path)
+
+
+def request(path, source, debug=False, timeout=30, optimize=0):
+    '''Compile through a running daemon.
+
+    Returns None if no daemon of this user answers, or if it runs other
+    compiler sources, so the caller compiles in process instead.
+    '''
+    try:
+        if os.stat(path).st_uid != os.getuid():
+            return None
+        message = {'version': source_digest(), 'source': source, 'debug': debug, 'optimize': optimize}
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+            chunks = []
+            while chunk := sock.recv(1 << 16):
+                chunks += [chunk]
+    except OSError:
+        return None
+    try:
+        response = json.loads(b''.join(chunks))
+    except ValueError:
+        return None
+    if 'error' in response:
+        raise RuntimeError(response['error'])
+    return response.get('code')
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+import contextlib
+import os
+import tempfile
+
+
+class LineWriter:
+    '''Write Brainfuck code to a text stream in lines of width characters.
+
+    Chunks of any size can be written. They are buffered up to about
+    buffer_size characters and flushed as whole lines, so the program is never
+    held in full and re-sliced. close() writes the last partial line.
+    '''
+
+    def __init__(self, stream, width=80, buffer_size=1 << 16):
+        self.stream = stream
+        self.width = width
+        self.buffer_size = buffer_size
+        self.pending = []
+        self.length = 0
+
+    def write(self, chunk):
+        self.pending.append(chunk)
+        self.length += len(chunk)
+        if self.length >= self.buffer_size:
+            self.flush()
+
+    def flush(self, final=False):
+        text = ''.join(self.pending)
+        end = len(text) if final else len(text) - len(text) % self.width
+        width = self.width
+        self.stream.write(''.join(text[i : i + width] + '\n' for i in range(0, end, width)))
+        self.pending = [text[end:]]
+        self.length = len(text) - end
+
+    def close(self):
+        self.flush(final=True)
+
+
+def _umask():
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+@contextlib.contextmanager
+def atomic_open(path, mode='w'):
+    '''Open a temporary file next to path that replaces path once the block succeeds.
+
+    Readers see either the old file or the complete new one, and a failure
+    leaves the old file untouched.
+    '''
+    fd, tmp = tempfile.mkstemp(prefix='.bfcc-', dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with open(fd, mode, encoding=None if 'b' in mode else 'utf-8') as file:
+            yield file
+        os.chmod(tmp, 0o666 & ~_umask())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+
+import asyncio
+import hashlib
+import sys
+from collections import deque
+
+from .interpreter import CHARS, TAPESIZE, interpreter
+
+COMMANDS = '+-<>.,[]@'
+QUANTUM = 1 << 14
+
+
+class FoldedProgram:
+    '''Run-length-folded Brainfuck with a precomputed jump table.
+
+    ops[i] is a (command, count) pair. Runs of the same command are folded,
+    except brackets, which always have a count of 1. jumps[i] is the index of
+    the matching bracket for a bracket op and 0 otherwise.
+    '''
+
+    def __init__(self, ops, jumps, source_map=None):
+        self.ops = ops
+        self.jumps = jumps
+        self.source_map = source_map or []
+
+    def commands(self):
+        return ''.join(cmd * count for cmd, count in self.ops)
+
+    def digest(self):
+        return hashlib.sha256(self.commands().encode('ascii')).hexdigest()
+
+
+def fold(rawprog, marks=()):
+    '''Fold Brainfuck code into a FoldedProgram.
+
+    marks are ascending (offset, line) pairs, where offset counts commands
+    only. They become the source map as (index of the op holding that
+    command, line). rawprog is a str or a bytes-like object, which is read in
+    place.
+    '''
+    ops = []
+    jumps = []
+    stack = []
+    chars = rawprog if isinstance(rawprog, str) else map(CHARS.__getitem__, memoryview(rawprog))
+    for ch in chars:
+        if ch not in COMMANDS:
+            continue
+        if ch in '[]':
+            if ch == '[':
+                stack += [len(ops)]
+                jumps += [0]
+            else:
+                if not stack:
+                    raise SyntaxError(f'Unmatched "]" at op {len(ops)}.')
+                begin = stack.pop()
+                jumps[begin] = len(ops)
+                jumps += [begin]
+            ops += [(ch, 1)]
+        elif ops and ops[-1][0] == ch:
+            ops[-1] = (ch, ops[-1][1] + 1)
+        else:
+            ops += [(ch, 1)]
+            jumps += [0]
+    if stack:
+        raise SyntaxError(f'Unmatched "[" at op {stack[-1]}.')
+    return FoldedProgram(ops, jumps, _source_map(ops, marks))
+
+
+def _source_map(ops, marks):
+    source_map = []
+    marks = iter(marks)
+    mark = next(marks, None)
+    end = 0
+    for index, (_, count) in enumerate(ops):
+        if mark is None:
+            break
+        end += count
+        while mark is not None and mark[0] < end:
+            source_map += [(index, mark[1])]
+            mark = next(marks, None)
+    return source_map
+
+
+def execute(prog, ist=sys.stdin, ost=sys.stdout, tape=None):
+    '''Run a FoldedProgram. The result and step count match interpreter().'''
+    ops = prog.ops
+    jumps = prog.jumps
+    ip = 0
+    dp = 0
+    maxdp = 0
+    data = [0] * TAPESIZE if tape is None else tape
+    size = len(data)
+    step = 0
+    while ip < len(ops):
+        cmd, count = ops[ip]
+        if cmd == '@':  # breakpoint
+            return dp, list(data[0 : maxdp + 1]), step
+        step += count
+        if cmd == '+':
+            data[dp] = (data[dp] + count) & 0xFF
+        elif cmd == '-':
+            data[dp] = (data[dp] - count) & 0xFF
+        elif cmd == '>':
+            dp += count
+            if dp >= size:
+                raise IndexError(f'data pointer out of range. (dp, ip, step) = ({dp}, {ip}, {step})')
+            maxdp = max(maxdp, dp)
+        elif cmd == '<':
+            dp -= count
+            if dp < 0:
+                raise IndexError(f'data pointer out of range. (dp, ip, step) = ({dp}, {ip}, {step})')
+        elif cmd == '[':
+            if data[dp] == 0:
+                ip = jumps[ip]
+        elif cmd == ']':
+            if data[dp] != 0:
+                ip = jumps[ip]
+        elif cmd == '.':
+            print(chr(data[dp]) * count, end='', file=ost, flush=True)
+        else:  # cmd == ','
+            for _ in range(count):
+                ch = ist.read(1)
+                if not ch:
+                    raise EOFError('end of input')
+                data[dp] = ord(ch)
+        ip += 1
+    return dp, list(data[0 : maxdp + 1]), step
+
+
+def coroutine(prog, tape=None, quantum=QUANTUM, max_steps=None):
+    '''Generator version of execute() for streaming and cooperative I/O.
+
+    Yields output chunks (possibly empty) at least every quantum ops and before
+    waiting for input, and yields None while it needs input. Input is given
+    with send(); any string sent is appended to the input buffer, and sending
+    '' while input is needed signals end of input. The generator returns the
+    same (dp, data, step) as execute(). With max_steps, a RuntimeError is
+    raised at the first quantum boundary past that many steps.
+    '''
+    ops = prog.ops
+    jumps = prog.jumps
+    ip = 0
+    dp = 0
+    maxdp = 0
+    data = [0] * TAPESIZE if tape is None else tape
+    size = len(data)
+    step = 0
+    out = []
+    pending = deque()  # input received but not read yet, one character each
+    budget = quantum
+    while ip < len(ops):
+        budget -= 1
+        if not budget:
+            budget = quantum
+            if max_steps is not None and step > max_steps:
+                raise RuntimeError(f'step limit exceeded. (dp, ip, step) = ({dp}, {ip}, {step})')
+            received = yield ''.join(out)
+            out = []
+            if received:
+                pending.extend(received)
+        cmd, count = ops[ip]
+        if cmd == '@':  # breakpoint
+            break
+        step += count
+        if cmd == '+':
+            data[dp] = (data[dp] + count) & 0xFF
+        elif cmd == '-':
+            data[dp] = (data[dp] - count) & 0xFF
+        elif cmd == '>':
+            dp += count
+            if dp >= size:
+                raise IndexError(f'data pointer out of range. (dp, ip, step) = ({dp}, {ip}, {step})')
+            maxdp = max(maxdp, dp)
+        elif cmd == '<':
+            dp -= count
+            if dp < 0:
+                raise IndexError(f'data pointer out of range. (dp, ip, step) = ({dp}, {ip}, {step})')
+        elif cmd == '[':
+            if data[dp] == 0:
+                ip = jumps[ip]
+        elif cmd == ']':
+            if data[dp] != 0:
+                ip = jumps[ip]
+        elif cmd == '.':
+            out += [chr(data[dp]) * count]
+        else:  # cmd == ','
+            for _ in range(count):
+                if not pending and out:
+                    received = yield ''.join(out)
+                    out = []
+                    if received:
+                        pending.extend(received)
+                while not pending:
+                    received = yield None
+                    if received == '':
+                        raise EOFError('end of input')
+                    if received:
+                        pending.extend(received)
+                data[dp] = ord(pending.popleft())
+        ip += 1
+    if out:
+        yield ''.join(out)
+    return dp, list(data[0 : maxdp + 1]), step
+
+
+async def execute_async(prog, read, write, tape=None, quantum=QUANTUM, max_steps=None):
+    '''Drive coroutine() from asyncio.
+
+    read is an async callable returning more input ('' at end of input) and
+    write is an async callable taking an output chunk. Control goes back to the
+    event loop every quantum ops, so one loop can serve many programs.
+    '''
+    gen = coroutine(prog, tape, quantum, max_steps)
+    value = None
+    try:
+        while True:
+            chunk = gen.send(value)
+            value = None
+            if chunk is None:
+                value = await read()
+            else:
+                if chunk:
+                    await write(chunk)
+                await asyncio.sleep(0)
+    except StopIteration as stop:
+        return stop.value
+
+
+def drive(gen, ist=sys.stdin, ost=sys.stdout):
+    '''Run a coroutine() generator to completion with blocking streams.'''
+    value = None
+    try:
+        while True:
+            chunk = gen.send(value)
+            value = None
+            if chunk is None:
+                value = ist.read(1)
+            elif chunk:
+                print(chunk, end='', file=ost, flush=True)
+    except StopIteration as stop:
+        return stop.value
+
+
+def run_interpreter(code, ist=sys.stdin, ost=sys.stdout):
+    return interpreter(code, ist, ost)
+
+
+def run_folded(code, ist=sys.stdin, ost=sys.stdout):
+    return execute(fold(code), ist, ost)
+
+
+def run_coroutine(code, ist=sys.stdin, ost=sys.stdout):
+    return drive(coroutine(fold(code)), ist, ost)
+
+
+# Every engine, called as engine(code, ist, ost) -> (dp, data, step).
+ENGINES = {
+    'interpreter': run_interpreter,
+    'folded': run_folded,
+    'coroutine': run_coroutine,
+}
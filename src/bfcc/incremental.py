@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+import json
+from bisect import bisect_left
+from collections import OrderedDict
+
+from .lexer import Token, TokenInfo, tokenize
+
+
+def _common_prefix(a, b):
+    '''Length of the longest common prefix of a and b, compared in slices.'''
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[low:mid] == b[low:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _common_suffix(a, b, limit):
+    low, high = 0, min(len(a), len(b), limit)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[len(a) - mid : len(a) - low] == b[len(b) - mid : len(b) - low]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+class TokenCache:
+    '''Re-lex only the edited region of a source that changed since the last call.
+
+    Token boundaries are the only lexer state, so tokens ending before the
+    first changed character are kept, lexing restarts after the last of them,
+    and it stops again as soon as it reaches the start of an old token in the
+    unchanged tail, whose tokens are reused with shifted offsets and lines.
+    relexed is the number of tokens lexed by the last call.
+    '''
+
+    def __init__(self):
+        self.text = ''
+        self.tokens = []
+        self.starts = []
+        self.ends = []
+        self.eof = 0
+        self.relexed = 0
+
+    def lex(self, text):
+        '''Return the tokens of text, ending with an EOF token.'''
+        old = self.text
+        prefix = _common_prefix(old, text)
+        suffix = _common_suffix(old, text, min(len(old), len(text)) - prefix)
+        keep = bisect_left(self.ends, prefix)
+        pos = self.ends[keep - 1] if keep else 0
+        line = self.tokens[keep - 1].line if keep else 0
+        tokens, starts, ends = self.tokens[:keep], self.starts[:keep], self.ends[:keep]
+        delta = len(text) - len(old)
+        tail = len(text) - suffix
+        spans = []
+        eof = None
+        for token in tokenize(text, pos, line, spans):
+            if token.type == Token.EOF:
+                eof = token.line
+                break
+            start, end = spans[-1]
+            if start >= tail:
+                index = bisect_left(self.starts, start - delta)
+                if index < len(self.starts) and self.starts[index] == start - delta:
+                    shift = token.line - self.tokens[index].line
+                    tokens += [t if not shift else t._replace(line=t.line + shift) for t in self.tokens[index:]]
+                    starts += [s + delta for s in self.starts[index:]]
+                    ends += [e + delta for e in self.ends[index:]]
+                    eof = self.eof + shift
+                    break
+            tokens.append(token)
+            starts.append(start)
+            ends.append(end)
+        self.relexed = len(spans)
+        self.text, self.tokens, self.starts, self.ends, self.eof = text, tokens, starts, ends, eof
+        return tokens + [TokenInfo(Token.EOF, None, eof, None)]
+
+
+class StatementCache:
+    '''Memoize the code of top-level statements.
+
+    The code of a top-level statement depends only on its tokens, the stack
+    depth (dp) it starts at, the position and shape of the outer symbols it
+    uses, the debug flag and the optimization level, so those make the key.
+    The value is the code and the dp after the statement. Entries live in an in-memory LRU and, when a
+    CompilationCache is given as store, on disk as well. An edit then only
+    regenerates the statements it touches, plus the ones after a changed
+    declaration, because their dp or symbol positions shift.
+    '''
+
+    def __init__(self, capacity=4096, store=None):
+        self.capacity = capacity
+        self.store = store
+        self.memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, source, dp, references, debug, optimize=0):
+        return (source, dp, tuple(references), bool(debug), optimize)
+
+    def _store_key(self, key):
+        source, dp, references, debug, optimize = key
+        options = {'optimize': optimize} if optimize else {}
+        return self.store.key(source, dp=dp, references=references, debug=debug, statement=True, **options)
+
+    def get(self, key):
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.hits += 1
+            return self.memory[key]
+        if self.store is not None:
+            data = self.store.get(self._store_key(key), 'statement.json')
+            if data is not None:
+                value = json.loads(data)
+                value = (value['code'], value['dp'])
+                self._remember(key, value)
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def put(self, key, code, dp):
+        self._remember(key, (code, dp))
+        if self.store is not None:
+            data = json.dumps({'code': code, 'dp': dp}).encode('utf-8')
+            self.store.put(self._store_key(key), {'statement.json': data})
+
+    def _remember(self, key, value):
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.capacity:
+            self.memory.popitem(last=False)
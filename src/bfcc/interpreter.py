@@ -1,70 +1,136 @@
 #!/usr/bin/env python3
 
+import argparse
+import mmap
+import os
 import sys
 
 DUMPRANGE = 20
+TAPESIZE = 1 << 16
+# Each byte value of a mapped program as the character it stands for.
+CHARS = tuple(map(chr, range(256)))
 
 
-def interpreter(rawprog, ist=sys.stdin, ost=sys.stdout, dump=False):
-    prog = ''.join([ch for ch in rawprog if ch != '\n'])
+def open_tape(path, size=TAPESIZE):
+    '''Back the tape with a memory-mapped file of size zero-filled bytes.
+
+    Whatever the file held before is discarded, so every run starts on a
+    blank tape. The OS pages cold regions in and out on demand, and the final
+    tape state stays in the file after the run.
+    '''
+    with open(path, 'w+b') as file:
+        file.truncate(size)
+        return mmap.mmap(file.fileno(), size)
+
+
+def load_program(path):
+    '''Map a program file into memory read-only.
+
+    interpreter() and engine.fold() read the mapped bytes in place, so the
+    program is never copied whole and the OS pages it in as it is read.
+    '''
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def interpreter(rawprog, ist=sys.stdin, ost=sys.stdout, dump=False, tape=None):
+    '''Run rawprog, a str or a bytes-like object such as load_program() returns.
+
+    Newlines are dropped from a str before it runs. Bytes are read in place
+    instead, so ip counts their newlines too.
+    '''
+    text = isinstance(rawprog, str)
+    prog = rawprog.replace('\n', '') if text else rawprog
     ip = 0
     dp = 0
     maxdp = 0
-    data = [0] * (1 << 16)
+    data = [0] * TAPESIZE if tape is None else tape
     step = 0
     while ip < len(prog):
-        step += prog[ip] in '+-<>.,[]'
+        cmd = prog[ip] if text else CHARS[prog[ip]]
+        step += cmd in '+-<>.,[]'
         if dump:
-            print(prog[max(0, ip - DUMPRANGE) : ip + DUMPRANGE + 1])
+            window = prog[max(0, ip - DUMPRANGE) : ip + DUMPRANGE + 1]
+            print(window if text else window.decode('ascii', errors='replace'))
             print(' ' * (min(DUMPRANGE, ip)) + '^')
-            print(f'inst: {prog[ip]}')
+            print(f'inst: {cmd}')
             print(f'ip  : {ip}')
-            print(f'data: {data[0 : maxdp + 1]}')
+            print(f'data: {list(data[0 : maxdp + 1])}')
             print(f'dp  : {dp}')
             print()
-        if prog[ip] == '>':
+        if cmd == '>':
             dp += 1
             maxdp = max(maxdp, dp)
             if dp >= len(data):
                 raise IndexError(f'data pointer out of range. (dp, ip, step) = ({dp}, {ip}, {step})')
-        elif prog[ip] == '<':
+        elif cmd == '<':
             dp -= 1
             if dp < 0:
                 raise IndexError(f'data pointer out of range. (dp, ip, step) = ({dp}, {ip}, {step})')
-        elif prog[ip] == '+':
+        elif cmd == '+':
             data[dp] = (data[dp] + 1) & 0xFF
-        elif prog[ip] == '-':
+        elif cmd == '-':
             data[dp] = (data[dp] - 1) & 0xFF
-        elif prog[ip] == '.':
+        elif cmd == '.':
             print(chr(data[dp]), end='', file=ost, flush=True)
-        elif prog[ip] == ',':
-            data[dp] = ord(ist.read(1))
-        elif prog[ip] == '[':
+        elif cmd == ',':
+            ch = ist.read(1)
+            if not ch:
+                raise EOFError('end of input')
+            data[dp] = ord(ch)
+        elif cmd == '[':
             if data[dp] == 0:
                 cnt = 1
                 while cnt:
                     ip += 1
-                    if prog[ip] == '[':
+                    cmd = prog[ip] if text else CHARS[prog[ip]]
+                    if cmd == '[':
                         cnt += 1
                         maxdp = max(maxdp, dp)
-                    elif prog[ip] == ']':
+                    elif cmd == ']':
                         cnt -= 1
-        elif prog[ip] == ']':
+        elif cmd == ']':
             if data[dp] != 0:
                 cnt = 1
                 while cnt:
                     ip -= 1
-                    if prog[ip] == ']':
+                    cmd = prog[ip] if text else CHARS[prog[ip]]
+                    if cmd == ']':
                         cnt += 1
                         maxdp = max(maxdp, dp)
-                    elif prog[ip] == '[':
+                    elif cmd == '[':
                         cnt -= 1
-        elif prog[ip] == '@':  # breakpoint
-            return dp, data[0 : maxdp + 1], step
+        elif cmd == '@':  # breakpoint
+            return dp, list(data[0 : maxdp + 1]), step
         ip += 1
-    return dp, data[0 : maxdp + 1], step
+    return dp, list(data[0 : maxdp + 1]), step
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Run a Brainfuck program.')
+    parser.add_argument('program', help='Brainfuck (.bf or .bfz) program file path.')
+    parser.add_argument('--tape', help='Back the tape with this file through mmap. It keeps the final tape state.')
+    parser.add_argument('--tape-size', type=int, default=TAPESIZE, help='Number of tape cells.')
+    return parser
 
 
 if __name__ == '__main__':
-    with open(sys.argv[1]) as f:
-        print(interpreter(rawprog=f.read()))
+    args = build_parser().parse_args()
+    if args.program.endswith('.bfz'):
+        # Run the folded ops as they are stored instead of parsing text again.
+        from .bfz import load
+        from .engine import execute
+
+        prog = load(args.program)
+        run = execute
+    else:
+        prog = load_program(args.program)
+        run = interpreter
+    if args.tape:
+        with open_tape(args.tape, args.tape_size) as tape:
+            print(run(prog, tape=tape))
+            tape.flush()
+    else:
+        print(run(prog))
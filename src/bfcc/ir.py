@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+
+from .stack_machine import StackMachine
+
+# Op names, as in the debug output, and the StackMachine methods lowering them.
+METHODS = {
+    'lc': 'load_constant',
+    'lv': 'load_variable',
+    'sv': 'store_variable',
+    'add': 'add',
+    'sub': 'subtract',
+    'mul': 'multiply',
+    'div': 'divide',
+    'mod': 'modulo',
+    'bool': 'boolean',
+    'not': 'boolnot',
+    'eq': 'equal',
+    'neq': 'notequal',
+    'gt': 'greater_than',
+    'lt': 'less_than',
+    'ge': 'greater_or_equal',
+    'le': 'less_or_equal',
+    'or': 'boolor',
+    'and': 'booland',
+    'putc': 'put_character',
+    'getc': 'get_character',
+    'beginwhile': 'begin_while',
+    'endwhile': 'end_while',
+    'beginif': 'begin_if',
+    'beginelse': 'begin_else',
+    'endif': 'end_if',
+    'la': 'load_address',
+    'sa': 'store_address',
+    'pop': 'pop',
+    'initarr': 'push_array',
+    'clean': 'clean',
+    'puta': 'put_array',
+    'mdarr': 'push_multi_dim_array',
+    'mdl': 'multi_dim_load',
+    'mds': 'multi_dim_store',
+    'mdp': 'multi_dim_put',
+    'loadhex': 'load_hex',
+    'addhex': 'add_hex',
+    'invhex': 'inv_hex',
+    'subhex': 'subtract_hex',
+    'incv': 'increment_variable',
+    'setv': 'store_constant',
+    'cpv': 'copy_variable',
+}
+NAMES = {method: name for name, method in METHODS.items()}
+
+OPENERS = {'beginwhile', 'beginif'}
+CLOSERS = {'endwhile', 'endif'}
+
+
+def array_size(shape):
+    '''Number of cells push_multi_dim_array(shape) pushes.'''
+    size = shape[-1] + 4
+    for dim in reversed(shape[:-1]):
+        size = dim * (size + 1)
+    return size
+
+
+# Change of dp made by each op that is not a control op, as a number or as a
+# function of the op's arguments.
+STACK_EFFECTS = {
+    'lc': 1,
+    'lv': 1,
+    'sv': -1,
+    'add': -1,
+    'sub': -1,
+    'mul': -1,
+    'div': -1,
+    'mod': -1,
+    'bool': 0,
+    'not': 0,
+    'eq': -1,
+    'neq': -1,
+    'gt': -1,
+    'lt': -1,
+    'ge': -1,
+    'le': -1,
+    'or': -1,
+    'and': -1,
+    'putc': -1,
+    'getc': 1,
+    'la': 0,
+    'sa': -2,
+    'pop': lambda amount: -amount,
+    'initarr': lambda size: size + 4,
+    'clean': 0,
+    'puta': 0,
+    'mdarr': array_size,
+    'mdl': lambda pos, shape: 1 - len(shape),
+    'mds': lambda pos, shape: -len(shape) - 1,
+    'mdp': lambda pos, shape: 1 - len(shape),
+    'loadhex': lambda length, num: length,
+    'addhex': lambda length: -length,
+    'invhex': 0,
+    'subhex': lambda length: -length,
+    'incv': 0,
+    'setv': 0,
+    'cpv': 0,
+}
+
+
+class Op:
+    '''One StackMachine operation.
+
+    name is the op name, args the arguments of its StackMachine method and dp
+    the stack depth before it. Its code is only generated by lower().
+    '''
+
+    __slots__ = ('name', 'args', 'dp')
+
+    def __init__(self, name, args, dp):
+        self.name = name
+        self.args = args
+        self.dp = dp
+
+    def __repr__(self):
+        return f'Op({self.name!r}, {self.args!r}, {self.dp!r})'
+
+    def __str__(self):
+        args = [' '.join(map(str, arg)) if isinstance(arg, list) else str(arg) for arg in self.args]
+        return ' '.join([self.name] + args)
+
+
+class Recorder:
+    '''Stand-in for StackMachine in codegen whose methods return Ops instead of code.
+
+    It keeps dp and controlstack as StackMachine would, from the stack effect
+    of each op, without generating any code.
+    '''
+
+    def __init__(self):
+        self.dp = 0
+        self.controlstack = []
+
+    def __getattr__(self, method):
+        if method not in NAMES:
+            raise AttributeError(method)
+        name = NAMES[method]
+
+        def record(*args):
+            *args, debug = args
+            op = Op(name, tuple(args), self.dp)
+            self.apply(op)
+            return op
+
+        setattr(self, method, record)
+        return record
+
+    def apply(self, op):
+        '''Move dp and controlstack past op.'''
+        name = op.name
+        if name == 'beginwhile':
+            self.controlstack += [('while', self.dp)]
+            self.dp -= 1
+        elif name == 'beginif':
+            self.controlstack += [('if', self.dp)]
+            self.dp += 1
+        elif name == 'beginelse':
+            _, dp = self.controlstack.pop()
+            self.controlstack += [('else', dp)]
+            self.dp = dp + 1
+        elif name in CLOSERS:
+            _, dp = self.controlstack.pop()
+            self.dp = dp - 1
+        else:
+            effect = STACK_EFFECTS[name]
+            self.dp += effect(*op.args) if callable(effect) else effect
+
+
+def lowered(ops, debug=False):
+    '''Yield the Brainfuck code of each op.
+
+    The ops are generated in order on one StackMachine, so each of them is
+    lowered knowing the loops it is in.
+    '''
+    sm = StackMachine()
+    for op in ops:
+        sm.dp = op.dp
+        yield getattr(sm, METHODS[op.name])(*op.args, debug)
+
+
+def lower(ops, debug=False):
+    '''Return the Brainfuck code of ops.'''
+    return ''.join(lowered(ops, debug))
+
+
+def in_place_arithmetic(ops):
+    '''lv x; lc c; add; sv x  ->  incv x c, and the same with sub and -c.
+
+    x += c and x = x + c then add to x where it is instead of copying it to
+    the top of the stack and back.
+    '''
+    out = []
+    for op in ops:
+        out.append(op)
+        if op.name == 'sv' and len(out) >= 4:
+            load, constant, arithmetic = out[-4:-1]
+            if (
+                load.name == 'lv'
+                and constant.name == 'lc'
+                and arithmetic.name in ('add', 'sub')
+                and load.args == op.args
+            ):
+                value = constant.args[0] if arithmetic.name == 'add' else -constant.args[0]
+                out[-4:] = [Op('incv', (op.args[0], value), load.dp)]
+    return out if len(out) != len(ops) else ops
+
+
+def constant_store(ops):
+    '''lc c; sv x  ->  setv x c, which sets x in place.
+
+    When x was pushed as 0 right before, as in var x = c, lc 0; setv x c is
+    just lc c.
+    '''
+    out = []
+    for op in ops:
+        out.append(op)
+        if op.name == 'sv' and len(out) >= 2 and out[-2].name == 'lc':
+            constant = out[-2]
+            pos = op.args[0]
+            if len(out) >= 3 and out[-3].name == 'lc' and out[-3].args == (0,) and out[-3].dp == pos:
+                out[-3:] = [Op('lc', constant.args, pos)]
+            else:
+                out[-2:] = [Op('setv', (pos, constant.args[0]), constant.dp)]
+    return out if len(out) != len(ops) else ops
+
+
+def direct_copy(ops):
+    '''lv y; sv x  ->  cpv y x, which copies y into x without going through the stack top.'''
+    out = []
+    for op in ops:
+        out.append(op)
+        if op.name == 'sv' and len(out) >= 2 and out[-2].name == 'lv' and out[-2].args != op.args:
+            load = out[-2]
+            out[-2:] = [Op('cpv', (load.args[0], op.args[0]), load.dp)]
+    return out if len(out) != len(ops) else ops
+
+
+class PassManager:
+    '''Run op-level passes over a list of Ops until none of them changes it.
+
+    A pass takes a list of Ops and returns the rewritten list, or the same
+    list object when it has nothing to rewrite.
+    '''
+
+    def __init__(self, passes=()):
+        self.passes = list(passes)
+
+    def __bool__(self):
+        return bool(self.passes)
+
+    def run(self, ops):
+        changed = True
+        while changed:
+            changed = False
+            for rewrite in self.passes:
+                result = rewrite(ops)
+                if result is not ops:
+                    ops = result
+                    changed = True
+        return ops
+
+
+# Passes of each optimization level.
+LEVELS = {
+    0: [],
+    1: [in_place_arithmetic, constant_store, direct_copy],
+}
+
+
+def pass_manager(level=0):
+    return PassManager(LEVELS[min(level, max(LEVELS))])
+
+
+def dump(program, stream, optimize=0):
+    '''Write the ops of every top-level statement of program, indented by control depth.'''
+    for statement, ops in program.operations(optimize):
+        stream.write(f'// {str(statement).strip().splitlines()[0]}\n')
+        depth = 0
+        for op in ops:
+            if op.name in CLOSERS or op.name == 'beginelse':
+                depth -= 1
+            stream.write(f'{"    " * depth}{op}\n')
+            if op.name in OPENERS or op.name == 'beginelse':
+                depth += 1
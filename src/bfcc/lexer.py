@@ -2,7 +2,9 @@
 
 import re
 import sys
+from collections import deque
 from enum import IntEnum, auto
+from typing import NamedTuple
 
 
 class Token(IntEnum):
@@ -46,160 +48,155 @@ class Token(IntEnum):
     EOF = auto()  # end of file
 
 
-class Lexer:
-    def __init__(self, string):
-        self.string = self.ignore_comments(string)
-        self.pos = 0
-        self.readingpos = 0
-        self.tokens = []
-        self.linecount = 0
-        self.analyze()
-
-    def ignore_comments(self, string):
-        state = 'program'
-        pos = 0
-        result = ''
-        while pos < len(string):
-            if state == 'program':
-                if string[pos : pos + 2] == '//':
-                    state = 'line_comment'
-                    pos += 1
-                elif string[pos : pos + 2] == '/*':
-                    state = 'block_comment'
-                    pos += 1
-                else:
-                    result += string[pos]
-            elif state == 'line_comment':
-                if string[pos : pos + 1] == '\n':
-                    state = 'program'
-            else: # state == 'block_comment'
-                if string[pos : pos + 2] == '*/':
-                    state = 'program'
-                    pos += 1
-            pos += 1
-        if state == 'block_comment':
+class TokenInfo(NamedTuple):
+    type: Token
+    val: int | None
+    line: int
+    token: str | None
+
+
+KEYWORDS = {
+    'while': Token.KW_WHILE,
+    'if': Token.KW_IF,
+    'else': Token.KW_ELSE,
+    'for': Token.KW_FOR,
+    'var': Token.KW_VAR,
+    'arr': Token.KW_ARR,
+}
+
+OPERATORS = {
+    '&': Token.AND,
+    '|': Token.OR,
+    '!': Token.NOT,
+    '+': Token.PLUS,
+    '-': Token.MINUS,
+    '*': Token.STAR,
+    '/': Token.SLASH,
+    '%': Token.PERCENT,
+    '=': Token.ASSIGN,
+    '+=': Token.ADDASSIGN,
+    '-=': Token.SUBASSIGN,
+    '*=': Token.MULASSIGN,
+    '/=': Token.DIVASSIGN,
+    '%=': Token.MODASSIGN,
+    '==': Token.EQ,
+    '!=': Token.NEQ,
+    '>': Token.GT,
+    '>=': Token.GE,
+    '<': Token.LT,
+    '<=': Token.LE,
+    ',': Token.COMMA,
+    ';': Token.SEMICOLON,
+    '(': Token.LPAREN,
+    ')': Token.RPAREN,
+    '{': Token.LBRACE,
+    '}': Token.RBRACE,
+    '[': Token.LBRACK,
+    ']': Token.RBRACK,
+}
+
+ESCAPES = {'a': 7, 'b': 8, 'f': 12, 'n': 10, 'r': 13, 't': 9, 'v': 11, "'": 39, '"': 34, '\\': 92, '?': 63}
+
+PATTERN = re.compile(
+    r'''
+      (?P<newline>\n)
+    | (?P<space>[ \t\r]+)
+    | (?P<line_comment>//[^\n]*)
+    | (?P<block_comment>/\*.*?\*/)
+    | (?P<unclosed_comment>/\*)
+    | (?P<bad_number>\d+[a-zA-Z_]+)
+    | (?P<id>[a-zA-Z_][a-zA-Z0-9_]*)
+    | (?P<int>\d+)
+    | '(?P<char>[^'\\]|\\[abfnrtv'"\\?0-7]|\\x[0-9A-Fa-f]{1,2})'
+    | (?P<op>[+\-*/%=!<>]=|[&|!+\-*/%=<>,;(){}\[\]])
+    ''',
+    re.VERBOSE | re.DOTALL,
+)
+
+
+def unescape(body):
+    if body[0] != '\\':
+        return ord(body)
+    elif body[1] == 'x':
+        return int(body[2:], 16)
+    elif body[1] in '01234567':
+        return int(body[1], 8)
+    else:
+        return ESCAPES[body[1]]
+
+
+def tokenize(string, pos=0, linecount=0, spans=None):
+    '''Yield the TokenInfo of string lazily, ending with an EOF token.
+
+    Lexing starts at offset pos, which must not be inside a token or comment,
+    on line linecount. If spans is a list, the (start, end) offsets of every
+    token but EOF are appended to it.
+    '''
+    while match := PATTERN.match(string, pos):
+        kind = match.lastgroup
+        head = match.group()
+        pos = match.end()
+        if kind == 'newline':
+            linecount += 1
+            continue
+        elif kind == 'space' or kind == 'line_comment':
+            continue
+        elif kind == 'block_comment':
+            linecount += head.count('\n')
+            continue
+        elif kind == 'unclosed_comment':
             raise SyntaxError('A block comment is not closing.')
-        return result
-
-    def skipspace(self):
-        while self.pos < len(self.string) and self.string[self.pos] in ' \n\t\r':
-            if self.string[self.pos] == '\n':
-                self.linecount += 1
-            self.pos += 1
-
-    def get(self):
-        if match := re.match(r'^([a-zA-Z_][a-zA-Z0-9_]*)', self.string[self.pos :]):
-            head = match.group(1)
-            self.pos += len(head)
-            if head in ['while', 'if', 'else', 'for', 'var', 'arr']:
-                t = {
-                    'while': Token.KW_WHILE,
-                    'if': Token.KW_IF,
-                    'else': Token.KW_ELSE,
-                    'for': Token.KW_FOR,
-                    'var': Token.KW_VAR,
-                    'arr': Token.KW_ARR,
-                }[head]
-                return {
-                    'type': t,
-                    'val': None,
-                    'line': self.linecount,
-                    'token': head,
-                }
-            else:
-                return {
-                    'type': Token.ID,
-                    'val': None,
-                    'line': self.linecount,
-                    'token': head,
-                }
-        elif match := re.match(r'^(\d+[a-zA-Z_]+)', self.string[self.pos :]):
-            raise RuntimeError(f'Undefined token at line {self.linecount}: {match.group(1)}')
-        elif match := re.match(r'^(\d+)', self.string[self.pos :]):
-            head = match.group(1)
-            self.pos += len(head)
-            return {
-                'type': Token.INT,
-                'val': int(head),
-                'line': self.linecount,
-                'token': head,
-            }
-        elif match := re.match(r"^'([^'\\]|\\[abfnrtv'\"\\?0-7]|\\x[0-9A-Fa-f]{1,2})'", self.string[self.pos :]):
-            head = match.group(1)
-            self.pos += len(head) + 2
-            return {'type': Token.CHAR, 'val': ord(eval(f"'{head}'")), 'line': self.linecount, 'token': f"'{head}'"}
-        elif match := re.match(
-            r'^(&|\||!=|!|\+=|\+|-=|-|\*=|\*|\/=|\/|%=|%|==|=|>=|<=|>|<|,|;|\(|\)|\{|\}|\[|\])',
-            self.string[self.pos :],
-        ):
-            head = match.group(1)
-            self.pos += len(head)
-            t = {
-                '&': Token.AND,
-                '|': Token.OR,
-                '!': Token.NOT,
-                '+': Token.PLUS,
-                '-': Token.MINUS,
-                '*': Token.STAR,
-                '/': Token.SLASH,
-                '%': Token.PERCENT,
-                '=': Token.ASSIGN,
-                '+=': Token.ADDASSIGN,
-                '-=': Token.SUBASSIGN,
-                '*=': Token.MULASSIGN,
-                '/=': Token.DIVASSIGN,
-                '%=': Token.MODASSIGN,
-                '==': Token.EQ,
-                '!=': Token.NEQ,
-                '>': Token.GT,
-                '>=': Token.GE,
-                '<': Token.LT,
-                '<=': Token.LE,
-                ',': Token.COMMA,
-                ';': Token.SEMICOLON,
-                '(': Token.LPAREN,
-                ')': Token.RPAREN,
-                '{': Token.LBRACE,
-                '}': Token.RBRACE,
-                '[': Token.LBRACK,
-                ']': Token.RBRACK,
-            }[head]
-            return {'type': t, 'val': None, 'line': self.linecount, 'token': head}
-        elif self.pos >= len(self.string):
-            return
-        else:
-            raise RuntimeError(f'Undefined token at line {self.linecount}: {self.string[self.pos:self.pos + 10]}')
-
-    def analyze(self):
-        self.skipspace()
-        while token := self.get():
-            self.skipspace()
-            self.tokens += [token]
-        self.tokens += [
-            {
-                'type': Token.EOF,
-                'val': None,
-                'line': self.linecount,
-                'token': None,
-            }
-        ]
+        elif kind == 'bad_number':
+            raise RuntimeError(f'Undefined token at line {linecount}: {head}')
+        elif kind == 'id':
+            token = TokenInfo(KEYWORDS.get(head, Token.ID), None, linecount, head)
+        elif kind == 'int':
+            token = TokenInfo(Token.INT, int(head), linecount, head)
+        elif kind == 'char':
+            token = TokenInfo(Token.CHAR, unescape(match.group('char')), linecount, head)
+        else:  # kind == 'op'
+            token = TokenInfo(OPERATORS[head], None, linecount, head)
+        if spans is not None:
+            spans.append((match.start(), pos))
+        yield token
+    if pos < len(string):
+        raise RuntimeError(f'Undefined token at line {linecount}: {string[pos:pos + 10]}')
+    yield TokenInfo(Token.EOF, None, linecount, None)
+
+
+class Lexer:
+    '''Token stream with a small lookahead buffer for the parser.
+
+    Tokens are produced on demand, so parsing starts before the whole source
+    is tokenized. unseek() can step back over the last LOOKBEHIND tokens.
+    source is either the program text or an iterable of already lexed tokens.
+    '''
+
+    LOOKBEHIND = 4
+
+    def __init__(self, source):
+        self.stream = tokenize(source) if isinstance(source, str) else iter(source)
+        self.ahead = deque()
+        self.behind = deque(maxlen=self.LOOKBEHIND)
 
     def peek(self):
-        if self.readingpos < len(self.tokens):
-            return self.tokens[self.readingpos]
-        else:
-            return None
+        if not self.ahead:
+            token = next(self.stream, None)
+            if token is None:
+                return None
+            self.ahead.append(token)
+        return self.ahead[0]
 
     def seek(self):
-        self.readingpos += 1
+        if self.peek() is not None:
+            self.behind.append(self.ahead.popleft())
 
     def unseek(self):
-        self.readingpos -= 1
+        self.ahead.appendleft(self.behind.pop())
 
 
 if __name__ == '__main__':
     with open(sys.argv[1]) as f:
-        lex = Lexer(f.read())
-    lex.analyze()
-    for i, token in enumerate(lex.tokens):
+        text = f.read()
+    for i, token in enumerate(tokenize(text)):
         print(i, token)
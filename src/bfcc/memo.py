@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+import io
+import json
+from collections import OrderedDict
+
+from .engine import execute
+
+
+class RunResult:
+    def __init__(self, output, dp, step, hit=False):
+        self.output = output
+        self.dp = dp
+        self.step = step
+        self.hit = hit
+
+
+class ResultCache:
+    '''Memoize the result of running a program on a given input.
+
+    Programs are deterministic given their input, so the output, the final dp
+    and the step count are keyed by the program digest and the input bytes.
+    Results live in an in-memory LRU and, when a CompilationCache is given as
+    store, on disk as well.
+    '''
+
+    def __init__(self, capacity=128, store=None):
+        self.capacity = capacity
+        self.store = store
+        self.memory = OrderedDict()
+
+    def key(self, digest, input_string):
+        return f'{digest}:{input_string}'
+
+    def get(self, digest, input_string):
+        key = self.key(digest, input_string)
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            return self.memory[key]
+        if self.store is None:
+            return None
+        data = self.store.get(self.store.key(input_string, program=digest, result=True), 'result.json')
+        if data is None:
+            return None
+        value = json.loads(data)
+        self._remember(key, value)
+        return value
+
+    def put(self, digest, input_string, value):
+        self._remember(self.key(digest, input_string), value)
+        if self.store is not None:
+            key = self.store.key(input_string, program=digest, result=True)
+            self.store.put(key, {'result.json': json.dumps(value).encode('utf-8')})
+
+    def _remember(self, key, value):
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.capacity:
+            self.memory.popitem(last=False)
+
+
+def run(prog, input_string='', cache=None):
+    '''Run a FoldedProgram on a complete input string, through cache if given.'''
+    if cache is not None:
+        digest = prog.digest()
+        value = cache.get(digest, input_string)
+        if value is not None:
+            return RunResult(value['output'], value['dp'], value['step'], hit=True)
+    ost = io.StringIO()
+    dp, _, step = execute(prog, io.StringIO(input_string), ost)
+    if cache is not None:
+        cache.put(digest, input_string, {'output': ost.getvalue(), 'dp': dp, 'step': step})
+    return RunResult(ost.getvalue(), dp, step)
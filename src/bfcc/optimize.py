@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+
+import re
+import sys
+
+NOT_COMMANDS = re.compile(r'[^-+<>.,\[\]@]')
+
+
+class Peephole:
+    '''The peephole pass of -O1 over code that arrives in chunks.
+
+    feed() returns the optimized code that no later chunk can change and keeps
+    the rest: the trailing runs of "+-" and "<>" that a later chunk may still
+    cancel, and the state of a dead loop that is being skipped. close()
+    returns what is left. The output is the same as peephole() of the joined
+    chunks.
+    '''
+
+    def __init__(self):
+        # Each entry is [cmd, count]: '+' holds the net add modulo 256, '>' the net move.
+        self.out = []
+        # The last command written out, None at the start of the program.
+        self.last = None
+        # Nesting depth inside a dead loop that is being skipped.
+        self.skip = 0
+        # Positions of the open "[" and the number of commands seen, for errors.
+        self.opened = []
+        self.ip = 0
+
+    def feed(self, chunk):
+        out = self.out
+        opened = self.opened
+        skip = self.skip
+        ip = self.ip
+        for cmd in NOT_COMMANDS.sub('', chunk):
+            if cmd == '[':
+                opened.append(ip)
+                if skip:
+                    skip += 1
+                elif (out[-1][0] if out else self.last) in (None, ']'):
+                    # The current cell is zero, so the loop never runs.
+                    skip = 1
+                else:
+                    out.append(['[', 1])
+            elif cmd == ']':
+                if not opened:
+                    raise SyntaxError(f'Unmatched "]" at op {ip}.')
+                opened.pop()
+                if skip:
+                    skip -= 1
+                else:
+                    out.append([']', 1])
+            elif skip:
+                pass
+            elif cmd == '+' or cmd == '-':
+                step = 1 if cmd == '+' else 255
+                if out and out[-1][0] == '+':
+                    value = (out[-1][1] + step) & 0xFF
+                    if value:
+                        out[-1][1] = value
+                    else:
+                        out.pop()
+                else:
+                    out.append(['+', step])
+            elif cmd == '>' or cmd == '<':
+                step = 1 if cmd == '>' else -1
+                if out and out[-1][0] == '>':
+                    value = out[-1][1] + step
+                    if value:
+                        out[-1][1] = value
+                    else:
+                        out.pop()
+                else:
+                    out.append(['>', step])
+            else:
+                out.append([cmd, 1])
+            ip += 1
+        self.skip = skip
+        self.ip = ip
+        # Entries up to the last one that is not a run are never popped again.
+        end = len(out)
+        while end and out[end - 1][0] in '+>':
+            end -= 1
+        if not end:
+            return ''
+        self.last = out[end - 1][0]
+        self.out = out[end:]
+        return _render(out[:end])
+
+    def close(self):
+        if self.opened:
+            raise SyntaxError(f'Unmatched "[" at op {self.opened[-1]}.')
+        code = _render(self.out)
+        self.out = []
+        return code
+
+
+def _render(entries):
+    chunks = []
+    for cmd, count in entries:
+        if cmd == '+':
+            chunks.append('+' * count if count <= 128 else '-' * (256 - count))
+        elif cmd == '>':
+            chunks.append('>' * count if count > 0 else '<' * -count)
+        else:
+            chunks.append(cmd)
+    return ''.join(chunks)
+
+
+def peephole(code):
+    '''Remove the waste left at the seams of StackMachine snippets (-O1).
+
+    Runs of "+-" are folded into their net value modulo 256 and runs of "<>"
+    into their net move, so "+-", "-+", "><" and "<>" cancel. A loop that
+    starts where the current cell is known to be zero, right after a "]" or
+    at the start of the program, never runs and is dropped; "[-][-]" is one
+    case of it. The result is built on a stack, so whatever a cancellation
+    exposes is cancelled in turn and a single pass reaches the fixed point:
+    peephole(peephole(code)) == peephole(code). Characters that are not
+    commands are dropped.
+    '''
+    pass_ = Peephole()
+    return pass_.feed(code) + pass_.close()
+
+
+def optimize(code, level=1):
+    '''Apply the passes of optimization level to Brainfuck code.'''
+    if level >= 1:
+        code = peephole(code)
+    return code
+
+
+def optimized(chunks, level=1):
+    '''Yield the code of chunks with the passes of optimization level applied, chunk by chunk.'''
+    if level < 1:
+        yield from chunks
+        return
+    pass_ = Peephole()
+    for chunk in chunks:
+        yield pass_.feed(chunk)
+    yield pass_.close()
+
+
+if __name__ == '__main__':
+    with open(sys.argv[1]) as f:
+        print(optimize(f.read()))
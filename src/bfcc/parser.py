@@ -1,57 +1,370 @@
 #!/usr/bin/env python3
 
+import io
 import sys
-from enum import IntEnum, auto
+from types import GeneratorType
+from .emit import LineWriter
+from .engine import COMMANDS, fold
+from .ir import Recorder, lower, pass_manager
 from .lexer import Token, Lexer
+from .optimize import optimized
 from .stack_machine import *
 
+BINARY_PRECEDENCE = {
+    Token.OR: 1,
+    Token.AND: 2,
+    Token.EQ: 3,
+    Token.NEQ: 3,
+    Token.LT: 4,
+    Token.GT: 4,
+    Token.LE: 4,
+    Token.GE: 4,
+    Token.PLUS: 5,
+    Token.MINUS: 5,
+    Token.STAR: 6,
+    Token.SLASH: 6,
+    Token.PERCENT: 6,
+}
+UNARY_OPERATORS = [Token.PLUS, Token.MINUS, Token.NOT]
+BOOLEAN_OPERATORS = {Token.AND, Token.OR, Token.EQ, Token.NEQ, Token.LT, Token.GT, Token.LE, Token.GE}
+
+# Binary operators as the generated code computes them on 8-bit cells.
+ARITHMETIC = {
+    Token.AND: lambda x, y: int(bool(x) and bool(y)),
+    Token.OR: lambda x, y: int(bool(x) or bool(y)),
+    Token.PLUS: lambda x, y: (x + y) & 0xFF,
+    Token.MINUS: lambda x, y: (x - y) & 0xFF,
+    Token.STAR: lambda x, y: (x * y) & 0xFF,
+    Token.SLASH: lambda x, y: x // y,
+    Token.PERCENT: lambda x, y: x % y,
+    Token.EQ: lambda x, y: int(x == y),
+    Token.NEQ: lambda x, y: int(x != y),
+    Token.GT: lambda x, y: int(x > y),
+    Token.GE: lambda x, y: int(x >= y),
+    Token.LT: lambda x, y: int(x < y),
+    Token.LE: lambda x, y: int(x <= y),
+}
 
 
 def indent(level):
     return '    ' * level
 
 
+def walk(node):
+    '''Yield node and every AST node below it, without recursion.'''
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack += node[::-1]
+        elif isinstance(node, (Program, Statement, Expression)):
+            yield node
+            stack += [getattr(node, name) for cls in type(node).__mro__ for name in getattr(cls, '__slots__', ())][::-1]
+
+
+def references(statement):
+    '''(name, pos, shape) of the symbols statement uses but does not declare.'''
+    declared = set()
+    used = set()
+    for node in walk(statement):
+        if isinstance(node, (StInitVariable, StInitArray)):
+            declared.add(node.symbol)
+        elif isinstance(node, (ExpVariable, ExpArrayElement)):
+            used.add(node.symbol)
+    return sorted((symbol.name, symbol.pos, tuple(symbol.shape or ())) for symbol in used - declared)
+
+
+def _children(node):
+    '''Names of the slots of node that can hold statements or expressions.
+
+    Array shapes are not among them: they are evaluated with unbounded
+    integers at parse time and must not be folded to 8 bits.
+    '''
+    names = [name for cls in type(node).__mro__ for name in getattr(cls, '__slots__', ()) if name != 'symbol']
+    if isinstance(node, StInitArray):
+        names.remove('shape')
+    return names
+
+
+def fold_constants(statement):
+    '''Replace the constant subexpressions of statement in place, without recursion.
+
+    Nodes are rewritten children first, so each rewrite only looks at
+    operands that are already folded.
+    '''
+    nodes = []
+    stack = [statement]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack += node
+        elif isinstance(node, (Statement, Expression)):
+            nodes += [node]
+            stack += [getattr(node, name) for name in _children(node)]
+    for node in reversed(nodes):
+        for name in _children(node):
+            value = getattr(node, name)
+            if isinstance(value, Expression):
+                setattr(node, name, value.folded())
+            elif isinstance(value, list):
+                value[:] = [item.folded() if isinstance(item, Expression) else item for item in value]
+
+
+def constant(expr):
+    '''The 8-bit value of expr if it is a literal, otherwise None.'''
+    if isinstance(expr, (ExpInteger, ExpCharacter)):
+        return expr.value & 0xFF
+    return None
+
+
+def pure(expr):
+    '''Whether expr can be left out without losing input: only calls read input.'''
+    return not any(isinstance(node, ExpCall) for node in walk(expr))
+
+
+def same(left, right):
+    '''Whether two pure expressions always have the same value.'''
+    stack = [(left, right)]
+    while stack:
+        left, right = stack.pop()
+        if type(left) is not type(right):
+            return False
+        if isinstance(left, (ExpVariable, ExpArrayElement)) and left.symbol is not right.symbol:
+            return False
+        for name in _children(left):
+            a, b = getattr(left, name), getattr(right, name)
+            if isinstance(a, list):
+                if len(a) != len(b):
+                    return False
+                stack += zip(a, b)
+            elif isinstance(a, Expression):
+                stack += [(a, b)]
+            elif a != b:
+                return False
+    return True
+
+
+def boolean(expr):
+    '''expr normalized to 0 or 1.'''
+    if isinstance(expr, ExpBoolean) or constant(expr) in (0, 1):
+        return expr
+    if isinstance(expr, ExpUnaryOperation) and expr.mode == Token.NOT:
+        return expr
+    if isinstance(expr, ExpBinaryOperation) and expr.mode in BOOLEAN_OPERATORS:
+        return expr
+    return ExpBoolean(expr)
+
+
+def trampoline(gen):
+    '''Run a generator-based recursion on an explicit stack.
+
+    A generator calls a sub-computation by yielding its generator and receives
+    its return value back from the yield. Yielding anything else (the result of
+    a plain function) sends it straight back, so leaves need not be generators.
+    '''
+    if not isinstance(gen, GeneratorType):
+        return gen
+    stack = [gen]
+    value = None
+    while stack:
+        try:
+            child = stack[-1].send(value)
+        except StopIteration as stop:
+            stack.pop()
+            value = stop.value
+            continue
+        if isinstance(child, GeneratorType):
+            stack += [child]
+            value = None
+        else:
+            value = child
+    return value
+
+
+class Symbol:
+    '''A declared variable or array.
+
+    The parser resolves every reference to its Symbol, and pos and size are
+    filled in when codegen allocates the declaration.
+    '''
+
+    __slots__ = ('name', 'type', 'shape', 'pos', 'size')
+
+    def __init__(self, name, type, shape=None):
+        self.name = name
+        self.type = type
+        self.shape = shape
+        self.pos = None
+        self.size = None
+
+
+class Scope:
+    '''One block of declarations, chained to the enclosing block.
+
+    Names found in an enclosing block are remembered in every block on the way
+    there, so lookups stay cheap in deep nesting. That is safe because a block
+    cannot gain declarations while a block nested in it is being parsed, and
+    a block's own declarations are checked before what it remembered.
+    '''
+
+    __slots__ = ('parent', 'symbols', 'resolved')
+
+    def __init__(self, parent=None):
+        self.parent = parent
+        self.symbols = {}
+        self.resolved = {}
+
+    def lookup(self, name):
+        walked = []
+        scope = self
+        while scope is not None:
+            symbol = scope.symbols.get(name) or scope.resolved.get(name)
+            if symbol:
+                for inner in walked:
+                    inner.resolved[name] = symbol
+                return symbol
+            walked += [scope]
+            scope = scope.parent
+        return None
+
+    def declare(self, symbol):
+        self.symbols[symbol.name] = symbol
+        return symbol
+
+
 class Program:
-    def __init__(self, statements):
+    __slots__ = ('statements', 'sources', 'lines')
+
+    def __init__(self, statements, sources=None, lines=None):
         self.statements = statements
+        # Token text of each top-level statement, used to key StatementCache.
+        self.sources = sources
+        # Source line (from 1) where each top-level statement starts.
+        self.lines = lines
 
     def string(self, level=0):
-        code = ''
+        out = []
         for statement in self.statements:
-            code += statement.string(level) + '\n'
-        return code
+            trampoline(statement.string(level, out))
+            out.append('\n')
+        return ''.join(out)
 
     def __str__(self):
         return self.string(0)
 
-    def codegen(self, debug):
-        tables = [{}]
-        code = ''
-        sm = StackMachine()
+    def statement_code(self, st, sm, debug):
+        '''Fold the constants of st, generate it on sm and return the list of what sm returned.'''
+        fold_constants(st)
+        out = []
+        if isinstance(st, StInitVariable) or isinstance(st, StInitArray):
+            st.allocate(sm, out, debug)
+        trampoline(st.codegen(sm, out, debug))
+        assert not sm.controlstack
+        return out
+
+    def operations(self, optimize=0):
+        '''Yield each top-level statement with its ops, after the IR passes of optimize.'''
+        sm = Recorder()
+        passes = pass_manager(optimize)
         for st in self.statements:
-            if isinstance(st, StInitVariable) or isinstance(st, StInitArray):
-                code += st.allocate(sm, tables, debug)
-            code += st.codegen(sm, tables, debug)
+            yield st, passes.run(self.statement_code(st, sm, False))
+
+    def generate(self, debug, cache=None, optimize=0):
+        '''Yield the code of the program one top-level statement at a time.
+
+        With a StatementCache, the code of a statement is reused when its
+        tokens, the stack depth it starts at and the outer symbols it
+        references are unchanged. Each statement is recorded as ops, rewritten
+        by the IR passes of optimize and lowered; debug output is never
+        optimized.
+        '''
+        optimize = 0 if debug else optimize
+        passes = pass_manager(optimize)
+        sm = Recorder()
         if debug:
-            return f'[\n{self.string(0)}]\n' + code
-        else:
-            prog = ''
-            for i in range(0, len(code), 80):
-                prog += code[i : i + 80] + '\n'
-            return prog
+            yield f'[\n{self.string(0)}]\n'
+        sources = self.sources if cache is not None and self.sources else [None] * len(self.statements)
+        for st, source in zip(self.statements, sources):
+            base = sm.dp
+            if source is not None:
+                key = cache.key(source, base, references(st), debug, optimize)
+                hit = cache.get(key)
+                if hit is not None:
+                    code, sm.dp = hit
+                    if isinstance(st, StInitVariable) or isinstance(st, StInitArray):
+                        st.symbol.pos = base if isinstance(st, StInitVariable) else sm.dp
+                        st.symbol.size = 1 if isinstance(st, StInitVariable) else st.totalsize()
+                    yield code
+                    continue
+            out = self.statement_code(st, sm, debug)
+            code = lower(passes.run(out), debug)
+            if source is not None:
+                cache.put(key, code, sm.dp)
+            yield code
+
+    def emit(self, stream, debug, cache=None, optimize=0, marks=None):
+        '''Write the code to stream as it is generated, in 80-column lines unless debug.
+
+        With optimize, the code is optimized chunk by chunk on its way to the
+        stream. Debug output is never optimized, so it keeps matching the
+        program.
+
+        Unless the code is optimized, which moves code across statements, the
+        list marks receives (offset, line) for each top-level statement, where
+        offset counts the commands written before its code; see engine.fold().
+        '''
+        writer = stream if debug else LineWriter(stream)
+        chunks = self.generate(debug, cache, optimize)
+        if optimize and not debug:
+            chunks = optimized(chunks, optimize)
+        elif marks is not None and self.lines:
+            chunks = self._mark(chunks, debug, marks)
+        for chunk in chunks:
+            writer.write(chunk)
+        if not debug:
+            writer.close()
+
+    def _mark(self, chunks, debug, marks):
+        offset = 0
+        lines = iter(self.lines)
+        for i, chunk in enumerate(chunks):
+            if i or not debug:
+                marks.append((offset, next(lines)))
+            offset += sum(map(chunk.count, COMMANDS))
+            yield chunk
+
+    def codegen(self, debug, cache=None, optimize=0):
+        prog = io.StringIO()
+        self.emit(prog, debug, cache, optimize)
+        return prog.getvalue()
+
+    def folded(self, debug, cache=None, optimize=0):
+        '''Return the code and its FoldedProgram, whose source map gives the line of each top-level statement.'''
+        prog = io.StringIO()
+        marks = []
+        self.emit(prog, debug, cache, optimize, marks)
+        code = prog.getvalue()
+        return code, fold(code, marks)
 
 
 class Statement:
-    pass
+    __slots__ = ()
+
+    def __str__(self):
+        out = []
+        trampoline(self.string(0, out))
+        return ''.join(out)
 
 
 class StAssign(Statement):
+    __slots__ = ('lhs', 'mode', 'rhs')
+
     def __init__(self, lhs, mode, rhs):
         self.lhs = lhs
         self.mode = mode
         self.rhs = rhs
 
-    def string(self, level, argmode=False):
+    def string(self, level, out, argmode=False):
         op = {
             Token.ASSIGN: '=',
             Token.ADDASSIGN: '+=',
@@ -60,15 +373,15 @@ class StAssign(Statement):
             Token.DIVASSIGN: '/=',
             Token.MODASSIGN: '%=',
         }[self.mode]
+        lhs = yield self.lhs.text()
+        rhs = yield self.rhs.text()
         if argmode:
-            return f'{self.lhs} {op} {self.rhs}'
+            out.append(f'{lhs} {op} {rhs}')
         else:
-            return f'{indent(level)}{self.lhs} {op} {self.rhs};'
+            out.append(f'{indent(level)}{lhs} {op} {rhs};')
 
-    def codegen(self, sm, tables, debug):
-        code = ''
-        var = next((table[self.lhs.name] for table in tables[::-1] if self.lhs.name in table), None)
-        assert var
+    def codegen(self, sm, out, debug):
+        var = self.lhs.symbol
         opcode = {
             Token.ASSIGN: lambda _: '',
             Token.ADDASSIGN: sm.add,
@@ -77,255 +390,261 @@ class StAssign(Statement):
             Token.DIVASSIGN: sm.divide,
             Token.MODASSIGN: sm.modulo,
         }[self.mode]
-        if var['type'] == 'variable':
+        if var.type == 'variable':
             assert isinstance(self.lhs, ExpVariable)
             if self.mode == Token.ASSIGN:
-                code += self.rhs.codegen(sm, tables, debug)
+                yield self.rhs.codegen(sm, out, debug)
             else:
-                code += self.lhs.codegen(sm, tables, debug)
-                code += self.rhs.codegen(sm, tables, debug)
-                code += opcode(debug)
-            code += sm.store_variable(var['pos'], debug)
+                yield self.lhs.codegen(sm, out, debug)
+                yield self.rhs.codegen(sm, out, debug)
+                out.append(opcode(debug))
+            out.append(sm.store_variable(var.pos, debug))
         else:
             assert isinstance(self.lhs, ExpArrayElement)
-            assert var['type'] == 'array'
+            assert var.type == 'array'
             if self.mode == Token.ASSIGN:
-                code += self.rhs.codegen(sm, tables, debug)
+                yield self.rhs.codegen(sm, out, debug)
             else:
-                code += self.lhs.codegen(sm, tables, debug)
-                code += self.rhs.codegen(sm, tables, debug)
-                code += opcode(debug)
+                yield self.lhs.codegen(sm, out, debug)
+                yield self.rhs.codegen(sm, out, debug)
+                out.append(opcode(debug))
             for idx in self.lhs.indices[::-1]:
-                code += idx.codegen(sm, tables, debug)
-            code += sm.multi_dim_store(var['pos'], var['shape'], debug)
-        return code
+                yield idx.codegen(sm, out, debug)
+            out.append(sm.multi_dim_store(var.pos, var.shape, debug))
 
 
 class StWhile(Statement):
+    __slots__ = ('cond', 'body')
+
     def __init__(self, cond, body):
         self.cond = cond
         self.body = body
 
-    def string(self, level):
-        code = f'{indent(level)}while ({self.cond}) {{\n'
+    def string(self, level, out):
+        cond = yield self.cond.text()
+        out.append(f'{indent(level)}while ({cond}) {{\n')
         for st in self.body:
-            code += st.string(level + 1) + '\n'
-        code += f'{indent(level)}}}'
-        return code
+            yield st.string(level + 1, out)
+            out.append('\n')
+        out.append(f'{indent(level)}}}')
 
-    def codegen(self, sm, tables, debug):
+    def codegen(self, sm, out, debug):
         base = sm.dp
-        lvars = {}
-        code = ''
         for st in self.body:
             if isinstance(st, StInitVariable) or isinstance(st, StInitArray):
-                code += st.allocate(sm, tables + [lvars], debug)
+                st.allocate(sm, out, debug)
         size = sm.dp - base
-        code += self.cond.codegen(sm, tables + [lvars], debug)
-        code += sm.begin_while(debug)
+        yield self.cond.codegen(sm, out, debug)
+        out.append(sm.begin_while(debug))
         for st in self.body:
-            code += st.codegen(sm, tables + [lvars], debug)
-        code += self.cond.codegen(sm, tables + [lvars], debug)
-        code += sm.end_while(debug)
-        code += sm.pop(size, debug)
-        return code
+            yield st.codegen(sm, out, debug)
+        yield self.cond.codegen(sm, out, debug)
+        out.append(sm.end_while(debug))
+        out.append(sm.pop(size, debug))
 
 
 class StIf(Statement):
-    def __init__(self, cond, body_then, body_else=[]):
+    __slots__ = ('cond', 'body_then', 'body_else')
+
+    def __init__(self, cond, body_then, body_else=None):
         self.cond = cond
         self.body_then = body_then
-        self.body_else = body_else
+        self.body_else = [] if body_else is None else body_else
 
-    def string(self, level):
-        code = f'{indent(level)}if ({self.cond}) {{\n'
+    def string(self, level, out):
+        cond = yield self.cond.text()
+        out.append(f'{indent(level)}if ({cond}) {{\n')
         for st in self.body_then:
-            code += st.string(level + 1) + '\n'
-        code += f'{indent(level)}}}'
-        code += f'else {{\n'
+            yield st.string(level + 1, out)
+            out.append('\n')
+        out.append(f'{indent(level)}}}')
+        out.append(f'else {{\n')
         for st in self.body_else:
-            code += st.string(level + 1) + '\n'
-        code += f'{indent(level)}}}'
-        return code
+            yield st.string(level + 1, out)
+            out.append('\n')
+        out.append(f'{indent(level)}}}')
 
-    def codegen(self, sm, tables, debug):
+    def codegen(self, sm, out, debug):
         base = sm.dp
-        lvars = {}
-        code = ''
         for st in self.body_then:
             if isinstance(st, StInitVariable) or isinstance(st, StInitArray):
-                code += st.allocate(sm, tables + [lvars], debug)
+                st.allocate(sm, out, debug)
         for st in self.body_else:
             if isinstance(st, StInitVariable) or isinstance(st, StInitArray):
-                code += st.allocate(sm, tables + [lvars], debug)
+                st.allocate(sm, out, debug)
         size = sm.dp - base
-        code += self.cond.codegen(sm, tables + [lvars], debug)
-        code += sm.begin_if(debug)
+        yield self.cond.codegen(sm, out, debug)
+        out.append(sm.begin_if(debug))
         for st in self.body_then:
-            code += st.codegen(sm, tables + [lvars], debug)
-        code += sm.begin_else(debug)
+            yield st.codegen(sm, out, debug)
+        out.append(sm.begin_else(debug))
         for st in self.body_else:
-            code += st.codegen(sm, tables + [lvars], debug)
-        code += sm.end_if(debug)
-        code += sm.pop(size, debug)
-        return code
+            yield st.codegen(sm, out, debug)
+        out.append(sm.end_if(debug))
+        out.append(sm.pop(size, debug))
 
 
 class StFor(Statement):
+    __slots__ = ('inits', 'cond', 'reinits', 'body')
+
     def __init__(self, inits, cond, reinits, body):
         self.inits = inits
         self.cond = cond
         self.reinits = reinits
         self.body = body
 
-    def string(self, level):
-        code = f'{indent(level)}for ('
-        code += ','.join(init.string(0, True) for init in self.inits) + ';'
-        code += str(self.cond) + ';'
-        code += ','.join(reinit.string(0, True) for reinit in self.reinits) + ') '
-        code += f'{{\n'
+    def string(self, level, out):
+        inits = []
+        for init in self.inits:
+            yield init.string(0, inits, True)
+        cond = yield self.cond.text()
+        reinits = []
+        for reinit in self.reinits:
+            yield reinit.string(0, reinits, True)
+        out.append(f'{indent(level)}for (' + ','.join(inits) + ';' + cond + ';' + ','.join(reinits) + ') ')
+        out.append(f'{{\n')
         for st in self.body:
-            code += st.string(level + 1) + '\n'
-        code += f'{indent(level)}}}'
-        return code
+            yield st.string(level + 1, out)
+            out.append('\n')
+        out.append(f'{indent(level)}}}')
 
-    def codegen(self, sm, tables, debug):
+    def codegen(self, sm, out, debug):
         base = sm.dp
-        lvars = {}
-        code = ''
         for st in self.inits:
             if isinstance(st, StInitVariable) or isinstance(st, StInitArray):
-                code += st.allocate(sm, tables + [lvars], debug)
-                code += st.codegen(sm, tables + [lvars], debug)
+                st.allocate(sm, out, debug)
+                yield st.codegen(sm, out, debug)
             else:
-                code += st.codegen(sm, tables + [lvars], debug)
+                yield st.codegen(sm, out, debug)
         for st in self.body:
             if isinstance(st, StInitVariable) or isinstance(st, StInitArray):
-                code += st.allocate(sm, tables + [lvars], debug)
+                st.allocate(sm, out, debug)
         size = sm.dp - base
-        code += self.cond.codegen(sm, tables + [lvars], debug)
-        code += sm.begin_while(debug)
+        yield self.cond.codegen(sm, out, debug)
+        out.append(sm.begin_while(debug))
         for st in self.body:
-            code += st.codegen(sm, tables + [lvars], debug)
+            yield st.codegen(sm, out, debug)
         for st in self.reinits:
-            code += st.codegen(sm, tables + [lvars], debug)
-        code += self.cond.codegen(sm, tables + [lvars], debug)
-        code += sm.end_while(debug)
-        code += sm.pop(size, debug)
-        return code
+            yield st.codegen(sm, out, debug)
+        yield self.cond.codegen(sm, out, debug)
+        out.append(sm.end_while(debug))
+        out.append(sm.pop(size, debug))
 
 
 class StCall(Statement):
+    __slots__ = ('expr',)
+
     def __init__(self, expr):
         self.expr = expr
 
-    def string(self, level):
-        return f'{indent(level)}{self.expr};'
+    def string(self, level, out):
+        expr = yield self.expr.text()
+        out.append(f'{indent(level)}{expr};')
 
-    def builtin_putchar(self, sm, debug):
-        return sm.put_character(debug)
+    def builtin_putchar(self, sm, out, debug):
+        out.append(sm.put_character(debug))
 
-    def builtin_putint(self, sm, debug):
-        code = ''
+    def builtin_putint(self, sm, out, debug):
         pos = sm.dp - 1
-        code += sm.load_variable(pos, debug)
-        code += sm.load_constant(100, debug)
-        code += sm.greater_or_equal(debug)
-        code += sm.begin_if(debug)
-        code += sm.load_variable(pos, debug)
-        code += sm.load_constant(100, debug)
-        code += sm.divide(debug)
-        code += sm.load_constant(48, debug)
-        code += sm.add(debug)
-        code += sm.put_character(debug)
-        code += sm.begin_else(debug)
-        code += sm.end_if(debug)
-        code += sm.load_variable(pos, debug)
-        code += sm.load_constant(10, debug)
-        code += sm.greater_or_equal(debug)
-        code += sm.begin_if(debug)
-        code += sm.load_variable(pos, debug)
-        code += sm.load_constant(100, debug)
-        code += sm.modulo(debug)
-        code += sm.load_constant(10, debug)
-        code += sm.divide(debug)
-        code += sm.load_constant(48, debug)
-        code += sm.add(debug)
-        code += sm.put_character(debug)
-        code += sm.begin_else(debug)
-        code += sm.end_if(debug)
-        code += sm.load_variable(pos, debug)
-        code += sm.load_constant(10, debug)
-        code += sm.modulo(debug)
-        code += sm.load_constant(48, debug)
-        code += sm.add(debug)
-        code += sm.put_character(debug)
-        code += sm.pop(1, debug)
-        return code
-
-    def codegen(self, sm, tables, debug):
+        out.append(sm.load_variable(pos, debug))
+        out.append(sm.load_constant(100, debug))
+        out.append(sm.greater_or_equal(debug))
+        out.append(sm.begin_if(debug))
+        out.append(sm.load_variable(pos, debug))
+        out.append(sm.load_constant(100, debug))
+        out.append(sm.divide(debug))
+        out.append(sm.load_constant(48, debug))
+        out.append(sm.add(debug))
+        out.append(sm.put_character(debug))
+        out.append(sm.begin_else(debug))
+        out.append(sm.end_if(debug))
+        out.append(sm.load_variable(pos, debug))
+        out.append(sm.load_constant(10, debug))
+        out.append(sm.greater_or_equal(debug))
+        out.append(sm.begin_if(debug))
+        out.append(sm.load_variable(pos, debug))
+        out.append(sm.load_constant(100, debug))
+        out.append(sm.modulo(debug))
+        out.append(sm.load_constant(10, debug))
+        out.append(sm.divide(debug))
+        out.append(sm.load_constant(48, debug))
+        out.append(sm.add(debug))
+        out.append(sm.put_character(debug))
+        out.append(sm.begin_else(debug))
+        out.append(sm.end_if(debug))
+        out.append(sm.load_variable(pos, debug))
+        out.append(sm.load_constant(10, debug))
+        out.append(sm.modulo(debug))
+        out.append(sm.load_constant(48, debug))
+        out.append(sm.add(debug))
+        out.append(sm.put_character(debug))
+        out.append(sm.pop(1, debug))
+
+    def codegen(self, sm, out, debug):
         if self.expr.name in ['putchar', 'putint']:
             if len(self.expr.args) != 1:
                 raise SyntaxError(f'Number of arguments of the built-in putchar and putint is 1.')
-            code = self.expr.args[0].codegen(sm, tables, debug)
+            yield self.expr.args[0].codegen(sm, out, debug)
             if self.expr.name == 'putchar':
-                return code + self.builtin_putchar(sm, debug)
+                self.builtin_putchar(sm, out, debug)
             else:
-                return code + self.builtin_putint(sm, debug)
+                self.builtin_putint(sm, out, debug)
         else:
             base = sm.dp
-            code = self.expr.codegen(sm, tables, debug)
-            code += sm.pop(sm.dp - base, debug)
-            return code
+            yield self.expr.codegen(sm, out, debug)
+            out.append(sm.pop(sm.dp - base, debug))
 
 
 class StInitVariable(Statement):
-    def __init__(self, name, rhs=None):
+    __slots__ = ('name', 'rhs', 'symbol')
+
+    def __init__(self, name, rhs=None, symbol=None):
         self.name = name
         self.rhs = rhs
+        self.symbol = symbol
 
-    def string(self, level, argmode=False):
+    def string(self, level, out, argmode=False):
+        rhs = (yield self.rhs.text()) if self.rhs else None
         if argmode:
             if self.rhs:
-                return f'var {self.name} = {self.rhs}'
+                out.append(f'var {self.name} = {rhs}')
             else:
-                return f'var {self.name}'
+                out.append(f'var {self.name}')
         else:
             if self.rhs:
-                return f'{indent(level)}var {self.name} = {self.rhs};'
+                out.append(f'{indent(level)}var {self.name} = {rhs};')
             else:
-                return f'{indent(level)}var {self.name};'
+                out.append(f'{indent(level)}var {self.name};')
 
-    def codegen(self, sm, tables, debug):
+    def codegen(self, sm, out, debug):
         if self.rhs:
-            return StAssign(ExpVariable(self.name), Token.ASSIGN, self.rhs).codegen(sm, tables, debug)
-        else:
-            return ''
+            yield StAssign(ExpVariable(self.name, self.symbol), Token.ASSIGN, self.rhs).codegen(sm, out, debug)
 
-    def allocate(self, sm, tables, debug):
-        if self.name in tables[-1]:
-            raise SyntaxError(f'Variable named "{self.name}" is already used in this context.')
-        tables[-1][self.name] = {'type': 'variable', 'pos': sm.dp, 'size': 1}
-        code = sm.load_constant(0, debug)
-        return code
+    def allocate(self, sm, out, debug):
+        self.symbol.pos = sm.dp
+        self.symbol.size = 1
+        out.append(sm.load_constant(0, debug))
 
 
 class StInitArray(Statement):
-    def __init__(self, name, shape):
+    __slots__ = ('name', 'shape', 'symbol')
+
+    def __init__(self, name, shape, symbol=None):
         self.name = name
         self.shape = shape
+        self.symbol = symbol
 
-    def string(self, level, argmode=False):
+    def string(self, level, out, argmode=False):
         if argmode:
             code = f'arr {self.name}'
             for dim in self.shape:
-                code += f'[{dim}]'
+                code += f'[{(yield dim.text())}]'
         else:
             code = f'{indent(level)}arr {self.name}'
             for dim in self.shape:
-                code += f'[{dim}]'
+                code += f'[{(yield dim.text())}]'
             code += ';'
-        return code
+        out.append(code)
 
     def eval_shape(self):
         return [dim.evaluate() for dim in self.shape]
@@ -342,139 +661,160 @@ class StInitArray(Statement):
 
         return rec(shape, 0)
 
-    def codegen(self, sm, tables, debug):
-        return ''
+    def codegen(self, sm, out, debug):
+        pass
 
-    def allocate(self, sm, tables, debug):
-        assert self.name not in tables[-1]
-        code = sm.push_multi_dim_array(self.eval_shape(), debug)
-        tables[-1][self.name] = {'type': 'array', 'pos': sm.dp, 'size': self.totalsize(), 'shape': self.eval_shape()}
-        return code
+    def allocate(self, sm, out, debug):
+        out.append(sm.push_multi_dim_array(self.eval_shape(), debug))
+        self.symbol.pos = sm.dp
+        self.symbol.size = self.totalsize()
 
 
 class Expression:
-    pass
+    __slots__ = ()
+
+    def __str__(self):
+        return trampoline(self.text())
+
+    def folded(self):
+        '''Return an equivalent expression, simpler if possible. Operands must be folded already.'''
+        return self
 
 
 class ExpCall(Expression):
+    __slots__ = ('name', 'args')
+
     def __init__(self, name, args):
         self.name = name
         self.args = args
 
-    def __str__(self):
-        return f'{self.name}({", ".join(str(arg) for arg in self.args)})'
+    def text(self):
+        args = []
+        for arg in self.args:
+            args += [(yield arg.text())]
+        return f'{self.name}({", ".join(args)})'
 
-    def builtin_getchar(self, sm, tables, debug):
-        return sm.get_character(debug)
+    def builtin_getchar(self, sm, out, debug):
+        out.append(sm.get_character(debug))
 
-    def builtin_getint(self, sm, tables, debug):
-        code = ''
+    def builtin_getint(self, sm, out, debug):
         ret_pos = sm.dp
-        code += sm.load_constant(0, debug)
+        out.append(sm.load_constant(0, debug))
         inp_pos = sm.dp
-        code += sm.load_constant(0, debug)
-        code += sm.load_constant(1, debug)
-        code += sm.begin_while(debug)
-        code += sm.load_variable(ret_pos, debug)
-        code += sm.load_constant(10, debug)
-        code += sm.multiply(debug)
-        code += sm.load_variable(inp_pos, debug)
-        code += sm.add(debug)
-        code += sm.store_variable(ret_pos, debug)
-        code += sm.get_character(debug)
-        code += sm.load_constant(48, debug)
-        code += sm.subtract(debug)
-        code += sm.store_variable(inp_pos, debug)
-        code += sm.load_constant(0, debug)
-        code += sm.load_variable(inp_pos, debug)
-        code += sm.less_or_equal(debug)
-        code += sm.load_variable(inp_pos, debug)
-        code += sm.load_constant(10, debug)
-        code += sm.less_than(debug)
-        code += sm.booland(debug)
-        code += sm.end_while(debug)
-        code += sm.pop(1, debug)
-        return code
-
-    def codegen(self, sm, tables, debug):
+        out.append(sm.load_constant(0, debug))
+        out.append(sm.load_constant(1, debug))
+        out.append(sm.begin_while(debug))
+        out.append(sm.load_variable(ret_pos, debug))
+        out.append(sm.load_constant(10, debug))
+        out.append(sm.multiply(debug))
+        out.append(sm.load_variable(inp_pos, debug))
+        out.append(sm.add(debug))
+        out.append(sm.store_variable(ret_pos, debug))
+        out.append(sm.get_character(debug))
+        out.append(sm.load_constant(48, debug))
+        out.append(sm.subtract(debug))
+        out.append(sm.store_variable(inp_pos, debug))
+        out.append(sm.load_constant(0, debug))
+        out.append(sm.load_variable(inp_pos, debug))
+        out.append(sm.less_or_equal(debug))
+        out.append(sm.load_variable(inp_pos, debug))
+        out.append(sm.load_constant(10, debug))
+        out.append(sm.less_than(debug))
+        out.append(sm.booland(debug))
+        out.append(sm.end_while(debug))
+        out.append(sm.pop(1, debug))
+
+    def codegen(self, sm, out, debug):
         if self.name == 'getchar':
-            return self.builtin_getchar(sm, tables, debug)
+            self.builtin_getchar(sm, out, debug)
         elif self.name == 'getint':
-            return self.builtin_getint(sm, tables, debug)
+            self.builtin_getint(sm, out, debug)
         else:
             raise SyntaxError(f'Undefined function named {self.name}.')
 
 
 class ExpArrayElement(Expression):
-    def __init__(self, name, indices):
+    __slots__ = ('name', 'indices', 'symbol')
+
+    def __init__(self, name, indices, symbol=None):
         self.name = name
         self.indices = indices
+        self.symbol = symbol
 
-    def __str__(self):
+    def text(self):
         code = f'{self.name}'
         for idx in self.indices:
-            code += f'[{idx}]'
+            code += f'[{(yield idx.text())}]'
         return code
 
-    def codegen(self, sm, tables, debug):
-        arr = next((table[self.name] for table in tables[::-1] if self.name in table), None)
-        assert arr
-        assert arr['type'] == 'array'
-        code = ''
+    def codegen(self, sm, out, debug):
+        arr = self.symbol
+        assert arr.type == 'array'
         for idx in self.indices[::-1]:
-            code += idx.codegen(sm, tables, debug)
-        code += sm.multi_dim_load(arr['pos'], arr['shape'], debug)
-        return code
+            yield idx.codegen(sm, out, debug)
+        out.append(sm.multi_dim_load(arr.pos, arr.shape, debug))
 
 
 class ExpVariable(Expression):
-    def __init__(self, name):
+    __slots__ = ('name', 'symbol')
+
+    def __init__(self, name, symbol=None):
         self.name = name
+        self.symbol = symbol
 
-    def __str__(self):
+    def text(self):
         return self.name
 
-    def codegen(self, sm, tables, debug):
-        var = next((table[self.name] for table in tables[::-1] if self.name in table), None)
-        assert var
-        assert var['type'] == 'variable'
-        return sm.load_variable(var['pos'], debug)
+    def codegen(self, sm, out, debug):
+        var = self.symbol
+        assert var.type == 'variable'
+        out.append(sm.load_variable(var.pos, debug))
 
 
 class ExpInteger(Expression):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
-    def __str__(self):
+    def text(self):
         return str(self.value)
 
     def evaluate(self):
         return self.value
 
-    def codegen(self, sm, tables, debug):
-        return sm.load_constant(self.value, debug)
+    def folded(self):
+        return self if 0 <= self.value <= 0xFF else ExpInteger(self.value & 0xFF)
+
+    def codegen(self, sm, out, debug):
+        out.append(sm.load_constant(self.value, debug))
 
 
 class ExpCharacter(Expression):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
-    def __str__(self):
+    def text(self):
         return str(self.value)
 
     def evaluate(self):
         return self.value
 
-    def codegen(self, sm, tables, debug):
-        return sm.load_constant(self.value, debug)
+    def codegen(self, sm, out, debug):
+        out.append(sm.load_constant(self.value, debug))
+
 
 class ExpBinaryOperation(Expression):
+    __slots__ = ('mode', 'left', 'right')
+
     def __init__(self, mode, left, right):
         self.mode = mode
         self.left = left
         self.right = right
 
-    def __str__(self):
+    def text(self):
         op = {
             Token.AND: '&',
             Token.OR: '|',
@@ -490,7 +830,9 @@ class ExpBinaryOperation(Expression):
             Token.LT: '<',
             Token.LE: '<=',
         }[self.mode]
-        return f'({self.left} {op} {self.right})'
+        left = yield self.left.text()
+        right = yield self.right.text()
+        return f'({left} {op} {right})'
 
     def evaluate(self):
         op = {
@@ -510,11 +852,39 @@ class ExpBinaryOperation(Expression):
         }[self.mode]
         return int(op(int(self.left.evaluate()), int(self.right.evaluate())))
 
-    def codegen(self, sm, tables, debug):
-        code = ''
-        code += self.left.codegen(sm, tables, debug)
-        code += self.right.codegen(sm, tables, debug)
-        code += {
+    def folded(self):
+        left, right = constant(self.left), constant(self.right)
+        mode = self.mode
+        if left is not None and right is not None:
+            if mode in (Token.SLASH, Token.PERCENT) and right == 0:
+                return self  # the generated code never finishes, so keep it
+            return ExpInteger(ARITHMETIC[mode](left, right))
+        if mode == Token.PLUS and left == 0:
+            return self.right
+        if mode in (Token.PLUS, Token.MINUS) and right == 0:
+            return self.left
+        if mode == Token.MINUS and same(self.left, self.right) and pure(self.left):
+            return ExpInteger(0)
+        if mode == Token.STAR and left == 1:
+            return self.right
+        if mode in (Token.STAR, Token.SLASH) and right == 1:
+            return self.left
+        if mode == Token.STAR and (left == 0 and pure(self.right) or right == 0 and pure(self.left)):
+            return ExpInteger(0)
+        if mode == Token.PERCENT and right == 1 and pure(self.left):
+            return ExpInteger(0)
+        if mode in (Token.AND, Token.OR) and (left is not None or right is not None):
+            value, other = (left, self.right) if left is not None else (right, self.left)
+            if bool(value) == (mode == Token.AND):
+                return boolean(other)
+            if pure(other):
+                return ExpInteger(value and 1)
+        return self
+
+    def codegen(self, sm, out, debug):
+        yield self.left.codegen(sm, out, debug)
+        yield self.right.codegen(sm, out, debug)
+        opcode = {
             Token.AND: sm.booland,
             Token.OR: sm.boolor,
             Token.PLUS: sm.add,
@@ -528,22 +898,24 @@ class ExpBinaryOperation(Expression):
             Token.GE: sm.greater_or_equal,
             Token.LT: sm.less_than,
             Token.LE: sm.less_or_equal,
-        }[self.mode](debug)
-        return code
+        }[self.mode]
+        out.append(opcode(debug))
 
 
 class ExpUnaryOperation(Expression):
+    __slots__ = ('mode', 'operand')
+
     def __init__(self, mode, operand):
         self.mode = mode
         self.operand = operand
 
-    def __str__(self):
+    def text(self):
         op = {
             Token.MINUS: '-',
             Token.PLUS: '+',
             Token.NOT: '!',
         }[self.mode]
-        return f'{op}{self.operand}'
+        return f'{op}{(yield self.operand.text())}'
 
     def evaluate(self):
         if self.mode == Token.NOT:
@@ -553,23 +925,74 @@ class ExpUnaryOperation(Expression):
         else:  # self.mode == Token.PLUS
             return int(bool(self.operand.evaluate()))
 
-    def codegen(self, sm, tables, debug):
+    def folded(self):
+        operand = self.operand
+        value = constant(operand)
+        if value is not None:
+            if self.mode == Token.NOT:
+                return ExpInteger(int(not value))
+            return ExpInteger(-value & 0xFF if self.mode == Token.MINUS else value)
+        if self.mode == Token.PLUS:
+            return operand
+        if isinstance(operand, ExpUnaryOperation) and operand.mode == self.mode:
+            # !!x normalizes x to 0 or 1, --x is x.
+            return boolean(operand.operand) if self.mode == Token.NOT else operand.operand
+        if self.mode == Token.NOT and isinstance(operand, ExpBoolean):
+            return ExpUnaryOperation(Token.NOT, operand.operand)
+        return self
+
+    def codegen(self, sm, out, debug):
         if self.mode == Token.NOT:
-            return self.operand.codegen(sm, tables, debug) + sm.boolnot(debug)
+            yield self.operand.codegen(sm, out, debug)
+            out.append(sm.boolnot(debug))
         elif self.mode == Token.MINUS:
-            return sm.load_constant(0, debug) + self.operand.codegen(sm, tables, debug) + sm.subtract(debug)
+            out.append(sm.load_constant(0, debug))
+            yield self.operand.codegen(sm, out, debug)
+            out.append(sm.subtract(debug))
         else:
-            return self.operand.codegen(sm, tables, debug)
+            yield self.operand.codegen(sm, out, debug)
+
+
+class ExpBoolean(Expression):
+    '''operand normalized to 0 or 1. Constant folding makes it, for example from !!x.'''
+
+    __slots__ = ('operand',)
+
+    def __init__(self, operand):
+        self.operand = operand
+
+    def text(self):
+        return f'!!{(yield self.operand.text())}'
+
+    def evaluate(self):
+        return int(bool(self.operand.evaluate()))
+
+    def codegen(self, sm, out, debug):
+        yield self.operand.codegen(sm, out, debug)
+        out.append(sm.boolean(debug))
 
 
 class Parser:
+    '''Recursive-descent parser that keeps its recursion off the Python stack.
+
+    The statement and primary-expression rules are generators run by
+    trampoline(): a rule yields the generator of a sub-rule to call it.
+    Binary operators are parsed by precedence climbing over explicit operand
+    and operator stacks, so nesting depth is only limited by memory.
+    '''
+
     def __init__(self, lex):
         self.lex = lex
+        self.recording = None
 
     def seek(self):
+        if self.recording is not None and self.peek() is not None:
+            self.recording += [self.peek().token]
         self.lex.seek()
 
     def unseek(self):
+        if self.recording:
+            self.recording.pop()
         self.lex.unseek()
 
     def peek(self):
@@ -577,29 +1000,35 @@ class Parser:
 
     def expect(self, token_type):
         token = self.peek()
-        if token['type'] == token_type:
+        if token.type == token_type:
             self.seek()
         else:
-            raise SyntaxError(f"Expected {repr(token_type)}, got {repr(token['type'])} in line {token['line'] + 1}.")
+            raise SyntaxError(f"Expected {repr(token_type)}, got {repr(token.type)} in line {token.line + 1}.")
 
     def match(self, token_type):
         token = self.peek()
-        if token['type'] == token_type:
+        if token.type == token_type:
             self.seek()
             return token
         return False
 
     def parse_program(self):
         statements = []
-        tables = [{}]
-        while self.peek()['type'] != Token.EOF:
-            statements += [self.parse_statement(tables, False)]
+        sources = []
+        lines = []
+        scope = Scope()
+        while self.peek().type != Token.EOF:
+            self.recording = []
+            lines += [self.peek().line + 1]
+            statements += [trampoline(self.parse_statement(scope, False))]
+            sources += [' '.join(self.recording)]
+            self.recording = None
         self.expect(Token.EOF)
-        return Program(statements)
+        return Program(statements, sources, lines)
 
-    def parse_assignment(self, tables, tail=Token.SEMICOLON):
-        lhs = self.parse_left_expression(tables)
-        if self.peek()['type'] not in [
+    def parse_assignment(self, scope, tail=Token.SEMICOLON):
+        lhs = yield self.parse_left_expression(scope)
+        if self.peek().type not in [
             Token.ASSIGN,
             Token.ADDASSIGN,
             Token.SUBASSIGN,
@@ -608,296 +1037,264 @@ class Parser:
             Token.MODASSIGN,
         ]:
             raise SyntaxError(
-                f'Expected {repr(Token.ASSIGN)} or the other assignment operator, got {repr(self.peek()["type"])} in line {self.peek()["line"] + 1}.'
+                f'Expected {repr(Token.ASSIGN)} or the other assignment operator, got {repr(self.peek().type)} in line {self.peek().line + 1}.'
             )
-        mode = self.peek()['type']
+        mode = self.peek().type
         self.seek()
-        rhs = self.parse_expression(tables)
+        rhs = yield self.parse_expression(scope)
 
         if tail:
             self.expect(tail)
         return StAssign(lhs, mode, rhs)
 
-    def parse_for(self, tables, enable_return):
+    def parse_for(self, scope, enable_return):
         self.expect(Token.KW_FOR)
         self.expect(Token.LPAREN)
         inits = []
-        lvars = {}
-        while self.peek()['type'] != Token.SEMICOLON:
-            if self.peek()['type'] == Token.KW_VAR:
-                inits += [self.parse_init_variable(tables + [lvars], tail=None, enable_init=True)]
-            elif self.peek()['type'] == Token.KW_ARR:
-                inits += [self.parse_init_array(tables + [lvars], tail=None)]
-            elif self.peek()['type'] == Token.ID:
-                inits += [self.parse_assignment(tables + [lvars], tail=None)]
+        lvars = Scope(scope)
+        while self.peek().type != Token.SEMICOLON:
+            if self.peek().type == Token.KW_VAR:
+                inits += [(yield self.parse_init_variable(lvars, tail=None, enable_init=True))]
+            elif self.peek().type == Token.KW_ARR:
+                inits += [(yield self.parse_init_array(lvars, tail=None))]
+            elif self.peek().type == Token.ID:
+                inits += [(yield self.parse_assignment(lvars, tail=None))]
             else:
                 raise SyntaxError(
-                    f'Expected {repr(Token.KW_VAR)} or {repr(Token.KW_ARR)}, got {repr(self.peek()["type"])} in line {self.peek()["line"] + 1}.'
+                    f'Expected {repr(Token.KW_VAR)} or {repr(Token.KW_ARR)}, got {repr(self.peek().type)} in line {self.peek().line + 1}.'
                 )
             self.match(Token.COMMA)
         self.expect(Token.SEMICOLON)
-        cond = self.parse_expression(tables + [lvars])
+        cond = yield self.parse_expression(lvars)
         self.expect(Token.SEMICOLON)
         reinits = []
-        while self.peek()['type'] != Token.RPAREN:
-            reinits += [self.parse_assignment(tables + [lvars], tail=None)]
+        while self.peek().type != Token.RPAREN:
+            reinits += [(yield self.parse_assignment(lvars, tail=None))]
             self.match(Token.COMMA)
         self.expect(Token.RPAREN)
         self.expect(Token.LBRACE)
         body = []
-        while self.peek()['type'] != Token.RBRACE:
-            body += [self.parse_statement(tables + [lvars])]
+        while self.peek().type != Token.RBRACE:
+            body += [(yield self.parse_statement(lvars))]
         self.expect(Token.RBRACE)
         return StFor(inits, cond, reinits, body)
 
-    def parse_while(self, tables, enable_return):
+    def parse_while(self, scope, enable_return):
         self.expect(Token.KW_WHILE)
-        cond = self.parse_expression(tables)
+        cond = yield self.parse_expression(scope)
         self.expect(Token.LBRACE)
-        lvars = {}
+        lvars = Scope(scope)
         body = []
-        while self.peek()['type'] != Token.RBRACE:
-            body += [self.parse_statement(tables + [lvars])]
+        while self.peek().type != Token.RBRACE:
+            body += [(yield self.parse_statement(lvars))]
         self.expect(Token.RBRACE)
         return StWhile(cond, body)
 
-    def parse_if(self, tables, enable_return):
+    def parse_if(self, scope, enable_return):
         self.expect(Token.KW_IF)
-        cond = self.parse_expression(tables)
+        cond = yield self.parse_expression(scope)
         self.expect(Token.LBRACE)
         body_then = []
-        lvars = {}
-        while self.peek()['type'] != Token.RBRACE:
-            body_then += [self.parse_statement(tables + [lvars], enable_return)]
+        lvars = Scope(scope)
+        while self.peek().type != Token.RBRACE:
+            body_then += [(yield self.parse_statement(lvars, enable_return))]
         self.expect(Token.RBRACE)
-        if self.peek()['type'] == Token.KW_ELSE:
+        if self.peek().type == Token.KW_ELSE:
             self.seek()
             self.expect(Token.LBRACE)
             body_else = []
-            while self.peek()['type'] != Token.RBRACE:
-                body_else += [self.parse_statement(tables + [lvars], enable_return)]
+            while self.peek().type != Token.RBRACE:
+                body_else += [(yield self.parse_statement(lvars, enable_return))]
             self.expect(Token.RBRACE)
             return StIf(cond, body_then, body_else)
         else:
             return StIf(cond, body_then)
 
-    def parse_statement(self, tables, enable_return=False):
-        if self.peek()['type'] == Token.KW_VAR:
-            return self.parse_init_variable(tables)
-        elif self.peek()['type'] == Token.KW_ARR:
-            return self.parse_init_array(tables)
-        elif self.peek()['type'] == Token.KW_IF:
-            return self.parse_if(tables, enable_return)
-        elif self.peek()['type'] == Token.KW_WHILE:
-            return self.parse_while(tables, enable_return)
-        elif self.peek()['type'] == Token.KW_FOR:
-            return self.parse_for(tables, enable_return)
-        elif self.peek()['type'] == Token.ID:
+    def parse_statement(self, scope, enable_return=False):
+        if self.peek().type == Token.KW_VAR:
+            return (yield self.parse_init_variable(scope))
+        elif self.peek().type == Token.KW_ARR:
+            return (yield self.parse_init_array(scope))
+        elif self.peek().type == Token.KW_IF:
+            return (yield self.parse_if(scope, enable_return))
+        elif self.peek().type == Token.KW_WHILE:
+            return (yield self.parse_while(scope, enable_return))
+        elif self.peek().type == Token.KW_FOR:
+            return (yield self.parse_for(scope, enable_return))
+        elif self.peek().type == Token.ID:
             self.seek()
-            if self.peek()['type'] == Token.LPAREN:
+            if self.peek().type == Token.LPAREN:
                 self.unseek()
-                expr = self.parse_expcall(tables)
+                expr = yield self.parse_expcall(scope)
                 self.expect(Token.SEMICOLON)
                 return StCall(expr)
             else:
                 self.unseek()
-                return self.parse_assignment(tables)
+                return (yield self.parse_assignment(scope))
         else:
-            raise SyntaxError(f'Unexpected token {repr(self.peek()["type"])} in line {self.peek()["line"] + 1}.')
+            raise SyntaxError(f'Unexpected token {repr(self.peek().type)} in line {self.peek().line + 1}.')
 
-    def parse_init_variable(self, tables, tail=Token.SEMICOLON, enable_init=True):
+    def parse_init_variable(self, scope, tail=Token.SEMICOLON, enable_init=True):
         self.expect(Token.KW_VAR)
-        if self.peek()['type'] == Token.ID:
-            name = self.peek()['token']
-            if tables[-1].get(name, None):
-                raise SyntaxError(f'Name "{name}" is already used in this context in line {self.peek()["line"] + 1}.')
-            tables[-1][name] = {'type': 'variable'}
+        if self.peek().type == Token.ID:
+            name = self.peek().token
+            if name in scope.symbols:
+                raise SyntaxError(f'Name "{name}" is already used in this context in line {self.peek().line + 1}.')
+            symbol = scope.declare(Symbol(name, 'variable'))
             self.seek()
-            if self.peek()['type'] == Token.ASSIGN:
+            if self.peek().type == Token.ASSIGN:
                 if enable_init:
                     self.seek()
-                    rhs = self.parse_expression(tables)
+                    rhs = yield self.parse_expression(scope)
                 else:
-                    raise SyntaxError(f'In this context, assign is not supported, in line {self.peek()["line"] + 1}.')
+                    raise SyntaxError(f'In this context, assign is not supported, in line {self.peek().line + 1}.')
             else:
                 rhs = None
         else:
             raise SyntaxError(
-                f'Expected {repr(Token.ID)}, got {repr(self.peek()["type"])} in line {self.peek()["line"] + 1}.'
+                f'Expected {repr(Token.ID)}, got {repr(self.peek().type)} in line {self.peek().line + 1}.'
             )
         if tail:
             self.expect(tail)
-        return StInitVariable(name, rhs)
+        return StInitVariable(name, rhs, symbol)
 
-    def parse_init_array(self, tables, tail=Token.SEMICOLON):
+    def parse_init_array(self, scope, tail=Token.SEMICOLON):
         self.expect(Token.KW_ARR)
-        if self.peek()['type'] == Token.ID:
-            name = self.peek()['token']
-            if tables[-1].get(name, None):
-                raise SyntaxError(f'Name "{name}" is already used in this context in line {self.peek()["line"] + 1}.')
+        if self.peek().type == Token.ID:
+            name = self.peek().token
+            if name in scope.symbols:
+                raise SyntaxError(f'Name "{name}" is already used in this context in line {self.peek().line + 1}.')
             self.seek()
             shape = []
-            while self.peek()['type'] != Token.SEMICOLON:
+            while self.peek().type != Token.SEMICOLON:
                 self.expect(Token.LBRACK)
-                shape += [self.parse_expression(tables)]
+                shape += [(yield self.parse_expression(scope))]
                 self.expect(Token.RBRACK)
-            tables[-1][name] = {'type': 'array', 'shape': [dim.evaluate() for dim in shape]}
+            symbol = scope.declare(Symbol(name, 'array', [dim.evaluate() for dim in shape]))
         else:
             raise SyntaxError(
-                f'Expected {repr(Token.ID)}, got {repr(self.peek()["type"])} in line {self.peek()["line"] + 1}.'
+                f'Expected {repr(Token.ID)}, got {repr(self.peek().type)} in line {self.peek().line + 1}.'
             )
         if tail:
             self.expect(tail)
-        return StInitArray(name, shape)
+        return StInitArray(name, shape, symbol)
 
-    def parse_left_expression(self, tables):
+    def parse_left_expression(self, scope):
         token = self.peek()
-        if token['type'] == Token.ID:
+        if token.type == Token.ID:
             self.seek()
-            if self.peek()['type'] == Token.LBRACK:
+            if self.peek().type == Token.LBRACK:
                 indices = []
-                while self.peek()['type'] == Token.LBRACK:
+                while self.peek().type == Token.LBRACK:
                     self.seek()
-                    indices += [self.parse_expression(tables)]
+                    indices += [(yield self.parse_expression(scope))]
                     self.expect(Token.RBRACK)
-                expr = ExpArrayElement(token['token'], indices)
-                var = next((table[token['token']] for table in tables[::-1] if token['token'] in table), None)
+                var = scope.lookup(token.token)
                 if not var:
-                    raise SyntaxError(f'Undefined array named {token["token"]} in line {token["line"] + 1}.')
-                if len(var['shape']) != len(indices):
+                    raise SyntaxError(f'Undefined array named {token.token} in line {token.line + 1}.')
+                if var.type != 'array':
+                    raise SyntaxError(f'"{token.token}" is not an array but a variable in line {token.line + 1}.')
+                if len(var.shape) != len(indices):
                     raise SyntaxError(
-                        f'The left-hand-side of the assign must be a reference of a single byte, in line {token["line"] + 1}.'
+                        f'The left-hand-side of the assign must be a reference of a single byte, in line {token.line + 1}.'
                     )
-                return expr
+                return ExpArrayElement(token.token, indices, var)
             else:
-                return ExpVariable(token['token'])
+                var = scope.lookup(token.token)
+                if not var:
+                    raise SyntaxError(f'Undefined variable named "{token.token}" in line {token.line + 1}.')
+                if var.type != 'variable':
+                    raise SyntaxError(f'"{token.token}" is not a variable but an array in line {token.line + 1}.')
+                return ExpVariable(token.token, var)
         else:
             raise SyntaxError(
-                f'Expected {repr(Token.ID)}, got {repr(self.peek()["type"])} in line {self.peek()["line"] + 1}.'
+                f'Expected {repr(Token.ID)}, got {repr(self.peek().type)} in line {self.peek().line + 1}.'
             )
 
-    def parse_expression(self, tables):
-        return self.parse_logical_or_expression(tables)
-
-    def parse_logical_or_expression(self, tables):
-        left = self.parse_logical_and_expression(tables)
-        while self.peek()['type'] == Token.OR:
-            operator = self.peek()
-            self.seek()
-            right = self.parse_logical_and_expression(tables)
-            left = ExpBinaryOperation(Token.OR, left, right)
-        return left
-
-    def parse_logical_and_expression(self, tables):
-        left = self.parse_equality_expression(tables)
-        while self.peek()['type'] == Token.AND:
-            operator = self.peek()
-            self.seek()
-            right = self.parse_equality_expression(tables)
-            left = ExpBinaryOperation(Token.AND, left, right)
-        return left
-
-    def parse_equality_expression(self, tables):
-        left = self.parse_relational_expression(tables)
-        while self.peek()['type'] in [Token.EQ, Token.NEQ]:
-            operator = self.peek()
-            self.seek()
-            right = self.parse_relational_expression(tables)
-            left = ExpBinaryOperation(operator['type'], left, right)
-        return left
-
-    def parse_relational_expression(self, tables):
-        left = self.parse_additive_expression(tables)
-        while self.peek()['type'] in [Token.LT, Token.GT, Token.LE, Token.GE]:
-            operator = self.peek()
-            self.seek()
-            right = self.parse_additive_expression(tables)
-            left = ExpBinaryOperation(operator['type'], left, right)
-        return left
-
-    def parse_additive_expression(self, tables):
-        left = self.parse_multiplicative_expression(tables)
-        while self.peek()['type'] in [Token.PLUS, Token.MINUS]:
-            operator = self.peek()
-            self.seek()
-            right = self.parse_multiplicative_expression(tables)
-            left = ExpBinaryOperation(operator['type'], left, right)
-        return left
-
-    def parse_multiplicative_expression(self, tables):
-        left = self.parse_unary_expression(tables)
-        while self.peek()['type'] in [Token.STAR, Token.SLASH, Token.PERCENT]:
-            operator = self.peek()
+    def parse_expression(self, scope):
+        '''Precedence climbing over unary-prefixed primary expressions.'''
+        operands = []
+        operators = []
+        while True:
+            prefixes = []
+            while self.peek().type in UNARY_OPERATORS:
+                prefixes += [self.peek().type]
+                self.seek()
+            operand = yield self.parse_primary_expression(scope)
+            for mode in prefixes[::-1]:
+                operand = ExpUnaryOperation(mode, operand)
+            operands += [operand]
+            precedence = BINARY_PRECEDENCE.get(self.peek().type)
+            if precedence is None:
+                break
+            while operators and operators[-1][0] >= precedence:
+                _, mode = operators.pop()
+                right = operands.pop()
+                operands[-1] = ExpBinaryOperation(mode, operands[-1], right)
+            operators += [(precedence, self.peek().type)]
             self.seek()
-            right = self.parse_unary_expression(tables)
-            left = ExpBinaryOperation(operator['type'], left, right)
-        return left
+        while operators:
+            _, mode = operators.pop()
+            right = operands.pop()
+            operands[-1] = ExpBinaryOperation(mode, operands[-1], right)
+        return operands[0]
 
-    def parse_unary_expression(self, tables):
-        if self.peek()['type'] in [Token.PLUS, Token.MINUS, Token.NOT]:
-            operator = self.peek()
-            self.seek()
-            operand = self.parse_unary_expression(tables)
-            return ExpUnaryOperation(operator['type'], operand)
-        else:
-            return self.parse_primary_expression(tables)
-
-    def parse_expcall(self, tables):
-        if self.peek()['type'] != Token.ID:
+    def parse_expcall(self, scope):
+        token = self.peek()
+        if token.type != Token.ID:
             raise SyntaxError(
-                f'Expected {repr(Token.ID)}, got {repr(self.peek()["type"])} in line {token["line"] + 1}.'
+                f'Expected {repr(Token.ID)}, got {repr(token.type)} in line {token.line + 1}.'
             )
-        token = self.peek()
         self.seek()
         self.expect(Token.LPAREN)
         args = []
-        while self.peek()['type'] != Token.RPAREN:
-            args += [self.parse_expression(tables)]
+        while self.peek().type != Token.RPAREN:
+            args += [(yield self.parse_expression(scope))]
             self.match(Token.COMMA)
         self.expect(Token.RPAREN)
-        return ExpCall(token['token'], args)
+        return ExpCall(token.token, args)
 
-    def parse_primary_expression(self, tables):
-        if self.peek()['type'] == Token.ID:
+    def parse_primary_expression(self, scope):
+        if self.peek().type == Token.ID:
             token = self.peek()
             self.seek()
-            if self.peek()['type'] == Token.LBRACK:
-                name = token['token']
-                arr = next((table[name] for table in tables[::-1] if name in table), None)
+            if self.peek().type == Token.LBRACK:
+                name = token.token
+                arr = scope.lookup(name)
                 if not arr:
-                    raise SyntaxError(f'Undefined array named "{name}" in line {token["line"] + 1}.')
-                if arr['type'] != 'array':
-                    raise SyntaxError(f'"{name}" is not an array but a variable in line {token["line"] + 1}.')
+                    raise SyntaxError(f'Undefined array named "{name}" in line {token.line + 1}.')
+                if arr.type != 'array':
+                    raise SyntaxError(f'"{name}" is not an array but a variable in line {token.line + 1}.')
                 indices = []
-                while self.peek()['type'] == Token.LBRACK:
+                while self.peek().type == Token.LBRACK:
                     self.seek()
-                    indices += [self.parse_expression(tables)]
+                    indices += [(yield self.parse_expression(scope))]
                     self.expect(Token.RBRACK)
-                if len(arr['shape']) != len(indices):
-                    raise SyntaxError(f'Number of array indices is incorrect in line {token["line"] + 1}.')
-                return ExpArrayElement(name, indices)
-            elif self.peek()['type'] == Token.LPAREN:
+                if len(arr.shape) != len(indices):
+                    raise SyntaxError(f'Number of array indices is incorrect in line {token.line + 1}.')
+                return ExpArrayElement(name, indices, arr)
+            elif self.peek().type == Token.LPAREN:
                 self.unseek()
-                return self.parse_expcall(tables)
+                return (yield self.parse_expcall(scope))
             else:
-                name = token['token']
-                var = next((table[name] for table in tables[::-1] if name in table), None)
+                name = token.token
+                var = scope.lookup(name)
                 if not var:
-                    raise SyntaxError(f'Undefined variable named "{name}" in line {token["line"] + 1}.')
-                if var['type'] != 'variable':
-                    raise SyntaxError(f'"{name}" is not a variable but an array in line {token["line"] + 1}.')
-                return ExpVariable(name)
-        elif self.peek()['type'] == Token.INT:
-            value = self.peek()['val']
+                    raise SyntaxError(f'Undefined variable named "{name}" in line {token.line + 1}.')
+                if var.type != 'variable':
+                    raise SyntaxError(f'"{name}" is not a variable but an array in line {token.line + 1}.')
+                return ExpVariable(name, var)
+        elif self.peek().type == Token.INT:
+            value = self.peek().val
             self.seek()
             return ExpInteger(value)
-        elif self.peek()['type'] == Token.CHAR:
-            value = self.peek()['val']
+        elif self.peek().type == Token.CHAR:
+            value = self.peek().val
             self.seek()
             return ExpCharacter(value)
-        elif self.peek()['type'] == Token.LPAREN:
+        elif self.peek().type == Token.LPAREN:
             self.seek()
-            expr = self.parse_expression(tables)
+            expr = yield self.parse_expression(scope)
             self.expect(Token.RPAREN)
             return expr
         else:
@@ -911,7 +1308,6 @@ if __name__ == '__main__':
     with open(sys.argv[1]) as f:
         prog = f.read()
     lex = Lexer(prog)
-    lex.analyze()
     parser = Parser(lex)
     ast = parser.parse_program()
     print(ast.string(0))
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+
+import argparse
+import random
+
+BINARY = ['+', '-', '*', '/', '%', '==', '!=', '<', '<=', '>', '>=', '&', '|']
+ASSIGN = ['=', '+=', '-=', '*=', '/=', '%=']
+
+
+class Generator:
+    '''Random, valid and terminating programs in the bfcc language.
+
+    Every name is declared once, so no shadowing. Loop counters are only
+    written by their own loop, and every loop runs a constant number of times,
+    so programs always terminate. Divisors and array indices are kept in range
+    by construction: divisors are `(e % k) + 1` or non-zero literals, and
+    indices are `e % dim`.
+    '''
+
+    def __init__(self, seed=0, statements=30, depth=3, expr_depth=3, max_trip=3):
+        self.rng = random.Random(seed)
+        self.statements = statements
+        self.depth = depth
+        self.expr_depth = expr_depth
+        self.max_trip = max_trip
+        self.count = 0
+        self.scopes = [[]]
+        self.fixed = set()
+
+    def fresh(self, prefix):
+        self.count += 1
+        return f'{prefix}{self.count}'
+
+    def visible(self, kind):
+        return [sym for scope in self.scopes for sym in scope if sym[1] == kind]
+
+    def writable(self):
+        return [sym for sym in self.visible('var') if sym[0] not in self.fixed]
+
+    def literal(self):
+        if self.rng.random() < 0.2:
+            return repr(chr(self.rng.randint(ord('a'), ord('z'))))
+        return str(self.rng.randint(0, 255))
+
+    def divisor(self, depth):
+        if depth <= 0 or self.rng.random() < 0.5:
+            return str(self.rng.randint(1, 255))
+        return f'(({self.expression(depth - 1)}) % {self.rng.randint(1, 16)} + 1)'
+
+    def element(self, array, depth):
+        name, _, shape = array
+        return name + ''.join(f'[({self.expression(depth - 1)}) % {dim}]' for dim in shape)
+
+    def expression(self, depth=None):
+        depth = self.expr_depth if depth is None else depth
+        r = self.rng.random()
+        if depth <= 0 or r < 0.25:
+            variables = self.visible('var')
+            arrays = self.visible('arr')
+            leaf = self.rng.random()
+            if leaf < 0.45 and variables:
+                return self.rng.choice(variables)[0]
+            if leaf < 0.6 and arrays and depth > 0:
+                return self.element(self.rng.choice(arrays), depth)
+            if leaf < 0.64:
+                return 'getchar()'
+            if leaf < 0.66:
+                return 'getint()'
+            return self.literal()
+        if r < 0.4:
+            return f'{self.rng.choice("-+!")}({self.expression(depth - 1)})'
+        op = self.rng.choice(BINARY)
+        if op in ['/', '%']:
+            return f'({self.expression(depth - 1)} {op} {self.divisor(depth - 1)})'
+        return f'({self.expression(depth - 1)} {op} {self.expression(depth - 1)})'
+
+    def assignment(self):
+        arrays = self.visible('arr')
+        variables = self.writable()
+        if arrays and (not variables or self.rng.random() < 0.3):
+            lhs = self.element(self.rng.choice(arrays), 1)
+        elif variables:
+            lhs = self.rng.choice(variables)[0]
+        else:
+            return None
+        op = self.rng.choice(ASSIGN)
+        rhs = self.divisor(self.expr_depth) if op in ['/=', '%='] else self.expression()
+        return f'{lhs} {op} {rhs}'
+
+    def block(self, indent, size, depth):
+        lines = []
+        for _ in range(size):
+            lines += self.statement(indent, depth)
+        return lines
+
+    def body(self, indent, depth):
+        self.scopes.append([])
+        lines = self.block(indent, self.rng.randint(1, max(1, self.statements // 4)), depth - 1)
+        self.scopes.pop()
+        return lines
+
+    def statement(self, indent, depth):
+        pad = '    ' * indent
+        r = self.rng.random()
+        if r < 0.15:
+            name = self.fresh('v')
+            init = f' = {self.expression()}' if self.rng.random() < 0.7 else ''
+            self.scopes[-1].append((name, 'var', None))
+            return [f'{pad}var {name}{init};']
+        if r < 0.2:
+            name = self.fresh('a')
+            shape = [self.rng.randint(1, 4) for _ in range(self.rng.randint(1, 3))]
+            self.scopes[-1].append((name, 'arr', shape))
+            return [f'{pad}arr {name}{"".join(f"[{dim}]" for dim in shape)};']
+        if r < 0.3:
+            return [f'{pad}putchar({self.expression()});']
+        if r < 0.38:
+            return [f'{pad}putint({self.expression()});']
+        if depth > 0 and r < 0.5:
+            lines = [f'{pad}if ({self.expression()}) {{']
+            lines += self.body(indent + 1, depth)
+            if self.rng.random() < 0.5:
+                lines += [f'{pad}}} else {{']
+                lines += self.body(indent + 1, depth)
+            return lines + [f'{pad}}}']
+        if depth > 0 and r < 0.6:
+            name = self.fresh('w')
+            self.scopes[-1].append((name, 'var', None))
+            self.fixed.add(name)
+            lines = [f'{pad}var {name} = {self.rng.randint(0, self.max_trip)};', f'{pad}while ({name}) {{']
+            lines += self.body(indent + 1, depth)
+            return lines + [f'{pad}    {name} -= 1;', f'{pad}}}']
+        if depth > 0 and r < 0.7:
+            name = self.fresh('i')
+            self.scopes.append([(name, 'var', None)])
+            self.fixed.add(name)
+            lines = [f'{pad}for (var {name} = 0; {name} < {self.rng.randint(0, self.max_trip)}; {name} += 1) {{']
+            lines += self.body(indent + 1, depth)
+            self.scopes.pop()
+            return lines + [f'{pad}}}']
+        assignment = self.assignment()
+        if assignment is None:
+            return [f'{pad}putchar({self.expression()});']
+        return [f'{pad}{assignment};']
+
+    def program(self):
+        return '\n'.join(self.block(0, self.statements, self.depth)) + '\n'
+
+
+def generate(seed=0, statements=30, depth=3, expr_depth=3, max_trip=3):
+    '''Return the source of a random program.'''
+    return Generator(seed, statements, depth, expr_depth, max_trip).program()
+
+
+def generate_input(seed=0, length=4096):
+    '''Return input for generated programs: digits, separators and letters.'''
+    rng = random.Random(seed)
+    return ''.join(rng.choice('0123456789 \nabcxyz') for _ in range(length))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a random bfcc program.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--statements', type=int, default=30)
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--expr-depth', type=int, default=3)
+    parser.add_argument('--max-trip', type=int, default=3)
+    args = parser.parse_args()
+    print(generate(args.seed, args.statements, args.depth, args.expr_depth, args.max_trip), end='')
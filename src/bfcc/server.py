@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+'''Execution server for interactive sessions.
+
+The protocol is one JSON object per line in both directions.
+
+Client requests:
+    {"op": "load", "code": BF}            -> {"program": DIGEST}
+    {"op": "load", "source": SOURCE}      -> {"program": DIGEST}
+    {"op": "run", "program": DIGEST, "input": STR, "max_steps": N}
+    {"op": "input", "data": STR}          (during a run, after {"input": true})
+    {"op": "input", "eof": true}
+
+Server messages during a run:
+    {"output": STR}, {"input": true},
+    and finally {"done": true, "dp": N, "step": N} or {"error": MESSAGE}.
+
+A malformed request, such as a "max_steps" that is not an integer, is
+answered with {"error": MESSAGE} and the connection stays open.
+'''
+
+import asyncio
+import json
+from collections import OrderedDict
+
+from .compiler import compile_source
+from .daemon import LIMIT
+from .engine import execute_async, fold
+
+
+def prepare(code=None, source=None):
+    '''Compile source if given and fold the code. Runs in an executor, off the event loop.'''
+    if source is not None:
+        code = compile_source(source)
+    return fold(code)
+
+
+class Server:
+    def __init__(self, max_sessions=64, max_programs=256, max_steps=None):
+        self.max_sessions = max_sessions
+        self.max_programs = max_programs
+        self.max_steps = max_steps
+        self.programs = OrderedDict()
+        # Digest of the program of each compiled source, bounded like programs.
+        self.sources = OrderedDict()
+        self.slots = None
+
+    async def load(self, code=None, source=None):
+        '''Add a program from code or source and return its digest.'''
+        if code is None and source is None:
+            raise ValueError('A load needs code or source.')
+        if source is not None and self.sources.get(source) in self.programs:
+            self.sources.move_to_end(source)
+            return self.sources[source]
+        prog = await asyncio.get_running_loop().run_in_executor(None, prepare, code, source)
+        digest = prog.digest()
+        self.programs[digest] = prog
+        self.programs.move_to_end(digest)
+        while len(self.programs) > self.max_programs:
+            self.programs.popitem(last=False)
+        if source is not None:
+            self.sources[source] = digest
+            self.sources.move_to_end(source)
+            while len(self.sources) > self.max_programs:
+                self.sources.popitem(last=False)
+        return digest
+
+    def get_program(self, digest):
+        prog = self.programs.get(digest)
+        if prog is not None:
+            self.programs.move_to_end(digest)
+        return prog
+
+    async def handle(self, reader, writer):
+        async def send(message):
+            writer.write(json.dumps(message).encode('utf-8') + b'\n')
+            await writer.drain()
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                    if not line:
+                        break
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError('A request must be a JSON object.')
+                    if request.get('op') == 'load':
+                        code, source = request.get('code'), request.get('source')
+                        if not isinstance(code, (str, type(None))) or not isinstance(source, (str, type(None))):
+                            raise ValueError('code and source must be strings.')
+                        await send({'program': await self.load(code, source)})
+                    elif request.get('op') == 'run':
+                        await self.run_session(request, reader, send)
+                    else:
+                        await send({'error': f'Unknown op {request.get("op")!r}.'})
+                except (ValueError, RuntimeError, SyntaxError, AssertionError, IndexError, EOFError) as exc:
+                    await send({'error': str(exc)})
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def run_session(self, request, reader, send):
+        prog = self.get_program(request.get('program'))
+        if prog is None:
+            raise ValueError(f'Unknown program {request.get("program")!r}.')
+        max_steps = request.get('max_steps')
+        if max_steps is not None and (not isinstance(max_steps, int) or isinstance(max_steps, bool)):
+            raise ValueError('max_steps must be an integer.')
+        input_string = request.get('input')
+        if input_string is not None and not isinstance(input_string, str):
+            raise ValueError('input must be a string.')
+        if self.max_steps is not None:
+            max_steps = self.max_steps if max_steps is None else min(max_steps, self.max_steps)
+        pending = [input_string] if input_string else []
+        if self.slots is None:
+            self.slots = asyncio.Semaphore(self.max_sessions)
+        # The run holds one of the slots only while it computes. It gives the
+        # slot back while it waits for the client to send input or to take
+        # output, so idle sessions do not keep others from running.
+        held = False
+
+        async def acquire():
+            nonlocal held
+            await self.slots.acquire()
+            held = True
+
+        def release():
+            nonlocal held
+            held = False
+            self.slots.release()
+
+        async def read():
+            if pending:
+                return pending.pop()
+            release()
+            await send({'input': True})
+            while line := await reader.readline():
+                message = json.loads(line)
+                if not isinstance(message, dict):
+                    raise ValueError('A request must be a JSON object.')
+                if message.get('op') != 'input':
+                    raise ValueError(f'Expected an input op, got {message.get("op")!r}.')
+                if message.get('eof'):
+                    break
+                if not isinstance(message.get('data', ''), str):
+                    raise ValueError('data must be a string.')
+                if message.get('data'):
+                    await acquire()
+                    return message['data']
+            await acquire()
+            return ''
+
+        async def write(chunk):
+            release()
+            await send({'output': chunk})
+            await acquire()
+
+        await acquire()
+        try:
+            dp, _, step = await execute_async(prog, read, write, max_steps=max_steps)
+        finally:
+            if held:
+                release()
+        await send({'done': True, 'dp': dp, 'step': step})
+
+
+async def start(server, unix=None, host='127.0.0.1', port=7878):
+    if unix:
+        return await asyncio.start_unix_server(server.handle, path=unix, limit=LIMIT)
+    return await asyncio.start_server(server.handle, host=host, port=port, limit=LIMIT)
+
+
+async def serve_forever(server, unix=None, host='127.0.0.1', port=7878):
+    async with await start(server, unix, host, port) as listener:
+        await listener.serve_forever()
@@ -26,6 +26,44 @@ def inc(num):
         return '+' * num
 
 
+def short_inc(num):
+    '''increment by num modulo 256, going down for values above 128'''
+    num &= 0xFF
+    return inc(num - 256 if num > 128 else num)
+
+
+def constant(value):
+    '''Cheapest code found that sets the current cell from 0 to value.
+
+    Besides the plain run of "+" or "-" in the shorter direction, it tries the
+    multiplication loops r >a[<b>-] with a * b + r = value modulo 256, where a
+    counts down in the next cell. Both cells must start as 0, and the pointer
+    ends on the next cell, which is 0 again.
+
+    The cost of a code is its length plus the steps it takes, that is what it
+    adds to the program and to one run of it; ties go to the shorter code. A
+    loop always takes more steps than the plain run, so it only wins when it
+    saves more characters than it adds steps.
+    '''
+    value &= 0xFF
+    best = short_inc(value) + '>'
+    cost = (len(best) * 2, len(best))
+    for a in range(2, 16):
+        for target in (value, value - 256):
+            for b in {target // a, -(-target // a)}:
+                if not b:
+                    continue
+                code = f'{inc(target - a * b)}>{"+" * a}[<{inc(b)}>-]'
+                steps = abs(target - a * b) + a + 2 + a * (abs(b) + 4)
+                if (len(code) + steps, len(code)) < cost:
+                    best, cost = code, (len(code) + steps, len(code))
+    return best
+
+
+# Code of load_constant outside of loops, for all 256 values.
+CONSTANTS = [constant(value) for value in range(256)]
+
+
 def multi_dst_add(dsts):
     assert dsts
     assert 0 not in dsts
@@ -74,9 +112,19 @@ class StackMachine:
         self.dp = 0
         self.controlstack = []
 
+    def looping(self):
+        '''Whether the code being generated is inside a while loop.'''
+        return any(kind == 'while' for kind, _ in self.controlstack)
+
     def load_constant(self, value, debug=False):
+        '''push value
+
+        The cell at the stack top is already 0. Inside a while loop, where
+        the code runs many times, value is added in the fewest steps;
+        elsewhere the cheapest code from CONSTANTS is used.
+        '''
         code = f'lc {sanitize(value)}: ' if debug else ''
-        code += f'[-]{inc(value)}>'
+        code += f'{short_inc(value)}>' if self.looping() else CONSTANTS[value & 0xFF]
         self.dp += 1
         return code + '\n' if debug else code
 
@@ -103,6 +151,42 @@ class StackMachine:
         code += multi_dst_add([rpos])
         return code + '\n' if debug else code
 
+    def increment_variable(self, pos, value, debug=False):
+        '''add value to data[pos] in place'''
+        assert 0 <= pos < self.dp
+        rpos = pos - self.dp
+        code = f'incv {pos} {sanitize(value)}: ' if debug else ''
+        code += mvp(rpos)
+        code += short_inc(value)
+        code += mvp(-rpos)
+        return code + '\n' if debug else code
+
+    def store_constant(self, pos, value, debug=False):
+        '''set data[pos] to value in place'''
+        assert 0 <= pos < self.dp
+        rpos = pos - self.dp
+        code = f'setv {pos} {sanitize(value)}: ' if debug else ''
+        code += mvp(rpos)
+        code += f'[-]{short_inc(value)}'
+        code += mvp(-rpos)
+        return code + '\n' if debug else code
+
+    def copy_variable(self, src, dst, debug=False):
+        '''copy data[src] to data[dst] through the free cell at the stack top'''
+        assert 0 <= src < self.dp
+        assert 0 <= dst < self.dp
+        assert src != dst
+        code = f'cpv {src} {dst}: ' if debug else ''
+        code += mvp(dst - self.dp)
+        code += '[-]'
+        code += mvp(self.dp - dst)
+        code += '[-]'
+        code += mvp(src - self.dp)
+        code += multi_dst_add([dst - src, self.dp - src])
+        code += mvp(self.dp - src)
+        code += multi_dst_add([src - self.dp])
+        return code + '\n' if debug else code
+
     def add(self, debug=False):
         assert 1 < self.dp
         code = f'add: ' if debug else ''
@@ -367,7 +451,7 @@ class StackMachine:
         return code + '\n' if debug else code
 
     def pop(self, amount, debug=False):
-        assert 0 < self.dp
+        assert amount <= self.dp
         assert 0 <= amount
         code = f'pop {sanitize(amount)}: ' if debug else ''
         code += '<[-]' * amount
@@ -403,22 +487,22 @@ class StackMachine:
         assert 0 <= self.dp
         assert len(shape) > 0
         assert 0 not in shape
-        code = f'push multi dim array ({" ".join(map(str, shape))}): ' if debug else ''
+        code = [f'push multi dim array ({" ".join(map(str, shape))}): ' if debug else '']
 
         def initialize(shape, dim):
-            nonlocal code
             if dim == len(shape) - 1:
                 for i in range(shape[dim]):
-                    code += self.load_constant(0, False)
+                    code.append(self.load_constant(0, False))
                 for _ in range(4):
-                    code += self.load_constant(0, False)
+                    code.append(self.load_constant(0, False))
             else:
                 for i in range(shape[dim]):
                     initialize(shape, dim + 1)
             if dim != 0:
-                code += self.load_constant(0, False)
+                code.append(self.load_constant(0, False))
 
         initialize(shape, 0)
+        code = ''.join(code)
         return code + '\n' if debug else code
 
     def multi_dim_load(self, pos, shape, debug=False):
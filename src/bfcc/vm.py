@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+
+import io
+import sys
+
+from .lexer import Lexer, Token
+from .parser import (
+    ExpArrayElement,
+    ExpBinaryOperation,
+    ExpBoolean,
+    ExpCall,
+    ExpCharacter,
+    ExpInteger,
+    ExpUnaryOperation,
+    ExpVariable,
+    Parser,
+    StAssign,
+    StCall,
+    StFor,
+    StIf,
+    StInitArray,
+    StInitVariable,
+    StWhile,
+)
+
+BINARY = {
+    Token.AND: lambda x, y: int(bool(x) and bool(y)),
+    Token.OR: lambda x, y: int(bool(x) or bool(y)),
+    Token.PLUS: lambda x, y: x + y,
+    Token.MINUS: lambda x, y: x - y,
+    Token.STAR: lambda x, y: x * y,
+    Token.SLASH: lambda x, y: x // y,
+    Token.PERCENT: lambda x, y: x % y,
+    Token.EQ: lambda x, y: int(x == y),
+    Token.NEQ: lambda x, y: int(x != y),
+    Token.GT: lambda x, y: int(x > y),
+    Token.GE: lambda x, y: int(x >= y),
+    Token.LT: lambda x, y: int(x < y),
+    Token.LE: lambda x, y: int(x <= y),
+}
+
+COMPOUND = {
+    Token.ADDASSIGN: Token.PLUS,
+    Token.SUBASSIGN: Token.MINUS,
+    Token.MULASSIGN: Token.STAR,
+    Token.DIVASSIGN: Token.SLASH,
+    Token.MODASSIGN: Token.PERCENT,
+}
+
+
+class Cell:
+    def __init__(self):
+        self.value = 0
+
+
+class Array:
+    def __init__(self, shape):
+        self.shape = shape
+        size = 1
+        for dim in shape:
+            size *= dim
+        self.values = [0] * size
+
+    def offset(self, indices):
+        offset = 0
+        for dim, idx in zip(self.shape, indices):
+            if not 0 <= idx < dim:
+                raise IndexError(f'Array index {idx} out of range {dim}.')
+            offset = offset * dim + idx
+        return offset
+
+
+class VM:
+    '''Reference semantics of the bfcc language on the AST.
+
+    Mirrors the compiled code, including what C would leave unspecified: every
+    local of a block is allocated (zeroed) once when the block is entered, so
+    `var x;` without an initializer keeps its value across loop iterations,
+    operands are evaluated left to right, array indices right to left, and a
+    compound assignment to an array element evaluates the indices twice.
+    Storage is keyed by the Symbol the parser resolved each name to.
+    '''
+
+    def __init__(self, ist=sys.stdin, ost=sys.stdout):
+        self.ist = ist
+        self.ost = ost
+        self.storage = {}
+
+    def lookup(self, symbol):
+        return self.storage[symbol]
+
+    def allocate(self, statements):
+        for st in statements:
+            if isinstance(st, StInitVariable):
+                self.storage[st.symbol] = Cell()
+            elif isinstance(st, StInitArray):
+                self.storage[st.symbol] = Array(st.eval_shape())
+
+    def run(self, prog):
+        for st in prog.statements:
+            self.allocate([st])
+            self.execute(st)
+
+    def block(self, statements):
+        for st in statements:
+            self.execute(st)
+
+    def execute(self, st):
+        if isinstance(st, StAssign):
+            self.assign(st.lhs, st.mode, st.rhs)
+        elif isinstance(st, StInitVariable):
+            if st.rhs:
+                self.assign(ExpVariable(st.name, st.symbol), Token.ASSIGN, st.rhs)
+        elif isinstance(st, StInitArray):
+            pass
+        elif isinstance(st, StCall):
+            self.call(st)
+        elif isinstance(st, StWhile):
+            self.allocate(st.body)
+            while self.evaluate(st.cond):
+                self.block(st.body)
+        elif isinstance(st, StIf):
+            self.allocate(st.body_then)
+            self.allocate(st.body_else)
+            if self.evaluate(st.cond):
+                self.block(st.body_then)
+            else:
+                self.block(st.body_else)
+        elif isinstance(st, StFor):
+            for init in st.inits:
+                self.allocate([init])
+                self.execute(init)
+            self.allocate(st.body)
+            while self.evaluate(st.cond):
+                self.block(st.body)
+                self.block(st.reinits)
+        else:
+            raise SyntaxError(f'Unknown statement {st!r}.')
+
+    def indices(self, expr):
+        values = [self.evaluate(idx) for idx in expr.indices[::-1]]
+        return values[::-1]
+
+    def assign(self, lhs, mode, rhs):
+        target = self.lookup(lhs.symbol)
+        if mode == Token.ASSIGN:
+            value = self.evaluate(rhs)
+        else:
+            value = BINARY[COMPOUND[mode]](self.evaluate(lhs), self.evaluate(rhs)) & 0xFF
+        if isinstance(target, Cell):
+            target.value = value
+        else:
+            target.values[target.offset(self.indices(lhs))] = value
+
+    def call(self, st):
+        name = st.expr.name
+        if name not in ['putchar', 'putint']:
+            self.evaluate(st.expr)
+            return
+        value = self.evaluate(st.expr.args[0])
+        if name == 'putchar':
+            self.ost.write(chr(value))
+            return
+        if value >= 100:
+            self.ost.write(chr(value // 100 + 48))
+        if value >= 10:
+            self.ost.write(chr(value % 100 // 10 + 48))
+        self.ost.write(chr(value % 10 + 48))
+
+    def getchar(self):
+        ch = self.ist.read(1)
+        if not ch:
+            raise EOFError('end of input')
+        return ord(ch) & 0xFF
+
+    def getint(self):
+        ret = 0
+        inp = 0
+        while True:
+            ret = (ret * 10 + inp) & 0xFF
+            inp = (self.getchar() - 48) & 0xFF
+            if not inp < 10:
+                return ret
+
+    def evaluate(self, expr):
+        if isinstance(expr, (ExpInteger, ExpCharacter)):
+            return expr.value & 0xFF
+        if isinstance(expr, ExpVariable):
+            return self.lookup(expr.symbol).value
+        if isinstance(expr, ExpArrayElement):
+            array = self.lookup(expr.symbol)
+            return array.values[array.offset(self.indices(expr))]
+        if isinstance(expr, ExpBinaryOperation):
+            left = self.evaluate(expr.left)
+            right = self.evaluate(expr.right)
+            return BINARY[expr.mode](left, right) & 0xFF
+        if isinstance(expr, ExpUnaryOperation):
+            value = self.evaluate(expr.operand)
+            if expr.mode == Token.NOT:
+                return int(not value)
+            if expr.mode == Token.MINUS:
+                return -value & 0xFF
+            return value
+        if isinstance(expr, ExpBoolean):
+            return int(bool(self.evaluate(expr.operand)))
+        if isinstance(expr, ExpCall):
+            if expr.name == 'getchar':
+                return self.getchar()
+            if expr.name == 'getint':
+                return self.getint()
+            raise SyntaxError(f'Undefined function named {expr.name}.')
+        raise SyntaxError(f'Unknown expression {expr!r}.')
+
+
+def run_source(text, input_string=''):
+    '''Parse text and run it on the VM. Returns the output.'''
+    prog = Parser(Lexer(text)).parse_program()
+    ost = io.StringIO()
+    VM(io.StringIO(input_string), ost).run(prog)
+    return ost.getvalue()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+
+import ctypes
+import ctypes.util
+import io
+import os
+import select
+import struct
+import sys
+import time
+
+from . import bfz
+from .cli import ERRORS
+from .emit import atomic_open
+from .engine import execute
+from .incremental import StatementCache, TokenCache
+from .lexer import Lexer
+from .parser import Parser
+
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+EVENT = struct.Struct('iIII')
+
+# Editors write a file in several steps; wait this long for the last of them.
+SETTLE = 0.02
+
+
+class PollWatcher:
+    '''Detect changes of a file by polling its stat every interval seconds.'''
+
+    def __init__(self, path, interval=0.1):
+        self.path = path
+        self.interval = interval
+        self.signature = self._signature()
+
+    def _signature(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def wait(self, timeout=None):
+        '''Block until the file changes. Returns False if timeout seconds pass first.'''
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            signature = self._signature()
+            if signature != self.signature:
+                self.signature = signature
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(self.interval)
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    '''Detect changes of a file with Linux inotify.
+
+    The directory is watched rather than the file, so editors that save by
+    writing a new file and renaming it over the old one are seen as well.
+    '''
+
+    def __init__(self, path, libc):
+        self.directory = os.path.dirname(os.path.abspath(path))
+        self.name = os.fsencode(os.path.basename(path))
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        if libc.inotify_add_watch(self.fd, os.fsencode(self.directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f'inotify_add_watch failed on {self.directory}')
+
+    def _changed(self):
+        changed = False
+        while True:
+            try:
+                data = os.read(self.fd, 1 << 16)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = EVENT.unpack_from(data, offset)
+                offset += EVENT.size
+                changed = changed or data[offset : offset + length].rstrip(b'\0') == self.name
+                offset += length
+
+    def wait(self, timeout=None):
+        '''Block until the file changes. Returns False if timeout seconds pass first.'''
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+            if not select.select([self.fd], [], [], remaining)[0]:
+                return False
+            if self._changed():
+                return True
+
+    def close(self):
+        os.close(self.fd)
+
+
+def watcher(path, interval=0.1):
+    '''Return an InotifyWatcher for path where inotify is available, otherwise a PollWatcher.'''
+    name = ctypes.util.find_library('c') if sys.platform.startswith('linux') else None
+    if name:
+        libc = ctypes.CDLL(name, use_errno=True)
+        if hasattr(libc, 'inotify_init1'):
+            try:
+                return InotifyWatcher(path, libc)
+            except OSError:
+                pass
+    return PollWatcher(path, interval)
+
+
+class Session:
+    '''Rebuild one source into one output, keeping tokens and statement code between builds.'''
+
+    def __init__(
+        self, source, output, debug=False, run_input=None, store=None, log=sys.stderr, ost=sys.stdout, optimize=0
+    ):
+        self.source = source
+        self.output = output
+        self.debug = debug
+        self.optimize = optimize
+        self.run_input = run_input
+        self.tokens = TokenCache()
+        self.statements = StatementCache(store=store)
+        self.log = log
+        self.ost = ost
+        self.text = None
+        self.last = None
+
+    def build(self):
+        '''Compile and write the output if the source changed. Returns the code, or None.'''
+        with open(self.source, encoding='utf-8') as file:
+            text = file.read()
+        if text == self.text:
+            return None
+        self.text = text
+        hits, misses = self.statements.hits, self.statements.misses
+        begin = time.perf_counter()
+        try:
+            tokens = self.tokens.lex(text)
+            code, prog = Parser(Lexer(tokens)).parse_program().folded(self.debug, self.statements, self.optimize)
+            with atomic_open(self.output, 'wb') as file:
+                file.write(bfz.dumps(prog) if bfz.is_bfz(self.output) else code.encode('utf-8'))
+        except ERRORS as exc:
+            print(f'bfcc: error: {exc}', file=self.log, flush=True)
+            return None
+        elapsed = time.perf_counter() - begin
+        reused = self.statements.hits - hits
+        generated = self.statements.misses - misses
+        print(
+            f'built {self.output} in {elapsed * 1000:.1f} ms '
+            f'({self.tokens.relexed} tokens lexed, {reused} statements reused, {generated} generated)',
+            file=self.log,
+            flush=True,
+        )
+        if self.run_input is not None:
+            self.run(prog)
+        return code
+
+    def run(self, prog):
+        '''Run the FoldedProgram prog on run_input and report its time and steps against the previous run.'''
+        with open(self.run_input, encoding='utf-8') as file:
+            data = file.read()
+        ost = io.StringIO()
+        begin = time.perf_counter()
+        try:
+            _, _, step = execute(prog, io.StringIO(data), ost)
+        except ERRORS as exc:
+            print(f'bfcc: error: {exc}', file=self.log, flush=True)
+            return
+        elapsed = time.perf_counter() - begin
+        self.ost.write(ost.getvalue())
+        self.ost.flush()
+        line = f'ran {self.run_input} in {elapsed:.3f} s, {step} steps'
+        if self.last is not None:
+            last_elapsed, last_step = self.last
+            line += f' ({elapsed - last_elapsed:+.3f} s, {step - last_step:+d} steps)'
+        print(line, file=self.log, flush=True)
+        self.last = (elapsed, step)
+
+
+def watch(source, output, debug=False, run_input=None, store=None, interval=0.1, log=sys.stderr, optimize=0):
+    '''Rebuild output whenever source changes, until interrupted.'''
+    session = Session(source, output, debug, run_input, store, log, optimize=optimize)
+    files = watcher(source, interval)
+    print(f'watching {source} ({type(files).__name__})', file=log, flush=True)
+    try:
+        session.build()
+        while True:
+            files.wait()
+            while files.wait(SETTLE):
+                pass
+            try:
+                session.build()
+            except OSError as exc:
+                # The file may be missing for a moment while an editor replaces it.
+                print(f'bfcc: error: {exc}', file=log, flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        files.close()
+    return 0
@@ -0,0 +1,105 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from test import ROOT
+
+from bfcc.bench import (
+    PHASES,
+    SHAPES,
+    ast_memory,
+    bench,
+    corpus,
+    fit_exponent,
+    main,
+    measure_ast,
+    rebuild,
+    regressions,
+    scaling,
+    synthesize,
+)
+from bfcc.compiler import compile_source
+
+PROGRAMS = ['for', 'gcd', 'localvariable']
+
+
+class TestBench(unittest.TestCase):
+    def test_corpus_inputs(self):
+        cases = {(name, input_name) for name, _, input_name, _ in corpus(ROOT / 'data')}
+        self.assertIn(('for', 'none'), cases)
+        self.assertIn(('gcd', '48-18'), cases)
+        self.assertIn(('life', 'glider'), cases)
+        self.assertIn(('sudoku', 'prob1'), cases)
+        self.assertNotIn('lextest', {name for name, _ in cases})
+
+    def test_engines_agree(self):
+        results = bench(ROOT / 'data', PROGRAMS, log=io.StringIO())
+        for name in ['for/none', 'gcd/48-18', 'localvariable/none']:
+            steps = {results[f'{name}/{engine}']['steps'] for engine in ['interpreter', 'folded', 'coroutine']}
+            self.assertEqual(1, len(steps))
+        self.assertEqual(237668, results['for/none/folded']['steps'])
+
+    def test_regressions(self):
+        results = bench(ROOT / 'data', ['for'], ['folded'])
+        baseline = {key: dict(row) for key, row in results.items()}
+        self.assertEqual([], regressions(results, baseline))
+        baseline['for/none/folded']['steps'] //= 2
+        self.assertEqual(['steps'], [metric for _, metric, _, _ in regressions(results, baseline)])
+
+    def test_synthesized_sources_compile(self):
+        for shape in SHAPES:
+            compile_source(synthesize(shape, 20))
+
+    def test_scaling(self):
+        results, exponents = scaling(['statements', 'blocks'], [20, 40])
+        row = results['scaling/statements/40']
+        for phase in ['lexer', 'parser', 'codegen']:
+            self.assertGreater(row[f'{phase}_time'], 0)
+            self.assertGreater(row[f'{phase}_peak'], 0)
+        self.assertIn('blocks/codegen', exponents)
+
+    def test_exponent_regressions(self):
+        baseline = {'exponents': {'blocks/parser': 1.0, 'blocks/codegen': 1.0, 'blocks/lexer': None}}
+        results = {'exponents': {'blocks/parser': 1.2, 'blocks/codegen': 2.0, 'blocks/lexer': 1.0}}
+        self.assertEqual([('exponents', 'blocks/codegen', 1.0, 2.0)], regressions(results, baseline))
+        self.assertEqual([], regressions(results, baseline, slack=1.0))
+
+    def test_scaling_baseline(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'scaling.json')
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(0, main(['--scaling', '--shape', 'blocks', '--sizes', '20', '40', '--save', path]))
+            with open(path, encoding='utf-8') as file:
+                saved = json.load(file)
+            self.assertEqual(sorted(f'blocks/{phase}' for phase in PHASES), sorted(saved['exponents']))
+            for phase in PHASES:
+                saved['exponents'][f'blocks/{phase}'] = -10.0
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(saved, file)
+            stdout = io.StringIO()
+            with redirect_stdout(stdout):
+                argv = ['--scaling', '--shape', 'blocks', '--sizes', '20', '40', '--baseline', path, '--threshold', '1e9']
+                self.assertEqual(1, main(argv))
+            self.assertIn('regression: exponents blocks/parser -10 ->', stdout.getvalue())
+
+    def test_fit_exponent(self):
+        self.assertAlmostEqual(2.0, fit_exponent([10, 100, 1000], [1e-4, 1e-2, 1.0]))
+        self.assertAlmostEqual(1.0, fit_exponent([10, 100, 1000], [1e-3, 1e-2, 1e-1]))
+
+    def test_rebuild(self):
+        results = rebuild([2000])
+        row = results['rebuild/2000']
+        self.assertEqual(1, row['generated'])
+        # Reusing the other statements beats compiling the source from scratch.
+        self.assertLess(row['edit_time'], row['cold_time'])
+
+    def test_ast_memory(self):
+        row = measure_ast(synthesize('statements', 400))
+        self.assertEqual(7 * 400 + 8, row['nodes'])
+        # Slotted nodes stay well under the ~100 bytes of a node with a __dict__.
+        self.assertLess(row['bytes_per_node'], 80)
+        results = ast_memory(ROOT / 'data', ['for'], [10])
+        self.assertEqual(['ast/for', 'ast/statements/10'], sorted(results))
@@ -0,0 +1,53 @@
+import io
+import unittest
+
+from test import ROOT
+
+from bfcc import bfz
+from bfcc.compiler import compile_folded, compile_source
+from bfcc.engine import execute, fold
+from bfcc.interpreter import interpreter
+
+DATA = ROOT / 'data'
+
+
+class TestBfz(unittest.TestCase):
+    def test_roundtrip(self):
+        code = compile_source((DATA / 'for.txt').read_text())
+        data = bfz.dumps(code)
+        self.assertLess(len(data), len(code))
+        self.assertEqual(code, bfz.unpack(data))
+
+    def test_engine_matches_interpreter(self):
+        code = compile_source((DATA / 'for.txt').read_text())
+        ost1 = io.StringIO()
+        ost2 = io.StringIO()
+        expected = interpreter(code, io.StringIO(), ost1)
+        actual = execute(bfz.loads(bfz.dumps(code)), io.StringIO(), ost2)
+        self.assertEqual(expected, actual)
+        self.assertEqual(ost1.getvalue(), ost2.getvalue())
+
+    def test_source_map(self):
+        prog = bfz.loads(bfz.dumps('+[->+<]@', source_map=[(0, 1), (2, 3)]))
+        self.assertEqual([(0, 1), (2, 3)], prog.source_map)
+        self.assertEqual('+[->+<]@', prog.commands())
+
+    def test_compiled_source_map(self):
+        text = "var x = 'a';\n\nputchar(x);\nputchar(x);\n"
+        prog = compile_folded(text)
+        self.assertEqual([1, 3, 4], [line for _, line in prog.source_map])
+        self.assertEqual(prog.commands(), fold(compile_source(text)).commands())
+        # Each statement starts in the op that holds the first command after the code of the ones before it.
+        owner = [index for index, (_, count) in enumerate(prog.ops) for _ in range(count)]
+        for (index, _), before in zip(prog.source_map, ['', "var x = 'a';", "var x = 'a';\n\nputchar(x);"]):
+            self.assertEqual(owner[len(fold(compile_source(before)).commands())], index)
+        self.assertEqual(prog.source_map, bfz.loads(bfz.dumps(prog)).source_map)
+        self.assertEqual([], compile_folded(text, optimize=1).source_map)
+        self.assertEqual([1, 3, 4], [line for _, line in compile_folded(text, debug=True).source_map])
+
+    def test_breakpoint_and_unmatched(self):
+        self.assertEqual(interpreter('++@++', io.StringIO(), io.StringIO()), execute(fold('++@++')))
+        with self.assertRaises(SyntaxError):
+            fold('[[]')
+        with self.assertRaises(SyntaxError):
+            bfz.loads(b'nope')
@@ -0,0 +1,69 @@
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from test import ROOT
+
+from bfcc import bfz
+from bfcc.build import build, build_parser
+from bfcc.cli import main
+from bfcc.compiler import compile_source
+
+PROGRAMS = ['for', 'gcd', 'localvariable', 'fizzbuzz']
+
+
+class TestBuild(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.tmp = Path(self.tmpdir.name)
+        self.sources = []
+        for name in PROGRAMS:
+            path = self.tmp / 'src' / f'{name}.txt'
+            path.parent.mkdir(exist_ok=True)
+            path.write_text((ROOT / 'data' / f'{name}.txt').read_text(encoding='utf-8'), encoding='utf-8')
+            self.sources += [str(path)]
+
+    def test_parallel_build(self):
+        out = self.tmp / 'out'
+        cache = str(self.tmp / 'cache')
+        results = build(self.sources, str(out), jobs=2, cache_dir=cache)
+        self.assertEqual(['built'] * len(PROGRAMS), [result.status for result in results])
+        for name, source in zip(PROGRAMS, self.sources):
+            expected = compile_source(Path(source).read_text(encoding='utf-8'))
+            self.assertEqual(expected, (out / f'{name}.bf').read_text(encoding='utf-8'))
+        mtime = (out / 'for.bf').stat().st_mtime_ns
+        results = build(self.sources, str(out), jobs=2, cache_dir=cache)
+        self.assertEqual(['unchanged'] * len(PROGRAMS), [result.status for result in results])
+        self.assertEqual(mtime, (out / 'for.bf').stat().st_mtime_ns)
+        (out / 'gcd.bf').unlink()
+        results = build(self.sources, str(out), jobs=1, cache_dir=cache)
+        self.assertEqual('cached', results[1].status)
+        self.assertTrue((out / 'gcd.bf').exists())
+
+    def test_errors_and_bfz(self):
+        bad = self.tmp / 'src' / 'bad.txt'
+        bad.write_text('x = 1;\n', encoding='utf-8')
+        out = self.tmp / 'out'
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            code = main(['build', '-j', '2', '--bfz', '--out-dir', str(out), str(bad)] + self.sources)
+        self.assertEqual(1, code)
+        self.assertIn('error', stdout.getvalue())
+        self.assertIn(f'{len(PROGRAMS)} built, 1 error', stdout.getvalue())
+        self.assertFalse((out / 'bad.bfz').exists())
+        expected = compile_source(Path(self.sources[0]).read_text(encoding='utf-8'))
+        self.assertEqual(expected, bfz.unpack((out / 'for.bfz').read_bytes()))
+
+    def test_shared_options(self):
+        args = build_parser().parse_args(['--out-dir', 'out', '-O1', '--cache-dir', 'c', '--cache-size', '4096', 'a.txt'])
+        self.assertEqual((1, 'c', 4096), (args.optimize, args.cache_dir, args.cache_size))
+
+    def test_duplicate_outputs(self):
+        other = self.tmp / 'other' / 'for.txt'
+        other.parent.mkdir()
+        other.write_text('', encoding='utf-8')
+        with self.assertRaises(RuntimeError):
+            build([self.sources[0], str(other)], str(self.tmp / 'out'))
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from bfcc.cache import CompilationCache
+from bfcc.compiler import compile_folded, compile_source
+
+
+class TestCache(unittest.TestCase):
+    def test_key_depends_on_options(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CompilationCache(tmpdir)
+            self.assertEqual(cache.key('x', debug=False), cache.key('x', debug=False))
+            self.assertNotEqual(cache.key('x', debug=False), cache.key('x', debug=True))
+            self.assertNotEqual(cache.key('x'), cache.key('y'))
+
+    def test_key_depends_on_compiler_sources(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CompilationCache(tmpdir)
+            key = cache.key('x', debug=False)
+            with mock.patch('bfcc.cache.source_digest', return_value='edited compiler'):
+                self.assertNotEqual(key, cache.key('x', debug=False))
+
+    def test_compile_hit(self):
+        source = "putchar('A');\n"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CompilationCache(tmpdir)
+            code = compile_source(source, cache=cache)
+            key = cache.key(source, debug=False)
+            self.assertEqual(code.encode(), cache.get(key, 'code.bf'))
+            # The .bfz is only stored once something asks for it.
+            self.assertIsNone(cache.get(key, 'code.bfz'))
+            compile_folded(source, cache=cache)
+            self.assertIsNotNone(cache.get(key, 'code.bfz'))
+            cache.put(key, {'code.bf': b'cached'})
+            self.assertEqual('cached', compile_source(source, cache=cache))
+
+    def test_lru_eviction(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CompilationCache(tmpdir, max_bytes=350)
+            for i, key in enumerate(['aa01', 'aa02', 'aa03']):
+                cache.put(key, {'code.bf': b'x' * 100})
+                os.utime(cache.path(key), (i, i))
+            cache.get('aa01', 'code.bf')
+            cache.put('aa04', {'code.bf': b'x' * 100})
+            self.assertIsNotNone(cache.get('aa01', 'code.bf'))
+            self.assertIsNone(cache.get('aa02', 'code.bf'))
+            self.assertIsNotNone(cache.get('aa03', 'code.bf'))
+            self.assertIsNotNone(cache.get('aa04', 'code.bf'))
+
+    def test_put_does_not_scan(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CompilationCache(tmpdir, max_bytes=1000)
+            scans = []
+            entries = cache.entries
+            cache.entries = lambda: scans.append(1) or entries()
+            for i in range(9):
+                cache.put(f'bb{i:02}', {'code.bf': b'x' * 100})
+            # Only the first put scans, to count what is already there.
+            self.assertEqual(1, len(scans))
+            cache.put('bb09', {'code.bf': b'x' * 200})
+            self.assertEqual(2, len(scans))
+            self.assertEqual(900, sum(size for _, size, _ in entries()))
+
+    def test_merge_counts_only_growth(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CompilationCache(tmpdir)
+            cache.put('cc01', {'code.bf': b'x' * 100})
+            for _ in range(3):
+                cache.put('cc01', {'code.bf': b'y' * 100})
+            cache.put('cc01', {'code.bfz': b'z' * 50})
+            self.assertEqual(150, cache._total())
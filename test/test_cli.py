@@ -1,13 +1,47 @@
+import asyncio
+import contextlib
 import io
+import os
+import socket
 import tempfile
+import threading
 import unittest
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
+from unittest import mock
 
+from test import ROOT
+
+from bfcc import daemon
+from bfcc.bench import synthesize
 from bfcc.cli import main
 from bfcc.compiler import compile_source
 
 
+@contextlib.contextmanager
+def serving(server, path):
+    '''Run the daemon server on path in a background thread.'''
+    ready = threading.Event()
+    loop = asyncio.new_event_loop()
+    stop = asyncio.Event()
+
+    async def serve():
+        listener = await daemon.start(server, path)
+        ready.set()
+        async with listener:
+            await stop.wait()
+
+    thread = threading.Thread(target=lambda: loop.run_until_complete(serve()), daemon=True)
+    thread.start()
+    ready.wait(10)
+    try:
+        yield
+    finally:
+        loop.call_soon_threadsafe(stop.set)
+        thread.join(10)
+        loop.close()
+
+
 class TestCli(unittest.TestCase):
     def test_compile_to_stdout(self):
         source = "putchar('A');\n"
@@ -38,9 +72,138 @@ class TestCli(unittest.TestCase):
             self.assertEqual('', stderr.getvalue())
             self.assertEqual(expected, output_path.read_text(encoding='utf-8'))
 
+    def test_streamed_output(self):
+        source = (ROOT / 'data' / 'sudoku.txt').read_text(encoding='utf-8')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / 'input.txt'
+            output_path = Path(tmpdir) / 'out.bf'
+            input_path.write_text(source, encoding='utf-8')
+            for debug in [[], ['--debug']]:
+                argv = [str(input_path), '-o', str(output_path), '--no-daemon'] + debug
+                self.assertEqual(0, main(argv))
+                self.assertEqual(compile_source(source, bool(debug)), output_path.read_text(encoding='utf-8'))
+
+    def test_optimized_output(self):
+        source = (ROOT / 'data' / 'gcd.txt').read_text(encoding='utf-8')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / 'input.txt'
+            output_path = Path(tmpdir) / 'out.bf'
+            input_path.write_text(source, encoding='utf-8')
+            for cache in [[], ['--cache-dir', str(Path(tmpdir) / 'cache')]]:
+                self.assertEqual(0, main([str(input_path), '-o', str(output_path), '--no-daemon', '-O1'] + cache))
+                optimized = output_path.read_text(encoding='utf-8')
+                self.assertEqual(compile_source(source, optimize=1), optimized)
+                self.assertLess(len(optimized), len(compile_source(source)))
+            self.assertEqual(0, main([str(input_path), '-o', str(output_path), '--no-daemon', '-O1', '--debug']))
+            self.assertEqual(compile_source(source, True), output_path.read_text(encoding='utf-8'))
+
+    def test_failed_compile_keeps_output(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / 'input.txt'
+            output_path = Path(tmpdir) / 'out.bf'
+            input_path.write_text('var x = foo();\n', encoding='utf-8')
+            output_path.write_text('old', encoding='utf-8')
+            with redirect_stderr(io.StringIO()):
+                self.assertEqual(1, main([str(input_path), '-o', str(output_path), '--no-daemon']))
+            self.assertEqual('old', output_path.read_text(encoding='utf-8'))
+            self.assertEqual(['input.txt', 'out.bf'], sorted(p.name for p in Path(tmpdir).iterdir()))
+
     def test_missing_input_file(self):
         stderr = io.StringIO()
         with redirect_stderr(stderr):
             code = main(['/tmp/does-not-exist.bfcc-source'])
         self.assertEqual(1, code)
         self.assertIn('bfcc: error:', stderr.getvalue())
+
+    def test_bfz_output_unpack_and_run(self):
+        source = "putchar('C');\n"
+        expected = compile_source(source)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / 'input.txt'
+            bfz_path = Path(tmpdir) / 'out.bfz'
+            bf_path = Path(tmpdir) / 'out.bf'
+            input_path.write_text(source, encoding='utf-8')
+            self.assertEqual(0, main([str(input_path), '-o', str(bfz_path)]))
+            self.assertEqual(0, main(['unpack', str(bfz_path), '-o', str(bf_path)]))
+            self.assertEqual(expected, bf_path.read_text(encoding='utf-8'))
+            stdout = io.StringIO()
+            with redirect_stdout(stdout):
+                self.assertEqual(0, main(['run', str(bfz_path)]))
+            self.assertEqual('C', stdout.getvalue())
+
+    def test_run_past_end_of_input(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'echo.bf'
+            path.write_text(',.,.', encoding='ascii')
+            stdout = io.StringIO()
+            stderr = io.StringIO()
+            with mock.patch('sys.stdin', io.StringIO('a')), redirect_stdout(stdout), redirect_stderr(stderr):
+                self.assertEqual(1, main(['run', str(path)]))
+        self.assertEqual('a', stdout.getvalue())
+        self.assertEqual('bfcc: error: end of input\n', stderr.getvalue())
+
+    def test_daemon_output_is_identical(self):
+        source = (ROOT / 'data' / 'for.txt').read_text(encoding='utf-8')
+        expected = compile_source(source)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / 'bfcc.sock')
+            with serving(daemon.Daemon(), path):
+                self.assertEqual(expected, daemon.request(path, source))
+                with self.assertRaises(RuntimeError):
+                    daemon.request(path, 'x = ;')
+                input_path = Path(tmpdir) / 'input.txt'
+                output_path = Path(tmpdir) / 'out.bf'
+                input_path.write_text(source, encoding='utf-8')
+                self.assertEqual(0, main([str(input_path), '-o', str(output_path), '--socket', path]))
+                self.assertEqual(expected, output_path.read_text(encoding='utf-8'))
+        self.assertIsNone(daemon.request(path, source))
+
+    def test_daemon_long_source(self):
+        source = synthesize('statements', 3000)
+        self.assertGreater(len(source), 1 << 16)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / 'bfcc.sock')
+            with serving(daemon.Daemon(), path):
+                self.assertEqual(compile_source(source), daemon.request(path, source))
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                    sock.connect(path)
+                    sock.sendall(b'not json\n')
+                    self.assertIn(b'"error"', sock.recv(1 << 16))
+
+    def test_daemon_version_mismatch(self):
+        source = "putchar('A');\n"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / 'bfcc.sock')
+            stale = daemon.Daemon()
+            stale.version = 'other sources'
+            with serving(stale, path):
+                self.assertIsNone(daemon.request(path, source))
+                input_path = Path(tmpdir) / 'input.txt'
+                output_path = Path(tmpdir) / 'out.bf'
+                input_path.write_text(source, encoding='utf-8')
+                self.assertEqual(0, main([str(input_path), '-o', str(output_path), '--socket', path]))
+                self.assertEqual(compile_source(source), output_path.read_text(encoding='utf-8'))
+            self.assertEqual({}, dict(stale.memory))
+
+    def test_daemon_socket(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / 'bfcc.sock')
+            with serving(daemon.Daemon(), path):
+                with self.assertRaises(RuntimeError):
+                    asyncio.run(daemon.start(daemon.Daemon(), path))
+                self.assertTrue(daemon.answers(path))
+            # A socket left behind by a daemon that died is replaced.
+            if not os.path.exists(path):
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                    sock.bind(path)
+            self.assertFalse(daemon.answers(path))
+            with serving(daemon.Daemon(), path):
+                self.assertEqual(compile_source("putchar('A');\n"), daemon.request(path, "putchar('A');\n"))
+            shared = Path(tmpdir) / 'shared'
+            shared.mkdir(mode=0o755)
+            os.chmod(shared, 0o755)
+            with self.assertRaises(RuntimeError):
+                daemon.private_directory(str(shared))
+            daemon.private_directory(str(Path(tmpdir) / 'private'))
+            self.assertEqual(0o700, os.stat(Path(tmpdir) / 'private').st_mode & 0o777)
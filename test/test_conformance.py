@@ -0,0 +1,55 @@
+import io
+import unittest
+from unittest import mock
+
+from test import ROOT
+
+from bfcc.conformance import check, check_sources, data_cases, format_matrix, random_cases, snippets, speed_matrix
+from bfcc.engine import ENGINES, execute, fold
+
+
+def run_failing(code, ist, ost):
+    raise EOFError('end of input')
+
+
+def run_broken(code, ist, ost):
+    # Drops every third '+' of a run, like a bad folding pass would.
+    prog = fold(code)
+    prog.ops = [(cmd, count - count // 3) if cmd == '+' else (cmd, count) for cmd, count in prog.ops]
+    return execute(prog, ist, ost)
+
+
+class TestConformance(unittest.TestCase):
+    def test_snippets(self):
+        self.assertEqual([], check(snippets()))
+
+    def test_data(self):
+        self.assertEqual([], check(data_cases(ROOT / 'data', ['for', 'localvariable'])))
+
+    def test_random(self):
+        self.assertEqual([], check(random_cases(100, seed=1)))
+
+    def test_minimized_reproducer(self):
+        engines = dict(ENGINES, broken=run_broken)
+        cases = [('add', code, '') for name, code, _ in snippets() if name == 'add 5 6']
+        failures = check(cases, engines, log=io.StringIO())
+        self.assertEqual(1, len(failures))
+        _, code, _, bad = failures[0]
+        self.assertEqual(['broken'], bad)
+        self.assertEqual('+++', code)
+
+    def test_sources(self):
+        self.assertEqual([], check_sources(3, statements=8, engines={'folded': ENGINES['folded']}))
+
+    def test_sources_compare_errors(self):
+        engines = {'folded': ENGINES['folded'], 'failing': run_failing}
+        failures = check_sources(1, statements=8, engines=engines)
+        self.assertEqual([['failing']], [bad for _, _, bad in failures])
+        with mock.patch('bfcc.conformance.run_source', side_effect=ZeroDivisionError):
+            failures = check_sources(1, statements=8, engines=engines, log=io.StringIO())
+        self.assertEqual([['folded', 'failing']], [bad for _, _, bad in failures])
+
+    def test_matrix(self):
+        matrix = speed_matrix(list(snippets())[:3])
+        self.assertEqual(set(ENGINES), set(next(iter(matrix.values()))))
+        self.assertIn('interpreter', format_matrix(matrix))
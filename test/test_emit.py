@@ -0,0 +1,28 @@
+import io
+import unittest
+
+from bfcc.emit import LineWriter
+
+
+def wrap(chunks, width=80):
+    ost = io.StringIO()
+    writer = LineWriter(ost, width)
+    for chunk in chunks:
+        writer.write(chunk)
+    writer.close()
+    return ost.getvalue()
+
+
+class TestLineWriter(unittest.TestCase):
+    def test_wrap(self):
+        code = '+>-<[.]' * 50
+        expected = ''.join(code[i : i + 80] + '\n' for i in range(0, len(code), 80))
+        self.assertEqual(expected, wrap([code]))
+        self.assertEqual(expected, wrap(code))
+        self.assertEqual(expected, wrap([code[:79], '', code[79:81], code[81:]]))
+
+    def test_edges(self):
+        self.assertEqual('', wrap([]))
+        self.assertEqual('', wrap(['', '']))
+        self.assertEqual('++\n++\n', wrap(['+++', '+'], 2))
+        self.assertEqual('+++\n', wrap(['+++'], 3))
@@ -0,0 +1,46 @@
+import asyncio
+import io
+import unittest
+
+from bfcc.engine import coroutine, execute, execute_async, fold
+
+ECHO = ',[.,]'
+
+
+class TestCoroutine(unittest.TestCase):
+    def test_suspends_on_input(self):
+        gen = coroutine(fold(ECHO))
+        self.assertIsNone(next(gen))
+        self.assertEqual('a', gen.send('a'))
+        self.assertIsNone(next(gen))
+        self.assertEqual('bc', gen.send('bc'))
+        self.assertIsNone(next(gen))
+        with self.assertRaises(StopIteration) as stop:
+            gen.send('\0')
+        self.assertEqual(execute(fold(ECHO), io.StringIO('abc\0'), io.StringIO()), stop.exception.value)
+
+    def test_end_of_input(self):
+        gen = coroutine(fold(ECHO))
+        next(gen)
+        with self.assertRaises(EOFError):
+            gen.send('')
+
+    def test_quantum_yields_control(self):
+        gen = coroutine(fold('+[+]'), quantum=4)
+        chunks = list(gen)
+        self.assertTrue(chunks)
+        self.assertEqual('', ''.join(chunks))
+
+    def test_async(self):
+        inputs = ['hel', 'lo', '\0']
+        outputs = []
+
+        async def read():
+            return inputs.pop(0)
+
+        async def write(chunk):
+            outputs.append(chunk)
+
+        result = asyncio.run(execute_async(fold(ECHO), read, write))
+        self.assertEqual('hello', ''.join(outputs))
+        self.assertEqual(execute(fold(ECHO), io.StringIO('hello\0'), io.StringIO()), result)
@@ -0,0 +1,81 @@
+import io
+import random
+import unittest
+
+from bfcc.compiler import compile_source
+from bfcc.engine import execute, fold
+from bfcc.lexer import Lexer
+from bfcc.parser import Parser
+from bfcc.vm import run_source
+
+
+def ops(text):
+    '''Ops of the last statement of text.'''
+    return [str(op) for op in list(Parser(Lexer(text)).parse_program().operations())[-1][1]]
+
+
+def run(text, input_string=''):
+    ost = io.StringIO()
+    execute(fold(compile_source(text)), io.StringIO(input_string), ost)
+    return ost.getvalue()
+
+
+class TestConstantFolding(unittest.TestCase):
+    def test_constant_subtrees(self):
+        self.assertEqual(['lc 109', 'putc'], ops("putchar(3 * 4 + 'a');"))
+        self.assertEqual(['lc 44', 'putc'], ops('putchar(200 + 100);'))
+        self.assertEqual(['lc 44', 'putc'], ops('putchar(300);'))
+        self.assertEqual(['lc 255', 'putc'], ops('putchar(-1);'))
+        self.assertEqual(['lc 1', 'putc'], ops('putchar(2 < 3 & !0);'))
+        self.assertEqual(['lv 0', 'lc 19', 'lt', 'putc'], ops('var x; putchar(x < 20 - 1);'))
+
+    def test_division_by_zero_is_kept(self):
+        self.assertEqual(['lc 5', 'lc 0', 'div', 'putc'], ops('putchar(5 / 0);'))
+
+    def test_identities(self):
+        prefix = 'var x = getchar();'
+        self.assertEqual(['lv 0', 'putc'], ops(prefix + 'putchar(x + 0);'))
+        self.assertEqual(['lv 0', 'putc'], ops(prefix + 'putchar(0 + x * 1 - 0);'))
+        self.assertEqual(['lv 0', 'putc'], ops(prefix + 'putchar(x / 1);'))
+        self.assertEqual(['lc 0', 'putc'], ops(prefix + 'putchar(x * 0);'))
+        self.assertEqual(['lc 0', 'putc'], ops(prefix + 'putchar((x + 1) - (x + 1));'))
+        self.assertEqual(['lc 0', 'putc'], ops(prefix + 'putchar(x % 1);'))
+        self.assertEqual(['lv 0', 'putc'], ops(prefix + 'putchar(--x);'))
+
+    def test_boolean_normalization(self):
+        prefix = 'var x = getchar();'
+        self.assertEqual(['lv 0', 'bool', 'putc'], ops(prefix + 'putchar(!!x);'))
+        self.assertEqual(['lv 0', 'bool', 'putc'], ops(prefix + 'putchar(x & 1);'))
+        self.assertEqual(['lv 0', 'bool', 'putc'], ops(prefix + 'putchar(0 | x);'))
+        self.assertEqual(['lv 0', 'not', 'putc'], ops(prefix + 'putchar(!!!x);'))
+        self.assertEqual(['lv 0', 'lc 3', 'lt', 'putc'], ops(prefix + 'putchar(!!(x < 3));'))
+        self.assertEqual(['lc 1', 'putc'], ops(prefix + 'putchar(x | 7);'))
+
+    def test_side_effects_are_kept(self):
+        self.assertEqual(['getc', 'lc 0', 'mul', 'putc'], ops('putchar(getchar() * 0);'))
+        self.assertEqual(['getc', 'getc', 'sub', 'putc'], ops('putchar(getchar() - getchar());'))
+        self.assertEqual(['getc', 'putc'], ops('putchar(getchar() + 0);'))
+        self.assertEqual('\x00\xff', run('putchar(getchar() * 0); putchar(getchar() - getchar());', 'abc'))
+
+    def test_array_shapes_are_not_wrapped(self):
+        self.assertEqual('A', run('arr a[16 * 16]; a[255] = 65; putchar(a[255]);'))
+
+    def test_matches_source_semantics(self):
+        rng = random.Random(7)
+
+        def expression(depth):
+            if depth == 0 or rng.random() < 0.3:
+                return rng.choice(['0', '1', '2', 'x', str(rng.randint(0, 300)), "'a'", 'getchar()'])
+            if rng.random() < 0.25:
+                return rng.choice(['!', '-', '+', '!!']) + f'({expression(depth - 1)})'
+            op = rng.choice(['+', '-', '*', '/', '%', '==', '!=', '<', '<=', '>', '>=', '&', '|'])
+            right = expression(depth - 1)
+            if op in '/%':
+                right = f'(({right}) % 7 + 1)'
+            return f'({expression(depth - 1)} {op} {right})'
+
+        for _ in range(40):
+            source = f'var x = {rng.randint(0, 255)}; putint({expression(3)}); putint(x - x + x * 0);'
+            input_string = ''.join(chr(rng.randint(1, 255)) for _ in range(16))
+            with self.subTest(source=source):
+                self.assertEqual(run_source(source, input_string), run(source, input_string))
@@ -0,0 +1,77 @@
+import tempfile
+import unittest
+
+from test import ROOT
+
+from bfcc.cache import CompilationCache
+from bfcc.compiler import compile_source
+from bfcc.incremental import StatementCache, TokenCache
+from bfcc.lexer import Lexer, tokenize
+from bfcc.parser import Parser, references
+
+
+class TestStatementCache(unittest.TestCase):
+    def setUp(self):
+        self.text = (ROOT / 'data' / 'sudoku.txt').read_text(encoding='utf-8')
+
+    def test_sources(self):
+        prog = Parser(Lexer('var x = 1; // one\nx += 2 ;\nif (x) { putchar(x); }')).parse_program()
+        self.assertEqual(['var x = 1 ;', 'x += 2 ;', 'if ( x ) { putchar ( x ) ; }'], prog.sources)
+        prog.codegen(False)
+        self.assertEqual([('x', 0, ())], references(prog.statements[2]))
+        self.assertEqual([], references(prog.statements[0]))
+
+    def test_edit(self):
+        cache = StatementCache()
+        self.assertEqual(compile_source(self.text), compile_source(self.text, statements=cache))
+        count = cache.misses
+        cache.misses = 0
+        edited = self.text.replace("\nputchar('+');\nfor", "\nputchar('*');\nfor", 1)
+        self.assertNotEqual(self.text, edited)
+        self.assertEqual(compile_source(edited), compile_source(edited, statements=cache))
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(count - 1, cache.hits)
+
+    def test_shifted_declarations(self):
+        cache = StatementCache()
+        compile_source(self.text, statements=cache)
+        for edited in ['var extra = 5;\n' + self.text, 'arr extra[3][2];\n' + self.text]:
+            self.assertEqual(compile_source(edited), compile_source(edited, statements=cache))
+            self.assertEqual(compile_source(edited, True), compile_source(edited, True, statements=cache))
+
+    def test_persisted(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = CompilationCache(tmpdir)
+            compile_source(self.text, cache=store)
+            edited = self.text + 'putchar(65);\n'
+            statements = StatementCache(store=store)
+            self.assertEqual(compile_source(edited), compile_source(edited, cache=store, statements=statements))
+            self.assertEqual(1, statements.misses)
+            self.assertGreater(statements.hits, 1)
+
+
+class TestTokenCache(unittest.TestCase):
+    def test_edits(self):
+        text = (ROOT / 'data' / 'sudoku.txt').read_text(encoding='utf-8')
+        cache = TokenCache()
+        self.assertEqual(list(tokenize(text)), cache.lex(text))
+        count = cache.relexed
+        for edited in [
+            text.replace('putchar(', 'putchar (', 1),
+            '// header\n\n' + text,
+            text.replace('\n', '\n/* note\n */', 1),
+            text + 'var tail;',
+            text[: len(text) // 2] + text[len(text) // 2 + 7 :],
+        ]:
+            with self.subTest(edited=edited[:20]):
+                self.assertEqual(list(tokenize(edited)), cache.lex(edited))
+                self.assertLess(cache.relexed, count)
+        self.assertEqual(list(tokenize(text)), cache.lex(text))
+
+    def test_tokens_joined_by_the_edit(self):
+        cache = TokenCache()
+        cache.lex('var ab = 1; x -= 2;')
+        self.assertEqual(list(tokenize('var abc = 1; x - = 2;')), cache.lex('var abc = 1; x - = 2;'))
+        with self.assertRaises(SyntaxError):
+            cache.lex('var abc = 1; x /* = 2;')
+        self.assertEqual(list(tokenize('var abc = 1; x /**/ = 2;')), cache.lex('var abc = 1; x /**/ = 2;'))
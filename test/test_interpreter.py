@@ -0,0 +1,78 @@
+import io
+import runpy
+import sys
+import tempfile
+import unittest
+import warnings
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+from bfcc import bfz
+from bfcc.engine import fold
+from bfcc.interpreter import interpreter, load_program, open_tape
+
+
+class TestInterpreter(unittest.TestCase):
+    def test_mmap_tape_persists(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'tape.bin'
+            with open_tape(path, 16) as tape:
+                dp, data, step = interpreter('+++>++<', io.StringIO(), io.StringIO(), tape=tape)
+                tape.flush()
+            self.assertEqual((0, [3, 2], 7), (dp, data, step))
+            self.assertEqual(bytes([3, 2] + [0] * 14), path.read_bytes())
+
+    def test_mmap_tape_starts_blank(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'tape.bin'
+            path.write_bytes(b'\xff' * 32)
+            with open_tape(path, 16) as tape:
+                dp, data, step = interpreter('>+', io.StringIO(), io.StringIO(), tape=tape)
+                tape.flush()
+            self.assertEqual((1, [0, 1], 2), (dp, data, step))
+            self.assertEqual(bytes([0, 1] + [0] * 14), path.read_bytes())
+
+    def test_mmap_tape_out_of_range(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open_tape(Path(tmpdir) / 'tape.bin', 2) as tape:
+                with self.assertRaises(IndexError):
+                    interpreter('>>', io.StringIO(), io.StringIO(), tape=tape)
+
+    def test_load_program(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'prog.bf'
+            path.write_text('+' * 65 + '\n.\n', encoding='ascii')
+            ost = io.StringIO()
+            interpreter(load_program(path), io.StringIO(), ost)
+            self.assertEqual('A', ost.getvalue())
+            empty = Path(tmpdir) / 'empty.bf'
+            empty.write_text('', encoding='ascii')
+            self.assertEqual((0, [0], 0), interpreter(load_program(empty), io.StringIO(), io.StringIO()))
+
+    def test_mapped_program_runs_in_place(self):
+        code = '++++++++[\n>++++++++<-\n]>+.[-]\n'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'prog.bf'
+            path.write_text(code, encoding='ascii')
+            prog = load_program(path)
+            ost = io.StringIO()
+            self.assertEqual(interpreter(code, io.StringIO(), io.StringIO()), interpreter(prog, io.StringIO(), ost))
+            self.assertEqual('A', ost.getvalue())
+            self.assertEqual(fold(code).ops, fold(prog).ops)
+
+    def test_end_of_input(self):
+        with self.assertRaises(EOFError):
+            interpreter(',,', io.StringIO('a'), io.StringIO())
+
+    def test_main_runs_bfz(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'prog.bfz'
+            path.write_bytes(bfz.dumps('+' * 65 + '.'))
+            stdout = io.StringIO()
+            with mock.patch.object(sys, 'argv', ['interpreter', str(path)]), redirect_stdout(stdout):
+                with mock.patch('bfcc.bfz.unpack', side_effect=AssertionError('parsed as text')), warnings.catch_warnings():
+                    # runpy warns that bfcc.interpreter is already imported.
+                    warnings.simplefilter('ignore', RuntimeWarning)
+                    runpy.run_module('bfcc.interpreter', run_name='__main__')
+            self.assertTrue(stdout.getvalue().endswith('(0, [65], 66)\n'))
@@ -0,0 +1,184 @@
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from test import ROOT
+
+from bfcc.cli import main
+from bfcc.compiler import compile_source
+from bfcc.engine import execute, fold
+from bfcc.ir import METHODS, Op, PassManager, Recorder, dump, lower, lowered
+from bfcc.lexer import Lexer
+from bfcc.parser import Parser
+from bfcc.stack_machine import CONSTANTS, StackMachine
+
+
+def parse(text):
+    return Parser(Lexer(text)).parse_program()
+
+
+def names(text, optimize=1):
+    return [[str(op) for op in ops] for _, ops in parse(text).operations(optimize)]
+
+
+def run(code, input_string=''):
+    ost = io.StringIO()
+    dp, _, step = execute(fold(code), io.StringIO(input_string), ost)
+    return ost.getvalue(), dp, step
+
+
+def broken_invariants(text, input_string, optimize):
+    '''Run text op by op and return the ops after which dp is wrong or a cell at or above dp is not 0.'''
+    ops = [op for _, ops in parse(text).operations(optimize) for op in ops]
+    code = ''
+    expected = {}
+    for op, following, chunk in zip(ops, ops[1:], lowered(ops)):
+        code += ''.join(ch for ch in chunk if ch in '+-<>.,[]')
+        expected[len(code)] = (op, following.dp)
+        code += '#'
+    jumps = {}
+    stack = []
+    for ip, ch in enumerate(code):
+        if ch == '[':
+            stack.append(ip)
+        elif ch == ']':
+            jumps[ip] = stack.pop()
+            jumps[jumps[ip]] = ip
+    data = [0] * 1024
+    ist = io.StringIO(input_string)
+    dp = ip = 0
+    broken = set()
+    while ip < len(code):
+        ch = code[ip]
+        if ch == '+':
+            data[dp] = (data[dp] + 1) & 0xFF
+        elif ch == '-':
+            data[dp] = (data[dp] - 1) & 0xFF
+        elif ch == '>':
+            dp += 1
+        elif ch == '<':
+            dp -= 1
+        elif ch == ',':
+            data[dp] = ord(ist.read(1) or '\0')
+        elif (ch == '[' and not data[dp]) or (ch == ']' and data[dp]):
+            ip = jumps[ip]
+        elif ch == '#':
+            op, want = expected[ip]
+            if dp != want or any(data[dp:]):
+                broken.add(str(op))
+        ip += 1
+    return broken
+
+
+class TestIR(unittest.TestCase):
+    def test_lowering_matches_codegen(self):
+        for name in ['for', 'gcd', 'sudoku', 'life']:
+            with self.subTest(name=name):
+                text = (ROOT / 'data' / f'{name}.txt').read_text(encoding='utf-8')
+                ops = [op for _, statement in parse(text).operations() for op in statement]
+                self.assertEqual(compile_source(text).replace('\n', ''), lower(ops))
+
+    def test_recorder_tracks_dp(self):
+        sm = Recorder()
+        ops = [sm.load_constant(3, False), sm.load_constant(4, False), sm.add(False)]
+        self.assertEqual(1, sm.dp)
+        self.assertEqual([0, 1, 2], [op.dp for op in ops])
+        self.assertEqual(['lc 3', 'lc 4', 'add'], [str(op) for op in ops])
+        with self.assertRaises(AttributeError):
+            sm.no_such_op
+
+    def test_recorder_matches_stack_machine(self):
+        args = {
+            'lc': (5,), 'lv': (1,), 'sv': (1,), 'la': (1,), 'sa': (1,), 'pop': (2,), 'initarr': (3,),
+            'clean': (1, 3), 'puta': (1,), 'mdarr': ([2, 3],), 'mdl': (1, [2, 3]), 'mds': (1, [2, 3]),
+            'mdp': (1, [2, 3]), 'loadhex': (2, 5), 'addhex': (2,), 'invhex': (2,), 'subhex': (2,),
+            'incv': (1, 3), 'setv': (1, 3), 'cpv': (1, 2),
+        }
+        openers = {
+            'endwhile': [('begin_while', ()), ('load_constant', (1,))],
+            'beginelse': [('begin_if', ())],
+            'endif': [('begin_if', ()), ('begin_else', ())],
+        }
+        for name, method in METHODS.items():
+            with self.subTest(name=name):
+                sm = StackMachine()
+                recorder = Recorder()
+                sm.dp = recorder.dp = 20
+                for machine in (sm, recorder):
+                    for setup, setup_args in openers.get(name, []):
+                        getattr(machine, setup)(*setup_args, False)
+                getattr(sm, method)(*args.get(name, ()), False)
+                op = getattr(recorder, method)(*args.get(name, ()), False)
+                self.assertIsInstance(op, Op)
+                self.assertEqual((sm.dp, sm.controlstack), (recorder.dp, recorder.controlstack))
+
+    def test_in_place_arithmetic(self):
+        self.assertEqual(
+            [['lc 0'], ['incv 0 2'], ['incv 0 -3'], ['lc 0', 'lv 0', 'lc 1', 'add', 'sv 1']],
+            names('var x; x += 2; x = x - 3; var y = x + 1;'),
+        )
+
+    def test_constant_store_and_copy(self):
+        self.assertEqual(
+            [['lc 7'], ['lc 0'], ['setv 1 9'], ['cpv 0 1'], ['lv 1', 'sv 1']],
+            names('var x = 7; var y; y = 9; y = x; y = y;'),
+        )
+        self.assertEqual(['lc 0', 'lc 7', 'sv 0'], names('var x = 7;', 0)[0])
+
+    def test_optimized_programs(self):
+        for name, input_string in [('for', ''), ('gcd', '12 18\n'), ('localvariable', '')]:
+            with self.subTest(name=name):
+                text = (ROOT / 'data' / f'{name}.txt').read_text(encoding='utf-8')
+                expected = run(compile_source(text), input_string)
+                actual = run(compile_source(text, optimize=1), input_string)
+                self.assertEqual(expected[:2], actual[:2])
+                self.assertLess(actual[2], expected[2])
+
+    def test_stack_invariants(self):
+        for name, input_string in [('for', ''), ('gcd', '12 18\n'), ('localvariable', '')]:
+            text = (ROOT / 'data' / f'{name}.txt').read_text(encoding='utf-8')
+            for optimize in [0, 1]:
+                with self.subTest(name=name, optimize=optimize):
+                    self.assertEqual(set(), broken_invariants(text, input_string, optimize))
+
+    def test_constants_in_loops(self):
+        # A constant inside a while loop takes the fewest steps.
+        codes = []
+        for _, ops in parse('var x;\nwhile (x) { putchar(122); }\nputchar(122);\n').operations(0):
+            codes.append(lower(ops))
+        self.assertIn('+' * 122, codes[1])
+        self.assertEqual(CONSTANTS[122] + '<.[-]', codes[2])
+
+    def test_pass_manager(self):
+        calls = []
+
+        def drop_pops(ops):
+            calls.append(len(ops))
+            out = [op for op in ops if op.name != 'pop']
+            return out if len(out) != len(ops) else ops
+
+        ops = [Op('lc', (1,), 0), Op('pop', (1,), 1), Op('lc', (2,), 0), Op('pop', (1,), 1)]
+        self.assertEqual(['lc', 'lc'], [op.name for op in PassManager([drop_pops]).run(ops)])
+        self.assertEqual([4, 2], calls)
+        self.assertIs(ops, PassManager().run(ops))
+        self.assertEqual('+>++>', lower([Op('lc', (1,), 0), Op('lc', (2,), 1)]))
+
+    def test_dump(self):
+        stream = io.StringIO()
+        dump(parse('var i = 0;\nwhile (i < 2) { i += 1; }\n'), stream, 1)
+        self.assertEqual(
+            '// var i = 0;\nlc 0\n// while ((i < 2)) {\nlv 0\nlc 2\nlt\nbeginwhile\n    incv 0 1\n'
+            '    lv 0\n    lc 2\n    lt\nendwhile\npop 0\n',
+            stream.getvalue(),
+        )
+
+    def test_cli_dump_ir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / 'input.txt'
+            output_path = Path(tmpdir) / 'out.ir'
+            input_path.write_text('var x = 1; x += 1; putchar(x);', encoding='utf-8')
+            self.assertEqual(0, main([str(input_path), '--dump-ir', '-o', str(output_path)]))
+            self.assertIn('lv 0\nlc 1\nadd\nsv 0\n', output_path.read_text(encoding='utf-8'))
+            self.assertEqual(0, main([str(input_path), '--dump-ir', '-O1', '-o', str(output_path)]))
+            self.assertIn('incv 0 1\n', output_path.read_text(encoding='utf-8'))
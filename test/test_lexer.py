@@ -0,0 +1,61 @@
+import unittest
+
+from bfcc.lexer import Lexer, Token, tokenize
+
+
+def kinds(text):
+    return [token.type for token in tokenize(text)]
+
+
+class TestLexer(unittest.TestCase):
+    def test_tokens(self):
+        self.assertEqual(
+            [Token.KW_VAR, Token.ID, Token.ASSIGN, Token.INT, Token.SEMICOLON, Token.ID, Token.LE, Token.ID, Token.EOF],
+            kinds('var x = 12; x<=y'),
+        )
+        self.assertEqual([Token.ID, Token.ADDASSIGN, Token.NOT, Token.NEQ, Token.EOF], kinds('x += ! !='))
+
+    def test_characters(self):
+        tokens = list(tokenize(r"'a' '\n' '\x41' '\0' '\'' '\\' '\?'"))
+        self.assertEqual([97, 10, 65, 0, 39, 92, 63], [token.val for token in tokens[:-1]])
+
+    def test_line_numbers_after_comments(self):
+        tokens = list(tokenize('a // one\nb /* two\nthree\n */ c\n/**/d'))
+        self.assertEqual([('a', 0), ('b', 1), ('c', 3), ('d', 4)], [(t.token, t.line) for t in tokens[:-1]])
+
+    def test_comment_separates_tokens(self):
+        self.assertEqual([Token.ID, Token.ID, Token.EOF], kinds('a/**/b'))
+
+    def test_errors(self):
+        with self.assertRaises(SyntaxError):
+            list(tokenize('a /* b'))
+        with self.assertRaises(RuntimeError):
+            list(tokenize('12ab'))
+        with self.assertRaises(RuntimeError):
+            list(tokenize('a $ b'))
+
+    def test_large_source(self):
+        tokens = list(tokenize('x += 1; // comment\n' * 50000))
+        self.assertEqual(200001, len(tokens))
+        self.assertEqual(49999, tokens[-2].line)
+
+    def test_lookahead(self):
+        lex = Lexer('a b c')
+        self.assertEqual('a', lex.peek().token)
+        lex.seek()
+        lex.seek()
+        lex.unseek()
+        self.assertEqual('b', lex.peek().token)
+        lex.seek()
+        lex.seek()
+        self.assertEqual(Token.EOF, lex.peek().type)
+        lex.seek()
+        self.assertIsNone(lex.peek())
+
+    def test_lazy(self):
+        lex = Lexer('a b $')
+        self.assertEqual('a', lex.peek().token)
+        with self.assertRaises(RuntimeError):
+            for _ in range(3):
+                lex.seek()
+                lex.peek()
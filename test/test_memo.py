@@ -0,0 +1,29 @@
+import tempfile
+import unittest
+
+from bfcc.cache import CompilationCache
+from bfcc.engine import fold
+from bfcc.memo import ResultCache, run
+
+ECHO = ',[.,]'
+
+
+class TestMemo(unittest.TestCase):
+    def test_memory_tier(self):
+        prog = fold(ECHO)
+        cache = ResultCache(capacity=1)
+        first = run(prog, 'ab\0', cache)
+        second = run(prog, 'ab\0', cache)
+        self.assertFalse(first.hit)
+        self.assertTrue(second.hit)
+        self.assertEqual(('ab', first.dp, first.step), (second.output, second.dp, second.step))
+        self.assertFalse(run(prog, 'cd\0', cache).hit)
+        self.assertFalse(run(prog, 'ab\0', cache).hit)
+
+    def test_disk_tier(self):
+        prog = fold(ECHO)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            run(prog, 'xyz\0', ResultCache(store=CompilationCache(tmpdir)))
+            result = run(prog, 'xyz\0', ResultCache(store=CompilationCache(tmpdir)))
+        self.assertTrue(result.hit)
+        self.assertEqual('xyz', result.output)
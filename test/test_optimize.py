@@ -0,0 +1,110 @@
+import io
+import unittest
+
+from test import ROOT
+
+from bfcc.compiler import compile_source
+from bfcc.conformance import random_cases, snippets
+from bfcc.engine import execute, fold
+from bfcc.lexer import Lexer
+from bfcc.optimize import Peephole, optimize, optimized, peephole
+from bfcc.parser import Parser
+from bfcc.randprog import generate, generate_input
+
+
+def run(code, input_string=''):
+    '''Return (output, dp, tape without trailing zeros, steps).'''
+    ost = io.StringIO()
+    dp, data, step = execute(fold(code), io.StringIO(input_string), ost)
+    while data and not data[-1]:
+        data.pop()
+    return ost.getvalue(), dp, data, step
+
+
+class TestPeephole(unittest.TestCase):
+    def test_cancellation(self):
+        self.assertEqual('', peephole('+-><-+<>'))
+        self.assertEqual('.', peephole('>+-<.'))
+        self.assertEqual('>>', peephole('>><>'))
+        self.assertEqual('-', peephole('+' * 255))
+        self.assertEqual('+' * 128, peephole('-' * 128))
+        self.assertEqual(',', peephole('+++\n---,'))
+
+    def test_dead_loops(self):
+        self.assertEqual(',[-]', peephole(',[-][-]'))
+        self.assertEqual('>[+.]<.', peephole('[-]>[+.]<.'))
+        self.assertEqual(',[>]', peephole(',[>]+-[.][,]'))
+        self.assertEqual(',[>],[.]', peephole(',[>],[.]'))
+        self.assertEqual('', peephole('[[-]>]'))
+        self.assertEqual(',[-]>[-]', peephole(',[-]><>[-]'))
+
+    def test_seams(self):
+        for name in ['for', 'gcd']:
+            with self.subTest(name=name):
+                text = (ROOT / 'data' / f'{name}.txt').read_text(encoding='utf-8')
+                code = compile_source(text).replace('\n', '')
+                optimized = peephole(code)
+                self.assertLess(len(optimized), len(code))
+                for seam in ['><', '<>', '+-', '-+', '][-]']:
+                    self.assertNotIn(seam, optimized)
+
+    def test_fixed_point(self):
+        for _, code, _ in random_cases(30, seed=3):
+            self.assertEqual(peephole(code), peephole(peephole(code)))
+
+    def test_chunks(self):
+        # Any split of the code gives the output of the joined code.
+        for _, code, _ in random_cases(30, seed=5):
+            for size in [1, 2, 7]:
+                chunks = [code[i : i + size] for i in range(0, len(code), size)]
+                self.assertEqual(peephole(code), ''.join(optimized(chunks)))
+        self.assertEqual(['', '', '', '-'], list(optimized(['+-', '[-', ']-'])))
+        self.assertEqual(',[', Peephole().feed(',[+-'))
+
+    def test_streamed_program(self):
+        text = (ROOT / 'data' / 'gcd.txt').read_text(encoding='utf-8')
+        chunks = list(Parser(Lexer(text)).parse_program().generate(False))
+        pass_ = Peephole()
+        written = [pass_.feed(chunk) for chunk in chunks]
+        tail = pass_.close()
+        self.assertEqual(peephole(''.join(chunks)), ''.join(written) + tail)
+        # Only the last runs are held back.
+        self.assertLess(len(tail), 20)
+
+    def test_unmatched(self):
+        with self.assertRaises(SyntaxError):
+            peephole('[-')
+        with self.assertRaises(SyntaxError):
+            peephole('-]')
+
+
+class TestEquivalence(unittest.TestCase):
+    def assertEquivalent(self, code, input_string='', optimized=None):
+        expected = run(code, input_string)
+        actual = run(optimize(code, 1) if optimized is None else optimized, input_string)
+        self.assertEqual(expected[:3], actual[:3])
+        self.assertLessEqual(actual[3], expected[3])
+
+    def test_snippets(self):
+        for name, code, input_string in snippets():
+            with self.subTest(name=name):
+                self.assertEquivalent(code, input_string)
+
+    def test_random_brainfuck(self):
+        for name, code, input_string in random_cases(100, seed=11):
+            with self.subTest(name=name):
+                self.assertEquivalent(code, input_string)
+
+    def test_random_programs(self):
+        for seed in range(12):
+            with self.subTest(seed=seed):
+                source = generate(seed, statements=20)
+                self.assertEquivalent(compile_source(source), generate_input(seed))
+                self.assertEquivalent(compile_source(source), generate_input(seed), compile_source(source, optimize=1))
+
+    def test_data_programs(self):
+        for name, input_string in [('for', ''), ('gcd', '12 18\n'), ('localvariable', '')]:
+            with self.subTest(name=name):
+                text = (ROOT / 'data' / f'{name}.txt').read_text(encoding='utf-8')
+                self.assertEquivalent(compile_source(text), input_string)
+                self.assertEquivalent(compile_source(text), input_string, compile_source(text, optimize=1))
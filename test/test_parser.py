@@ -0,0 +1,87 @@
+import io
+import sys
+import unittest
+
+from bfcc.compiler import compile_source
+from bfcc.interpreter import interpreter
+from bfcc.lexer import Lexer
+from bfcc.bench import synthesize
+from bfcc.parser import ExpVariable, Parser, Scope, StInitVariable, Symbol, indent
+from bfcc.vm import run_source
+
+
+def parse(text):
+    return Parser(Lexer(text)).parse_program()
+
+
+def run(text):
+    ost = io.StringIO()
+    interpreter(compile_source(text), io.StringIO(), ost, False)
+    return ost.getvalue()
+
+
+class TestScope(unittest.TestCase):
+    def test_chain(self):
+        outer = Scope()
+        x = outer.declare(Symbol('x', 'variable'))
+        inner = Scope(outer)
+        self.assertIs(x, inner.lookup('x'))
+        y = inner.declare(Symbol('x', 'variable'))
+        self.assertIs(y, inner.lookup('x'))
+        self.assertIs(x, outer.lookup('x'))
+        self.assertIsNone(inner.lookup('z'))
+
+
+class TestParser(unittest.TestCase):
+    def test_resolved(self):
+        prog = parse('var x = 1; x += x;')
+        init, assign = prog.statements
+        self.assertIsInstance(init, StInitVariable)
+        self.assertIs(init.symbol, assign.lhs.symbol)
+        self.assertIs(init.symbol, assign.rhs.symbol)
+        prog.codegen(False)
+        self.assertEqual(0, init.symbol.pos)
+
+    def test_shadowing(self):
+        # A name refers to the declaration visible where it is written.
+        text = 'var x = 3;\nif (x == 3) { putint(x); var x = 7; putint(x); }\n'
+        prog = parse(text)
+        self.assertIsInstance(prog.statements[1].cond.left, ExpVariable)
+        self.assertIs(prog.statements[0].symbol, prog.statements[1].cond.left.symbol)
+        self.assertEqual('37', run(text))
+        self.assertEqual('37', run_source(text))
+
+    def test_compact_nodes(self):
+        prog = parse('var x = 1; if (x) { x += 1; }')
+        for node in [prog, prog.statements[0], prog.statements[1], prog.statements[1].cond]:
+            self.assertFalse(hasattr(node, '__dict__'))
+        self.assertIsNot(parse('if (1) { }').statements[0].body_else, parse('if (1) { }').statements[0].body_else)
+
+    def test_precedence(self):
+        prog = parse('var a; var b; var c; a = a | b & c == a < b + c * -a; b = a - b - c / a % b; c = !-+a;')
+        self.assertEqual('(a | (b & (c == (a < (b + (c * -a))))))', str(prog.statements[3].rhs))
+        self.assertEqual('((a - b) - ((c / a) % b))', str(prog.statements[4].rhs))
+        self.assertEqual('!-+a', str(prog.statements[5].rhs))
+
+    def test_deep_nesting(self):
+        depth = sys.getrecursionlimit() * 10
+        for shape in ['expression', 'blocks', 'else-chain']:
+            prog = parse(synthesize(shape, depth))
+            self.assertEqual(2, len(prog.statements))
+        for shape in ['blocks', 'else-chain']:
+            self.assertTrue(compile_source(synthesize(shape, sys.getrecursionlimit() + 500)))
+        # The --debug header prints the tree without recursion too.
+        depth = sys.getrecursionlimit() + 500
+        self.assertIn('(x + ' * depth + '1' + ')' * depth, parse(synthesize('expression', depth)).string())
+        for shape in ['blocks', 'else-chain']:
+            self.assertIn(indent(depth) + 'x += 1;', parse(synthesize(shape, depth)).string())
+
+    def test_errors(self):
+        with self.assertRaises(SyntaxError):
+            parse('x = 1;')
+        with self.assertRaises(SyntaxError):
+            parse('arr a[2]; a = 1;')
+        with self.assertRaises(SyntaxError):
+            parse('var x; x[0] = 1;')
+        with self.assertRaises(SyntaxError):
+            parse('var x = 1; if (x) { var y; } else { var y; }')
@@ -0,0 +1,33 @@
+import io
+import unittest
+
+from bfcc.compiler import compile_source
+from bfcc.conformance import check_sources
+from bfcc.engine import ENGINES
+from bfcc.randprog import generate, generate_input
+from bfcc.vm import run_source
+
+
+class TestRandprog(unittest.TestCase):
+    def test_deterministic(self):
+        self.assertEqual(generate(5), generate(5))
+        self.assertNotEqual(generate(5), generate(6))
+
+    def test_valid(self):
+        for seed in range(10):
+            source = generate(seed, statements=25, depth=4)
+            compile_source(source)
+            run_source(source, generate_input(seed))
+
+    def test_vm_matches_compiled(self):
+        engines = {'folded': ENGINES['folded']}
+        self.assertEqual([], check_sources(8, seed=100, statements=12, engines=engines, log=io.StringIO()))
+
+    def test_vm_semantics(self):
+        source = 'var x = 250; x += 10; putint(x); putchar(32); putint(-1 / 2); putint(getint() + 1);\n'
+        self.assertEqual('4 12743', run_source(source, '42\n'))
+
+    def test_empty_block_at_bottom_of_stack(self):
+        source = "if (1) { putchar('y'); }\n"
+        self.assertEqual('y', run_source(source))
+        compile_source(source)
@@ -0,0 +1,153 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from bfcc.server import Server, start
+
+DATA = Path(__file__).resolve().parents[1] / 'data'
+
+
+async def session(path, requests):
+    reader, writer = await asyncio.open_unix_connection(path)
+    messages = []
+    for request in requests:
+        writer.write(json.dumps(request).encode() + b'\n')
+        await writer.drain()
+        while True:
+            message = json.loads(await reader.readline())
+            messages.append(message)
+            if 'program' in message or 'done' in message or 'error' in message or 'input' in message:
+                break
+    writer.close()
+    return messages
+
+
+class TestServer(unittest.TestCase):
+    def run_server(self, client, **options):
+        async def main():
+            with tempfile.TemporaryDirectory() as tmpdir:
+                path = os.path.join(tmpdir, 'bfcc.sock')
+                listener = await start(Server(**options), unix=path)
+                async with listener:
+                    return await client(path)
+
+        return asyncio.run(main())
+
+    def test_interactive_run(self):
+        async def client(path):
+            load = await session(path, [{'op': 'load', 'code': ',[.,]'}])
+            digest = load[0]['program']
+            return await session(
+                path,
+                [
+                    {'op': 'run', 'program': digest, 'input': 'hi'},
+                    {'op': 'input', 'data': '!'},
+                    {'op': 'input', 'data': '\0'},
+                ],
+            )
+
+        messages = self.run_server(client)
+        self.assertEqual('hi!', ''.join(m.get('output', '') for m in messages))
+        self.assertTrue(messages[-1]['done'])
+
+    def test_compile_and_concurrent_sessions(self):
+        async def client(path):
+            load = await session(path, [{'op': 'load', 'source': "putchar('A');"}])
+            run = {'op': 'run', 'program': load[0]['program']}
+            return await asyncio.gather(*(session(path, [run]) for _ in range(8)))
+
+        for messages in self.run_server(client, max_sessions=2):
+            self.assertEqual('A', ''.join(m.get('output', '') for m in messages))
+            self.assertTrue(messages[-1]['done'])
+
+    def test_errors(self):
+        async def client(path):
+            load = await session(path, [{'op': 'load', 'code': '+[]'}])
+            return await session(
+                path,
+                [
+                    {'op': 'run', 'program': 'missing'},
+                    {'op': 'run', 'program': load[0]['program'], 'max_steps': 100000},
+                ],
+            )
+
+        messages = self.run_server(client, max_steps=1000)
+        self.assertIn('Unknown program', messages[0]['error'])
+        self.assertIn('step limit', messages[1]['error'])
+
+    def test_malformed_requests(self):
+        async def client(path):
+            load = await session(path, [{'op': 'load', 'code': ',.'}])
+            digest = load[0]['program']
+            return await session(
+                path,
+                [
+                    [1, 2],
+                    {'op': 'load', 'code': 5},
+                    {'op': 'run', 'program': digest, 'input': 5},
+                    {'op': 'run', 'program': digest, 'max_steps': '10'},
+                    {'op': 'run', 'program': digest, 'max_steps': True},
+                    {'op': 'run', 'program': digest},
+                    {'op': 'input', 'data': 7},
+                    {'op': 'run', 'program': digest, 'input': 'A', 'max_steps': 10},
+                ],
+            )
+
+        messages = self.run_server(client)
+        self.assertIn('JSON object', messages[0]['error'])
+        self.assertIn('must be strings', messages[1]['error'])
+        self.assertIn('input must be a string', messages[2]['error'])
+        self.assertIn('max_steps must be an integer', messages[3]['error'])
+        self.assertIn('max_steps must be an integer', messages[4]['error'])
+        self.assertEqual([{'input': True}, {'error': 'data must be a string.'}], messages[5:7])
+        # The connection is still served after every error.
+        self.assertEqual({'done': True, 'dp': 0, 'step': 2}, messages[-1])
+
+    def test_long_lines(self):
+        async def client(path):
+            code = (DATA / 'life.bf').read_text()
+            load = await session(path, [{'op': 'load', 'code': code}])
+            with mock.patch('bfcc.server.LIMIT', 1 << 10):
+                small = await start(Server(), unix=path + '.small')
+            async with small:
+                return load + await session(path + '.small', [{'op': 'load', 'code': code}, {'op': 'load'}])
+
+        messages = self.run_server(client)
+        self.assertIn('program', messages[0])
+        self.assertIn('error', messages[1])
+        self.assertIn('code or source', messages[2]['error'])
+
+    def test_waiting_session_frees_its_slot(self):
+        async def client(path):
+            load = await session(path, [{'op': 'load', 'code': ',.'}])
+            reader, writer = await asyncio.open_unix_connection(path)
+            writer.write(json.dumps({'op': 'run', 'program': load[0]['program']}).encode() + b'\n')
+            await writer.drain()
+            self.assertEqual({'input': True}, json.loads(await reader.readline()))
+            # The only slot is free while the first run waits for input.
+            load = await session(path, [{'op': 'load', 'source': "putchar('A');"}])
+            other = await asyncio.wait_for(session(path, [{'op': 'run', 'program': load[0]['program']}]), 10)
+            writer.write(json.dumps({'op': 'input', 'data': 'B'}).encode() + b'\n')
+            await writer.drain()
+            first = [json.loads(await reader.readline()) for _ in range(2)]
+            writer.close()
+            return other, first
+
+        other, first = self.run_server(client, max_sessions=1)
+        self.assertEqual('A', ''.join(m.get('output', '') for m in other))
+        self.assertEqual([{'output': 'B'}, {'done': True, 'dp': 0, 'step': 2}], first)
+
+    def test_sources_are_bounded(self):
+        async def load(server):
+            digests = [await server.load(source=f'putchar({value});') for value in range(4)]
+            self.assertEqual(digests[3], await server.load(source='putchar(3);'))
+            return digests
+
+        server = Server(max_programs=2)
+        digests = asyncio.run(load(server))
+        self.assertEqual(['putchar(2);', 'putchar(3);'], list(server.sources))
+        self.assertEqual(digests[2:], list(server.programs))
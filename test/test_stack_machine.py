@@ -1175,5 +1175,26 @@ class TestStackMachine(unittest.TestCase):
             data[0:length]
         )
 
+    def test_055_sm_constant_table(self):
+        for value in range(256):
+            for looping in [False, True]:
+                sm = StackMachine()
+                if looping:
+                    sm.controlstack += [('while', 0)]
+                code = sm.load_constant(value)
+                dp, data, step = interpreter(code, io.StringIO(), io.StringIO())
+                self.assertEqual([value, 0], data)
+                self.assertEqual(1, dp)
+                self.assertLessEqual(len(code), len(short_inc(value)) + 1)
+                if looping:
+                    self.assertEqual(min(value, 256 - value) + 1, step)
+                else:
+                    plain = len(short_inc(value)) + 1
+                    self.assertLessEqual(len(code) + step, plain * 2)
+        self.assertEqual('-->', StackMachine().load_constant(254))
+        self.assertLess(len(CONSTANTS[ord('z')]), 40)
+        self.assertLess(len(CONSTANTS[200]), 32)
+
+
 if __name__ == '__main__':
     unittest.main()
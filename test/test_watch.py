@@ -0,0 +1,71 @@
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+
+from test import ROOT
+
+from bfcc import bfz
+from bfcc.cli import main
+from bfcc.compiler import compile_folded, compile_source
+from bfcc.watch import PollWatcher, Session, watcher
+
+
+class TestWatch(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.tmp = Path(self.tmpdir.name)
+        self.source = self.tmp / 'gcd.txt'
+        self.text = (ROOT / 'data' / 'gcd.txt').read_text(encoding='utf-8')
+        self.source.write_text(self.text, encoding='utf-8')
+
+    def test_rebuild(self):
+        output = self.tmp / 'gcd.bf'
+        log = io.StringIO()
+        session = Session(str(self.source), str(output), log=log)
+        self.assertEqual(compile_source(self.text), session.build())
+        self.assertIsNone(session.build())
+        edited = self.text.replace("putchar('G');", "putchar('g');")
+        self.source.write_text(edited, encoding='utf-8')
+        self.assertEqual(compile_source(edited), session.build())
+        self.assertEqual(compile_source(edited), output.read_text(encoding='utf-8'))
+        self.assertIn('1 generated', log.getvalue().splitlines()[-1])
+
+    def test_error_keeps_output(self):
+        output = self.tmp / 'gcd.bfz'
+        log = io.StringIO()
+        session = Session(str(self.source), str(output), log=log)
+        session.build()
+        self.source.write_text(self.text + 'var = ;', encoding='utf-8')
+        self.assertIsNone(session.build())
+        self.assertIn('bfcc: error:', log.getvalue())
+        self.assertEqual(bfz.dumps(compile_folded(self.text)), output.read_bytes())
+
+    def test_run_deltas(self):
+        run_input = self.tmp / 'input.txt'
+        run_input.write_text('12 18\n', encoding='utf-8')
+        log, ost = io.StringIO(), io.StringIO()
+        session = Session(str(self.source), str(self.tmp / 'gcd.bf'), run_input=str(run_input), log=log, ost=ost)
+        session.build()
+        self.source.write_text(self.text + "putchar('!');\n", encoding='utf-8')
+        session.build()
+        self.assertEqual('GCD(12, 18) = 6\n' * 2 + '!', ost.getvalue())
+        self.assertRegex(log.getvalue().splitlines()[-1], r'steps \(\+\d+\.\d+ s|steps \(-\d+\.\d+ s')
+        self.assertRegex(log.getvalue().splitlines()[-1], r', \+\d+ steps\)$')
+
+    def test_watchers(self):
+        for count, make in enumerate([lambda: PollWatcher(str(self.source), 0.01), lambda: watcher(str(self.source))]):
+            files = make()
+            with self.subTest(watcher=type(files).__name__):
+                self.assertFalse(files.wait(0.05))
+                self.source.write_text(self.text + '\n' * (count + 1), encoding='utf-8')
+                self.assertTrue(files.wait(5))
+                files.close()
+
+    def test_cli_needs_files(self):
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(['--watch', str(self.source)])
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main([str(self.source), '--run-input', str(self.source)])